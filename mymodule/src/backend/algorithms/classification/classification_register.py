@@ -3,8 +3,9 @@
 """
 
 import logging
-from .lda_classification import lda, LDA_ID
-from .pca_classification import pca, PCA_ID
+from .lda_classification import lda, lda_from_statistics, LDA_ID
+from .pca_classification import pca, pca_from_statistics, PCA_ID
+from .randomized_pca_classification import randomized_pca, RANDOMIZED_PCA_ID
 
 class ClassificationRegister(object):
     """
@@ -15,7 +16,19 @@ class ClassificationRegister(object):
     # holding all registered algorithms
     ALGORITHM_DIC = dict({
         LDA_ID: lda,
-        PCA_ID: pca
+        PCA_ID: pca,
+        RANDOMIZED_PCA_ID: randomized_pca
+        })
+    # dictionary with the shape {Algorithm_id, Scalable algorithm}
+    # holding the versions of the algorithms used for big sets of values
+    SCALABLE_ALGORITHM_DIC = dict({
+        PCA_ID: randomized_pca
+        })
+    # dictionary with the shape {Algorithm_id, Statistics algorithm}
+    # holding the versions of the algorithms solved from CovarianceStatistics
+    STATISTICS_ALGORITHM_DIC = dict({
+        LDA_ID: lda_from_statistics,
+        PCA_ID: pca_from_statistics
         })
 
     @staticmethod
@@ -29,3 +42,17 @@ class ClassificationRegister(object):
             Returns the dictionary of available algorithms
         """
         return ClassificationRegister.ALGORITHM_DIC
+
+    @staticmethod
+    def get_scalable_algorithm_dict():
+        """
+            Returns the dictionary of available scalable algorithms
+        """
+        return ClassificationRegister.SCALABLE_ALGORITHM_DIC
+
+    @staticmethod
+    def get_statistics_algorithm_dict():
+        """
+            Returns the dictionary of available algorithms solved from statistics
+        """
+        return ClassificationRegister.STATISTICS_ALGORITHM_DIC
@@ -2,10 +2,14 @@
     LDA
 """
 
+from __future__ import division
+import numpy as np
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis as LDA
 from ...util.df_matrix_utils import DFMatrixUtils
 
 LDA_ID = "LDA"
+# Threshold of the singular values considered to compute the rank, as in LDA
+TOL = 1e-4
 
 def lda(values_df, classes):
     lda_ = LDA(n_components=2)
@@ -16,3 +20,41 @@ def lda(values_df, classes):
                                        index=values_df.columns,
                                        columns=['x', 'y'])
     return positions_df
+
+def lda_from_statistics(values_df, classes, statistics):
+    """LDA following the steps of the SVD solver of LinearDiscriminantAnalysis,
+       but solved from the within-class scatter matrix, derived from the class
+       means and the covariance statistics, instead of the SVD of the values.
+       The sign of the axes is arbitrary in both: here the largest coefficient
+       of every axis is positive
+       values_df: (pandas.DataFrame) product_id X dimensional_values
+       classes: (List<Object>) class of every value, in the same order
+       statistics: (CovarianceStatistics) statistics of values_df
+       Returns: (pandas.DataFrame) dimension X (x,y) positions of the axis
+    """
+    counts, means, within_scatter = statistics.get_class_statistics(values_df, classes)
+    n = statistics.get_number_of_values()
+    priors = counts / n
+    xbar = np.dot(priors, means)
+    std = np.sqrt(np.diag(within_scatter).clip(0) / n)
+    std[std == 0] = 1.
+    fac = 1. / (n - len(counts))
+    # Right singular vectors and singular values of the scaled centered values
+    eigenvalues, eigenvectors = np.linalg.eigh(fac * within_scatter / np.outer(std, std))
+    order = np.argsort(eigenvalues)[::-1]
+    singular_values = np.sqrt(eigenvalues[order].clip(0))
+    rank = np.sum(singular_values > TOL)
+    scalings = eigenvectors[:, order[:rank]] / std[:, np.newaxis] / singular_values[:rank]
+    class_mx = np.dot((np.sqrt(n * priors * fac) * (means - xbar).T).T, scalings)
+    _, singular_values, v = np.linalg.svd(class_mx, full_matrices=False)
+    rank = np.sum(singular_values > TOL * singular_values[0])
+    scalings = np.dot(scalings, v.T[:, :rank])[:, :2]
+    largest_scalings = scalings[np.argmax(np.abs(scalings), axis=0),
+                                np.arange(scalings.shape[1])]
+    scalings *= np.where(largest_scalings < 0, -1, 1)
+    ones_mx = DFMatrixUtils.get_diagonal_ones_matrix(values_df)
+    positions_matrix = np.dot(ones_mx - xbar, scalings)
+    positions_df = DFMatrixUtils.to_df(positions_matrix,
+                                       index=values_df.columns,
+                                       columns=['x', 'y'])
+    return positions_df
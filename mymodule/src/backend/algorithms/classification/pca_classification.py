@@ -2,6 +2,7 @@
     PCA
 """
 
+import numpy as np
 from sklearn.decomposition import PCA
 from ...util.df_matrix_utils import DFMatrixUtils
 
@@ -16,3 +17,25 @@ def pca(values_df):
                                        index=values_df.columns,
                                        columns=['x', 'y'])
     return positions_df
+
+def pca_from_statistics(values_df, statistics):
+    """PCA solved from the eigenvectors of the covariance matrix instead of
+       the SVD of the values. The sign of every component is the one of the
+       exact PCA: its largest projection of the values is positive
+       values_df: (pandas.DataFrame) product_id X dimensional_values
+       statistics: (CovarianceStatistics) statistics of values_df
+       Returns: (pandas.DataFrame) dimension X (x,y) positions of the axis
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(statistics.get_covariance())
+    components = eigenvectors[:, np.argsort(eigenvalues)[::-1][:2]]
+    mean = statistics.get_mean()
+    projections = np.dot(values_df.values, components) - np.dot(mean, components)
+    largest_projections = projections[np.argmax(np.abs(projections), axis=0),
+                                      np.arange(components.shape[1])]
+    components *= np.where(largest_projections < 0, -1, 1)
+    ones_mx = DFMatrixUtils.get_diagonal_ones_matrix(values_df)
+    positions_matrix = np.dot(ones_mx - mean, components)
+    positions_df = DFMatrixUtils.to_df(positions_matrix,
+                                       index=values_df.columns,
+                                       columns=['x', 'y'])
+    return positions_df
@@ -0,0 +1,24 @@
+"""
+    Randomized PCA
+"""
+
+from sklearn.decomposition import PCA
+from ...util.df_matrix_utils import DFMatrixUtils
+
+RANDOMIZED_PCA_ID = "Randomized PCA"
+
+def randomized_pca(values_df):
+    """PCA computing only the first two components through randomized SVD,
+       for big sets of values. The axis positions match those of the exact
+       PCA within numeric tolerance, including the sign of the components
+       values_df: (pandas.DataFrame) product_id X dimensional_values
+       Returns: (pandas.DataFrame) dimension X (x,y) positions of the axis
+    """
+    pca_ = PCA(n_components=2, svd_solver='randomized', random_state=0)
+    pca_.fit(values_df)
+    ones_mx = DFMatrixUtils.get_diagonal_ones_matrix(values_df)
+    positions_matrix = pca_.transform(ones_mx)
+    positions_df = DFMatrixUtils.to_df(positions_matrix,
+                                       index=values_df.columns,
+                                       columns=['x', 'y'])
+    return positions_df
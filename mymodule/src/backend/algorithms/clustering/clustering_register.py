@@ -5,6 +5,7 @@
 import logging
 from .dummy_clustering import dummy, DUMMY_ID
 from .kmeans_clustering import kmeans, KMEANS_ID
+from .mini_batch_kmeans_clustering import mini_batch_kmeans
 
 class ClusteringRegister(object):
     """
@@ -17,6 +18,13 @@ class ClusteringRegister(object):
         #DUMMY_ID: dummy,
         KMEANS_ID: kmeans
         })
+    # dictionary with the shape {Algorithm_id, Scalable algorithm}
+    # holding the versions of the algorithms used for big sets of values.
+    # They can start from the centroids of a previous clustering and return
+    # the labels together with the resulting centroids
+    SCALABLE_ALGORITHM_DIC = dict({
+        KMEANS_ID: mini_batch_kmeans
+        })
 
     @staticmethod
     def get_algorithm_dict():
@@ -24,3 +32,10 @@ class ClusteringRegister(object):
             Returns the dictionary of available algorithms
         """
         return ClusteringRegister.ALGORITHM_DIC
+
+    @staticmethod
+    def get_scalable_algorithm_dict():
+        """
+            Returns the dictionary of available scalable algorithms
+        """
+        return ClusteringRegister.SCALABLE_ALGORITHM_DIC
@@ -0,0 +1,57 @@
+"""
+    Mini-Batch K-Means Clustering algorithm
+"""
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+
+# Number of points of every mini-batch
+BATCH_SIZE = 1000
+
+def mini_batch_kmeans(values_df, n_clusters=5, init_centroids=None, batch_size=BATCH_SIZE):
+    """Scalable version of K-Means fitting the centroids on random
+       mini-batches of points instead of the whole matrix
+       values_df: (pandas.DataFrame) product_id X dimensional_values
+       [n_clusters=5] (int) number of clusters
+       [init_centroids=None]: (numpy.ndarray) n_clusters X dimensions centroids
+       of a previous clustering to start from, also with different number of
+       clusters (see adapt_centroids)
+       [batch_size=BATCH_SIZE]: (int) number of points of every mini-batch
+       Returns: (List<String>) list of category labels matching input values
+                (numpy.ndarray) n_clusters X dimensions centroids
+    """
+    m = values_df.values
+    if init_centroids is None:
+        km = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size)
+    else:
+        init_centroids = adapt_centroids(m, init_centroids, n_clusters)
+        km = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size,
+                             init=init_centroids, n_init=1)
+    km.fit(m)
+    return km.labels_, km.cluster_centers_
+
+def adapt_centroids(m, centroids, n_clusters):
+    """Adds or removes centroids until there are n_clusters of them.
+       Centroids are added at the points farthest from their closest centroid
+       of a random sample, and removed starting by those closest to another
+       centroid, so the rest of the clustering is kept
+       m: (numpy.ndarray) values X dimensions matrix
+       centroids: (numpy.ndarray) previous centroids
+       n_clusters: (int) number of centroids to return
+       Returns: (numpy.ndarray) n_clusters X dimensions centroids
+    """
+    centroids = np.array(centroids, dtype=float)
+    while len(centroids) > n_clusters:
+        distances = _get_squared_distances(centroids, centroids)
+        np.fill_diagonal(distances, np.inf)
+        centroids = np.delete(centroids, np.argmin(distances.min(axis=1)), axis=0)
+    if len(centroids) < n_clusters:
+        sample = m[np.random.choice(len(m), min(len(m), 10 * BATCH_SIZE), replace=False)]
+        while len(centroids) < n_clusters:
+            distances = _get_squared_distances(sample, centroids).min(axis=1)
+            centroids = np.vstack([centroids, sample[np.argmax(distances)]])
+    return centroids
+
+def _get_squared_distances(a, b):
+    """Returns: (numpy.ndarray) len(a) X len(b) squared euclidean distances"""
+    return np.square(a[:, np.newaxis, :] - b[np.newaxis, :, :]).sum(axis=2)
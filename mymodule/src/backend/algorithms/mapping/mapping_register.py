@@ -2,7 +2,8 @@
     Mapping Register
 """
 import logging
-from .star_coordinates_mapper import star_coordinates, STAR_COORDINATES_ID
+from .star_coordinates_mapper import star_coordinates, star_coordinates_delta,\
+                                     STAR_COORDINATES_ID
 from .dummy_coordinates_mapper import dummy_coordinates, DUMMY_COORDINATES_ID
 
 class MappingRegister(object):
@@ -16,6 +17,12 @@ class MappingRegister(object):
         STAR_COORDINATES_ID: star_coordinates
         #DUMMY_COORDINATES_ID: dummy_coordinates # For demonstration and testing purposes
         })
+    # dictionary with the shape {Algorithm_id, Incremental algorithm}
+    # holding the algorithms able to update a previous mapping when only
+    # some of the vectors have changed
+    INCREMENTAL_ALGORITHM_DIC = dict({
+        STAR_COORDINATES_ID: star_coordinates_delta
+        })
 
     @staticmethod
     def get_algorithm_dict():
@@ -23,3 +30,10 @@ class MappingRegister(object):
             Returns the dictionary of available algorithms
         """
         return MappingRegister.ALGORITHM_DIC
+
+    @staticmethod
+    def get_incremental_algorithm_dict():
+        """
+            Returns the dictionary of available incremental algorithms
+        """
+        return MappingRegister.INCREMENTAL_ALGORITHM_DIC
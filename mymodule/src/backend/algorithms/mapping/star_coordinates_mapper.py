@@ -2,6 +2,8 @@
     Star Coordinates
 """
 
+import pandas as pd
+
 STAR_COORDINATES_ID = "Star Coordinates"
 
 def star_coordinates(dimensional_values_df, axis_vectors_df, weights_df=None,
@@ -17,3 +19,17 @@ def star_coordinates(dimensional_values_df, axis_vectors_df, weights_df=None,
     mapped_points = dimensional_values_df.dot(axis_vectors_df)
     mapped_points.columns = ['x', 'y']
     return mapped_points
+
+def star_coordinates_delta(dimensional_values_df, delta_vectors_df, mapped_points_df):
+    """ Updates points previously mapped with star_coordinates after some
+        of the axis vectors changed. Each point moves by
+        value_i * (new_vector_i - old_vector_i) for every changed axis i
+        dimensional_values_df: (pandas.Dataframe) product_id X dimensional_values
+        delta_vectors_df: (pandas.Dataframe) changed vector_id X (x, y)
+            difference between the new and the old components
+        mapped_points_df: (pandas.Dataframe) product_id X (x, y) last mapping
+    """
+    changed_values_mx = dimensional_values_df[delta_vectors_df.index].values
+    delta_points_mx = changed_values_mx.dot(delta_vectors_df.values)
+    return pd.DataFrame(mapped_points_df.values + delta_points_mx,
+                        index=mapped_points_df.index, columns=['x', 'y'])
@@ -3,37 +3,23 @@
 """
 
 from __future__ import division
-from ...util.df_matrix_utils import DFMatrixUtils
+import numpy as np
+from ...util.normalization_utils import NormalizationUtils
 
 FEATURE_SCALING_ID = "Feature Scaling"
 
-def feature_scaling(df, df_level=False):
+def feature_scaling(df, df_level=False, statistics=None):
     """Feature scaling normalization
        df: (pandas.DataFrame) dataframe with the values to normalize
        [df_level=False]: (Boolean) Whether values maximum/minimum
        should be taken from dataframe or column level
+       [statistics=None]: (OnlineStatistics) column statistics gathered
+       while reading the values, used instead of reducing the DataFrame
     """
-    def _normalize_column(column, maximum=None, minimum=None):
-        def _normalize_value(x, maximum, minimum):
-            diff = maximum - minimum
-            if diff < 0:
-                return 0
-            elif diff == 0:
-                return 1
-            res = (x - minimum) / diff
-            return 1 if res > 1 else res
-
-        maximum = maximum if maximum else max(column)
-        minimum = minimum if minimum else min(column)
-        return [_normalize_value(x, maximum, minimum) for x in column]
-
-    maximum = None
-    minimum = None
-    if df_level:
-        maximum = DFMatrixUtils.get_max_value(df)
-        minimum = DFMatrixUtils.get_min_value(df)
-
-    df = df.apply(lambda column: _normalize_column(column,
-                                                   maximum=maximum,
-                                                   minimum=minimum), axis=0)
-    return df
+    matrix = NormalizationUtils.get_matrix(df)
+    maximum = NormalizationUtils.get_statistic(matrix, np.nanmax, df_level=df_level,
+                                               statistics=statistics, columns=df.columns)
+    minimum = NormalizationUtils.get_statistic(matrix, np.nanmin, df_level=df_level,
+                                               statistics=statistics, columns=df.columns)
+    matrix = NormalizationUtils.scale_by_range(matrix, minimum, maximum, minimum)
+    return NormalizationUtils.to_df(matrix, df)
@@ -0,0 +1,88 @@
+"""
+    Chunked File Reader
+"""
+
+from __future__ import division
+import logging
+import os
+import pandas as pd
+from .file_reader import FileReader
+from ..util.online_statistics import OnlineStatistics
+
+class ChunkedFileReader(object):
+    """Iterable reading a .csv file in chunks of rows, so big files can be
+       processed while they are read. Keeps track of the progress and
+       gathers the statistics of the numeric columns along the way
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Number of rows of every chunk
+    CHUNK_SIZE = 100000
+
+    def __init__(self, file_path, header=True, chunk_size=CHUNK_SIZE,
+                 delimiter=FileReader.DELIMITER, index_col=0, progress_callback=None):
+        """file_path: (String) full path to source file
+           [header=True]: (Boolean) True if the first line is the header
+           [chunk_size=CHUNK_SIZE]: (int) number of rows of every chunk
+           [delimiter=DELIMITER]: (String) delimiter of file
+           [index_col=0]: (int) index of column with the id / name of each product
+           [progress_callback=None]: (func) called after every chunk with the
+           reader, which provides the progress
+        """
+        if not FileReader.is_valid_file(file_path):
+            raise ValueError("'{}' was not a valid file\n{}".format(file_path, FileReader.USE))
+        self._file_path = file_path
+        self._header = header
+        self._chunk_size = chunk_size
+        self._delimiter = delimiter
+        self._index_col = index_col
+        self._progress_callback = progress_callback
+        self._total_bytes = os.path.getsize(file_path)
+        self._bytes_read = 0
+        self._rows_read = 0
+        self._statistics = OnlineStatistics()
+
+    def __iter__(self):
+        """Yields: (pandas.DataFrame) next chunk of rows of the file"""
+        ChunkedFileReader.LOGGER.debug("Reading file '%s' in chunks of %s rows",
+                                       self._file_path, self._chunk_size)
+        with open(self._file_path, 'rb') as csv_file:
+            chunks = pd.read_csv(csv_file, sep=self._delimiter,
+                                 header=0 if self._header else None,
+                                 index_col=self._index_col, chunksize=self._chunk_size)
+            for chunk_df in chunks:
+                self._rows_read += len(chunk_df.index)
+                # The parser reads ahead in blocks so this is an upper bound
+                self._bytes_read = min(csv_file.tell(), self._total_bytes)
+                self._statistics.update(chunk_df)
+                if self._progress_callback:
+                    self._progress_callback(self)
+                yield chunk_df
+        self._bytes_read = self._total_bytes
+
+    def read_all(self):
+        """Reads the rest of the file
+           Returns: (pandas.DataFrame) DataFrame with all the chunks
+        """
+        chunks = list(self)
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks)
+
+    def get_statistics(self):
+        """Returns: (OnlineStatistics) statistics of the chunks read so far"""
+        return self._statistics
+
+    def get_rows_read(self):
+        return self._rows_read
+
+    def get_bytes_read(self):
+        return self._bytes_read
+
+    def get_total_bytes(self):
+        return self._total_bytes
+
+    def get_progress(self):
+        """Returns: (float) fraction of the file read, between 0 and 1"""
+        if not self._total_bytes:
+            return 1.
+        return self._bytes_read / self._total_bytes
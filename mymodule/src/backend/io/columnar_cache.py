@@ -0,0 +1,183 @@
+"""
+    Columnar Cache
+"""
+
+import logging
+import os
+import shutil
+import hashlib
+import pickle
+import tempfile
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+class ColumnarCache(object):
+    """Static class that stores the DataFrame read from a file as a bundle
+       of .npy files, one per column, so later reads of the same file
+       memory-map the columns instead of parsing the text again.
+       A cache is only valid for the path, size and modification time of
+       the file it was created from
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Bump when the layout of the bundle changes to invalidate old caches
+    VERSION = 1
+    # Hidden directory created next to the source files
+    CACHE_DIRECTORY = '.cache'
+    METADATA_FILE = 'metadata.pkl'
+    INDEX_FILE = 'index.npy'
+    COLUMN_FILE = 'column_{}.npy'
+
+    @staticmethod
+    def get_cache_path(file_path, *key_args):
+        """file_path: (String) path to the source file
+           [*key_args]: (Object) reading options that change the resulting
+           DataFrame (e.g. whether the file has a header)
+           Returns: (String) path of the cache bundle for the current
+                    version of the file
+        """
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        key = repr((abs_path, stat.st_size, stat.st_mtime, ColumnarCache.VERSION) + key_args)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        directory, filename = os.path.split(abs_path)
+        return os.path.join(directory, ColumnarCache.CACHE_DIRECTORY,
+                            "{}.{}".format(filename, digest))
+
+    @staticmethod
+    def has_cache(file_path, *key_args):
+        """Returns: (Boolean) True if there is a valid cache for the file"""
+        try:
+            cache_path = ColumnarCache.get_cache_path(file_path, *key_args)
+        except OSError:
+            return False
+        return os.path.isfile(os.path.join(cache_path, ColumnarCache.METADATA_FILE))
+
+    @staticmethod
+    def read(file_path, *key_args):
+        """file_path: (String) path to the source file
+           [*key_args]: (Object) same reading options given to write
+           Returns: (pandas.DataFrame) DataFrame stored for the current version
+                    of the file or None if there is no valid cache
+        """
+        if not ColumnarCache.has_cache(file_path, *key_args):
+            return None
+        cache_path = ColumnarCache.get_cache_path(file_path, *key_args)
+        ColumnarCache.LOGGER.debug("Reading columnar cache '%s'", cache_path)
+        try:
+            with open(os.path.join(cache_path, ColumnarCache.METADATA_FILE), 'rb') as metadata_file:
+                metadata = pickle.load(metadata_file)
+            index = np.load(os.path.join(cache_path, ColumnarCache.INDEX_FILE),
+                            allow_pickle=True)
+            columns = OrderedDict()
+            for i, column in enumerate(metadata['columns']):
+                column_path = os.path.join(cache_path, ColumnarCache.COLUMN_FILE.format(i))
+                if metadata['object_columns'][i]:
+                    # Python objects cannot be memory-mapped
+                    columns[column] = np.load(column_path, allow_pickle=True)
+                else:
+                    columns[column] = np.load(column_path, mmap_mode='r')
+            dataframe = pd.DataFrame(columns,
+                                     index=pd.Index(index, name=metadata['index_name']),
+                                     columns=metadata['columns'])
+            return dataframe
+        except Exception:
+            ColumnarCache.LOGGER.warn("Could not read columnar cache '%s'", cache_path,
+                                      exc_info=True)
+            return None
+
+    @staticmethod
+    def read_layout(file_path, *key_args):
+        """Reads the number of rows and the dtypes of the cached DataFrame
+           from the headers of its files, without loading the values
+           file_path: (String) path to the source file
+           [*key_args]: (Object) same reading options given to write
+           Returns: (int) number of rows
+                    (OrderedDict) dictionary with the shape {column, numpy.dtype}
+                    or None if there is no valid cache
+        """
+        if not ColumnarCache.has_cache(file_path, *key_args):
+            return None
+        cache_path = ColumnarCache.get_cache_path(file_path, *key_args)
+        try:
+            with open(os.path.join(cache_path, ColumnarCache.METADATA_FILE), 'rb') as metadata_file:
+                metadata = pickle.load(metadata_file)
+            shape, _ = ColumnarCache._read_header(os.path.join(cache_path,
+                                                               ColumnarCache.INDEX_FILE))
+            dtypes = OrderedDict()
+            for i, column in enumerate(metadata['columns']):
+                _, dtypes[column] = ColumnarCache._read_header(
+                    os.path.join(cache_path, ColumnarCache.COLUMN_FILE.format(i)))
+            return shape[0], dtypes
+        except Exception:
+            ColumnarCache.LOGGER.warn("Could not read columnar cache '%s'", cache_path,
+                                      exc_info=True)
+            return None
+
+    @staticmethod
+    def _read_header(npy_path):
+        """Returns: (Tuple<int>) shape of the array stored in the .npy file
+                    (numpy.dtype) dtype of the array
+        """
+        with open(npy_path, 'rb') as npy_file:
+            version = np.lib.format.read_magic(npy_file)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(npy_file)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(npy_file)
+        return shape, dtype
+
+    @staticmethod
+    def write(file_path, dataframe, *key_args):
+        """Stores the DataFrame as the cache for the current version of the file,
+           removing the caches of its previous versions
+           file_path: (String) path to the source file
+           dataframe: (pandas.DataFrame) DataFrame read from the file
+           [*key_args]: (Object) reading options that produced the DataFrame
+           Returns: (String) path to the cache bundle or None if it could not
+                    be written
+        """
+        tmp_path = None
+        try:
+            cache_path = ColumnarCache.get_cache_path(file_path, *key_args)
+            cache_directory = os.path.dirname(cache_path)
+            if not os.path.isdir(cache_directory):
+                os.makedirs(cache_directory)
+            # Write in a temporary directory and rename it at the end so
+            # readers never see a half written bundle
+            tmp_path = tempfile.mkdtemp(dir=cache_directory)
+            ColumnarCache._write_bundle(tmp_path, dataframe)
+            ColumnarCache._remove_previous_versions(cache_path)
+            os.rename(tmp_path, cache_path)
+        except Exception:
+            ColumnarCache.LOGGER.warn("Could not write columnar cache for '%s'", file_path,
+                                      exc_info=True)
+            if tmp_path:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            return None
+        ColumnarCache.LOGGER.debug("Columnar cache written to '%s'", cache_path)
+        return cache_path
+
+    @staticmethod
+    def _write_bundle(bundle_path, dataframe):
+        object_columns = []
+        for i, column in enumerate(dataframe.columns):
+            values = dataframe[column].values
+            object_columns.append(values.dtype == object)
+            np.save(os.path.join(bundle_path, ColumnarCache.COLUMN_FILE.format(i)), values)
+        np.save(os.path.join(bundle_path, ColumnarCache.INDEX_FILE),
+                np.asarray(dataframe.index.values))
+        metadata = dict(version=ColumnarCache.VERSION,
+                        columns=dataframe.columns.tolist(),
+                        object_columns=object_columns,
+                        index_name=dataframe.index.name)
+        with open(os.path.join(bundle_path, ColumnarCache.METADATA_FILE), 'wb') as metadata_file:
+            pickle.dump(metadata, metadata_file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _remove_previous_versions(cache_path):
+        cache_directory, cache_name = os.path.split(cache_path)
+        filename = cache_name.rsplit('.', 1)[0]
+        for name in os.listdir(cache_directory):
+            if name.rsplit('.', 1)[0] == filename:
+                shutil.rmtree(os.path.join(cache_directory, name), ignore_errors=True)
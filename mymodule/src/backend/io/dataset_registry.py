@@ -0,0 +1,202 @@
+"""
+    Dataset Registry
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from .reader import Reader
+
+class Dataset(object):
+    """Input DataFrame of a file shared across views and sessions, together
+       with the DataFrames derived from it. They are shared, so they must be
+       treated as read-only: any modification has to be done on a copy
+    """
+
+    def __init__(self, key, file_path, raw_input_df, statistics=None):
+        self._key = key
+        self._file_path = file_path
+        self._raw_input_df = raw_input_df
+        self._statistics = statistics
+        self._derived = dict()
+        self._ref_count = 0
+        self._memory_usage = Dataset._get_memory_usage(raw_input_df)
+
+    @staticmethod
+    def _get_memory_usage(element):
+        """element: (pandas.DataFrame || Tuple<pandas.DataFrame>)
+           Returns: (int) estimated bytes held by the DataFrames
+        """
+        if isinstance(element, (tuple, list)):
+            return sum(Dataset._get_memory_usage(sub_element) for sub_element in element)
+        if hasattr(element, 'memory_usage'):
+            return int(element.memory_usage(index=True).sum())
+        return 0
+
+    def get_key(self):
+        return self._key
+
+    def get_file_path(self):
+        return self._file_path
+
+    def get_raw_input_df(self):
+        return self._raw_input_df
+
+    def get_statistics(self):
+        """Returns: (OnlineStatistics) statistics of the numeric columns
+                    gathered while reading the file or None if unknown
+        """
+        return self._statistics
+
+    def get_derived(self, name, factory):
+        """Returns the derived element with the given name, creating it with
+           the factory the first time it is requested
+           name: (String) unique name of the derived element
+           factory: (func) function without arguments creating the element
+        """
+        if name not in self._derived:
+            derived = factory()
+            self._derived[name] = derived
+            self._memory_usage += Dataset._get_memory_usage(derived)
+        return self._derived[name]
+
+    def get_memory_usage(self):
+        """Returns: (int) estimated bytes held by the dataset"""
+        return self._memory_usage
+
+    def get_ref_count(self):
+        return self._ref_count
+
+
+class DatasetRegistry(object):
+    """Process wide registry of the datasets in use. Views opening the same
+       file share a single Dataset. Datasets are reference counted and the
+       unused ones are evicted, least recently used first, when the memory
+       held by the registry goes over MEMORY_LIMIT. Files are read outside
+       the lock, so loading one does not block the sessions using others
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Maximum bytes held by all the registered datasets, used or not. Only
+    # the unused ones are evicted to get under it
+    MEMORY_LIMIT = 2 * 1024 ** 3
+    # dictionary with the shape {dataset_key, Dataset} sorted from least
+    # to most recently used
+    DATASET_DIC = OrderedDict()
+    # dictionary with the shape {dataset_key, Future} of the files being read
+    _LOADING_DIC = dict()
+    _LOCK = threading.RLock()
+
+    @staticmethod
+    def _get_key(file_path, header):
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        return (abs_path, stat.st_size, stat.st_mtime, header)
+
+    @staticmethod
+    def acquire(file_path, header=True, progress_callback=None):
+        """Returns the shared dataset of the file, reading it if it is not
+           registered yet. Every acquire must be followed by a release once
+           the dataset is no longer used
+           file_path: (String) full path to the source file
+           [header=True]: (Boolean) if the first line of the file is a header
+           [progress_callback=None]: (func) called with the ChunkedFileReader
+           after every chunk when the file has to be parsed
+           Returns: (Dataset)
+        """
+        with DatasetRegistry._LOCK:
+            key = DatasetRegistry._get_key(file_path, header)
+            dataset = DatasetRegistry.DATASET_DIC.get(key)
+            if dataset is not None:
+                return DatasetRegistry._register(key, dataset)
+            future = DatasetRegistry._LOADING_DIC.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                DatasetRegistry._LOADING_DIC[key] = future
+        if not is_loader:
+            DatasetRegistry.LOGGER.debug("Waiting for dataset '%s'", file_path)
+            return DatasetRegistry._register(key, future.result())
+        DatasetRegistry.LOGGER.debug("Registering dataset '%s'", file_path)
+        try:
+            raw_input_df, statistics = Reader.read_from_file_with_statistics(
+                file_path, header=header, progress_callback=progress_callback)
+            dataset = Dataset(key, file_path, raw_input_df, statistics=statistics)
+        except Exception as exception:
+            with DatasetRegistry._LOCK:
+                DatasetRegistry._LOADING_DIC.pop(key, None)
+            future.set_exception(exception)
+            raise
+        # Registered in the same step the loading ends, so later acquirers
+        # always find either the dataset or its future
+        with DatasetRegistry._LOCK:
+            dataset = DatasetRegistry._register(key, dataset)
+            DatasetRegistry._LOADING_DIC.pop(key, None)
+        future.set_result(dataset)
+        return dataset
+
+    @staticmethod
+    def _register(key, dataset):
+        """Registers a new reference to the dataset as the most recently used
+           Returns: (Dataset) the dataset
+        """
+        with DatasetRegistry._LOCK:
+            DatasetRegistry.DATASET_DIC.pop(key, None)
+            DatasetRegistry.DATASET_DIC[key] = dataset
+            dataset._ref_count += 1
+            DatasetRegistry._evict()
+            return dataset
+
+    @staticmethod
+    def release(dataset):
+        """Decreases the references to the dataset, which may be evicted
+           once it is not referenced anymore
+           dataset: (Dataset) dataset returned by acquire
+        """
+        with DatasetRegistry._LOCK:
+            if dataset._ref_count <= 0:
+                DatasetRegistry.LOGGER.warn("Dataset '%s' released more times than acquired",
+                                            dataset.get_file_path())
+                return
+            dataset._ref_count -= 1
+            DatasetRegistry._evict()
+
+    @staticmethod
+    def set_memory_limit(memory_limit):
+        """memory_limit: (int) maximum bytes held before evicting datasets"""
+        with DatasetRegistry._LOCK:
+            DatasetRegistry.MEMORY_LIMIT = memory_limit
+            DatasetRegistry._evict()
+
+    @staticmethod
+    def get_memory_usage():
+        """Returns: (int) estimated bytes held by all registered datasets"""
+        return sum(dataset.get_memory_usage()
+                   for dataset in DatasetRegistry.DATASET_DIC.values())
+
+    @staticmethod
+    def get_registered_files():
+        """Returns: (List<String>) files of the registered datasets from
+                    least to most recently used
+        """
+        return [dataset.get_file_path() for dataset in DatasetRegistry.DATASET_DIC.values()]
+
+    @staticmethod
+    def _evict():
+        """Removes unused datasets, least recently used first, until the
+           memory usage is under the limit. Datasets in use are never evicted
+        """
+        memory_usage = DatasetRegistry.get_memory_usage()
+        for key in list(DatasetRegistry.DATASET_DIC.keys()):
+            if memory_usage <= DatasetRegistry.MEMORY_LIMIT:
+                break
+            dataset = DatasetRegistry.DATASET_DIC[key]
+            if dataset.get_ref_count() > 0:
+                continue
+            DatasetRegistry.LOGGER.debug("Evicting dataset '%s'", dataset.get_file_path())
+            del DatasetRegistry.DATASET_DIC[key]
+            memory_usage -= dataset.get_memory_usage()
+        if memory_usage > DatasetRegistry.MEMORY_LIMIT:
+            DatasetRegistry.LOGGER.warn("Datasets in use hold %s bytes, over the limit of %s",
+                                        memory_usage, DatasetRegistry.MEMORY_LIMIT)
@@ -0,0 +1,154 @@
+"""
+    Directory Index
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from stat import S_ISREG
+import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
+from .columnar_cache import ColumnarCache
+from .file_reader import FileReader
+
+class DirectoryIndex(object):
+    """Index of the files of a directory, shared by the whole process so
+       listing them does not hit the file system every time. The directory is
+       listed again only when its modification time changes, as when files
+       are added, removed or renamed, stating only the new files. Every
+       MAX_AGE seconds all the files are stated again to notice the ones
+       modified in place
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Seconds after which all the files are stated again
+    MAX_AGE = 30
+    # Number of rows read to detect the columns of files without cache
+    SAMPLE_ROWS = 1000
+    # Keys of the information of a file
+    SIZE = 'size'
+    MTIME = 'mtime'
+    ROWS = 'rows'
+    COLUMNS = 'columns'
+    DIMENSIONAL = 'dimensional'
+    NOMINAL = 'nominal'
+    # dictionary with the shape {directory, DirectoryIndex}
+    _INDEX_DIC = dict()
+    _INDEX_LOCK = threading.Lock()
+
+    @staticmethod
+    def get_index(directory):
+        """Returns: (DirectoryIndex) index of the directory shared by the process"""
+        directory = os.path.abspath(directory)
+        with DirectoryIndex._INDEX_LOCK:
+            if directory not in DirectoryIndex._INDEX_DIC:
+                DirectoryIndex._INDEX_DIC[directory] = DirectoryIndex(directory)
+            return DirectoryIndex._INDEX_DIC[directory]
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._directory_mtime = None
+        self._stat_time = 0
+        # dictionary with the shape {filename, (size, mtime)} of the files
+        self._file_dic = dict()
+        # dictionary with the shape {filename, details} of the files whose
+        # rows and columns are known, holding the (size, mtime) they were read for
+        self._details_dic = dict()
+        self._lock = threading.RLock()
+
+    def refresh(self, force=False):
+        """Updates the index if the directory changed or the files were stated
+           more than MAX_AGE seconds ago
+           [force=False]: (Boolean) list and state all the files anyway
+        """
+        with self._lock:
+            directory_mtime = os.stat(self._directory).st_mtime
+            expired = force or time.time() - self._stat_time > DirectoryIndex.MAX_AGE
+            if directory_mtime == self._directory_mtime and not expired:
+                return
+            DirectoryIndex.LOGGER.debug("Refreshing index of '%s'", self._directory)
+            file_dic = dict()
+            for filename in os.listdir(self._directory):
+                if filename in self._file_dic and not expired:
+                    file_dic[filename] = self._file_dic[filename]
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self._directory, filename))
+                except OSError:
+                    # Removed while listing
+                    continue
+                if S_ISREG(stat.st_mode):
+                    file_dic[filename] = (stat.st_size, stat.st_mtime)
+            self._file_dic = file_dic
+            self._directory_mtime = directory_mtime
+            if expired:
+                self._stat_time = time.time()
+
+    def get_filenames(self):
+        """Returns: (List<String>) sorted names of the regular files"""
+        self.refresh()
+        return sorted(self._file_dic)
+
+    def get_file_info(self, filename):
+        """Returns: (Dictionary) size and mtime of the file, together with its
+                    number of rows and dimensional and nominal columns if they
+                    are already known (see get_file_details), or None if
+                    there is no such file
+        """
+        self.refresh()
+        with self._lock:
+            if filename not in self._file_dic:
+                return None
+            size, mtime = self._file_dic[filename]
+            info = {DirectoryIndex.SIZE: size, DirectoryIndex.MTIME: mtime}
+            details = self._details_dic.get(filename)
+            if details is not None and details[0] == (size, mtime):
+                info.update(details[1])
+            return info
+
+    def get_file_details(self, filename):
+        """Reads the number of rows and the columns of the file if they are
+           not known yet, from the headers of its columnar cache if it has
+           one, or else detecting the columns on a sample of rows
+           Returns: (Dictionary) same as get_file_info
+        """
+        info = self.get_file_info(filename)
+        if info is None or DirectoryIndex.ROWS in info:
+            return info
+        details = DirectoryIndex._read_details(os.path.join(self._directory, filename))
+        with self._lock:
+            self._details_dic[filename] = ((info[DirectoryIndex.SIZE],
+                                            info[DirectoryIndex.MTIME]), details)
+        info.update(details)
+        return info
+
+    @staticmethod
+    def _read_details(file_path):
+        layout = ColumnarCache.read_layout(file_path, True)
+        if layout is not None:
+            rows, dtypes = layout
+        else:
+            raw_input_df = pd.read_csv(file_path, sep=FileReader.DELIMITER, index_col=0,
+                                       nrows=DirectoryIndex.SAMPLE_ROWS)
+            rows = DirectoryIndex._count_lines(file_path) - 1
+            dtypes = OrderedDict(zip(raw_input_df.columns, raw_input_df.dtypes))
+        dimensional = [column for column, dtype in dtypes.items()
+                       if is_numeric_dtype(dtype) and not is_bool_dtype(dtype)]
+        nominal = [column for column in dtypes.keys() if column not in dimensional]
+        return {DirectoryIndex.ROWS: rows,
+                DirectoryIndex.COLUMNS: len(dtypes),
+                DirectoryIndex.DIMENSIONAL: dimensional,
+                DirectoryIndex.NOMINAL: nominal}
+
+    @staticmethod
+    def _count_lines(file_path, chunk_size=1024 ** 2):
+        lines = 0
+        last_chunk = b''
+        with open(file_path, 'rb') as input_file:
+            for chunk in iter(lambda: input_file.read(chunk_size), b''):
+                lines += chunk.count(b'\n')
+                last_chunk = chunk
+        if last_chunk and not last_chunk.endswith(b'\n'):
+            lines += 1
+        return lines
@@ -15,6 +15,14 @@ class FileReader(object):
     USE = ("USE: Files must have .'{}' extension. "+
            "The default delimiter is = '{}'").format(FILE_EXTENSION, DELIMITER)
 
+    @staticmethod
+    def is_valid_file(file_path):
+        """Returns: (Boolean) True if the path is an existing file with a
+                    valid extension
+        """
+        return file_path.split('.')[-1].upper() == FileReader.FILE_EXTENSION\
+               and isfile(file_path)
+
     @staticmethod
     def read_file(file_path, delimiter=DELIMITER, header=True, index_col=0):
         """ Reads the file from the given path
@@ -26,8 +34,7 @@ class FileReader(object):
             [index_col=0] --> (int) index of column with the id / name of each product
         """
         FileReader.LOGGER.debug("Reading file '%s'", file_path)
-        if (file_path.split('.')[-1].upper() == FileReader.FILE_EXTENSION
-                and isfile(file_path)):
+        if FileReader.is_valid_file(file_path):
             dataframe = None
             if header:
                 dataframe = pd.read_csv(file_path, sep=delimiter,
@@ -4,21 +4,50 @@
 
 from __future__ import division
 import logging
-from .file_reader import FileReader
+from .chunked_file_reader import ChunkedFileReader
+from .columnar_cache import ColumnarCache
 
 class Reader(object):
     """Provides methods to get an input DataFrame out of a given source"""
     LOGGER = logging.getLogger(__name__)
+    # Whether files are stored in and read from the columnar cache
+    USE_CACHE = True
 
     # TODO gchicafernandez - Possiby declare this as an abstract class
     # and then move this logic to the FileReader
     @staticmethod
-    def read_from_file(file_path, header=True):
+    def read_from_file(file_path, header=True, use_cache=USE_CACHE, progress_callback=None):
         """file_path: (String) full path to source file to be read
            [header=True]: (Boolean) if the first line of the file is a header
+           [use_cache=USE_CACHE]: (Boolean) read the file from its columnar
+           cache, creating it on the first read
+           [progress_callback=None]: (func) called with the ChunkedFileReader
+           after every chunk parsed
            Returns: (pandas.DataFrame) input DataFrame as-is
         """
-        raw_input_df = FileReader.read_file(file_path, header=header)
+        raw_input_df, _ = Reader.read_from_file_with_statistics(file_path, header=header,
+                                                                use_cache=use_cache,
+                                                                progress_callback=progress_callback)
         return raw_input_df
 
+    @staticmethod
+    def read_from_file_with_statistics(file_path, header=True, use_cache=USE_CACHE,
+                                       progress_callback=None):
+        """Same as read_from_file, also returning the statistics of the numeric
+           columns gathered while the file was parsed
+           Returns: (pandas.DataFrame) input DataFrame as-is
+                    (OnlineStatistics) statistics of the numeric columns or
+                    None if the DataFrame came from the cache
+        """
+        if use_cache:
+            raw_input_df = ColumnarCache.read(file_path, header)
+            if raw_input_df is not None:
+                return raw_input_df, None
+        chunked_reader = ChunkedFileReader(file_path, header=header,
+                                           progress_callback=progress_callback)
+        raw_input_df = chunked_reader.read_all()
+        if use_cache:
+            ColumnarCache.write(file_path, raw_input_df, header)
+        return raw_input_df, chunked_reader.get_statistics()
+
     # Methods to read from different sources can be added to this class
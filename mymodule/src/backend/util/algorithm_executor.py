@@ -0,0 +1,181 @@
+"""
+    AlgorithmExecutor
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, Future
+import numpy as np
+import pandas as pd
+
+class SharedValues(object):
+    """Numeric DataFrame, Series or array stored as a .npy file in shared
+       memory, so it reaches the worker processes as a memory-mapped file
+       instead of being pickled through the pipe
+    """
+
+    def __init__(self, element, directory):
+        """element: (pandas.DataFrame || pandas.Series || numpy.ndarray) numeric values
+           directory: (String) directory where the file is written
+        """
+        self._index = getattr(element, 'index', None)
+        self._columns = getattr(element, 'columns', None)
+        self._name = getattr(element, 'name', None)
+        self._is_series = isinstance(element, pd.Series)
+        file_descriptor, self._path = tempfile.mkstemp(suffix='.npy', dir=directory)
+        os.close(file_descriptor)
+        np.save(self._path, np.ascontiguousarray(getattr(element, 'values', element)))
+
+    @staticmethod
+    def can_share(element):
+        """Returns: (Boolean) True if the element holds numeric values"""
+        if not isinstance(element, (pd.DataFrame, pd.Series, np.ndarray)):
+            return False
+        if isinstance(element, pd.DataFrame):
+            return all(dtype.kind in 'biuf' for dtype in element.dtypes)
+        return element.dtype.kind in 'biuf'
+
+    def load(self):
+        """Returns: (pandas.DataFrame || pandas.Series || numpy.ndarray) the
+                    shared element. Pages are copied only when written
+        """
+        values = np.load(self._path, mmap_mode='c')
+        if self._columns is not None:
+            return pd.DataFrame(values, index=self._index, columns=self._columns)
+        if self._is_series:
+            return pd.Series(values, index=self._index, name=self._name)
+        return values
+
+    def remove(self):
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+def _execute(algorithm, args, kwargs):
+    """Runs in the worker processes, loading the shared arguments"""
+    args = [arg.load() if isinstance(arg, SharedValues) else arg for arg in args]
+    kwargs = dict((key, value.load() if isinstance(value, SharedValues) else value)
+                  for key, value in kwargs.items())
+    return algorithm(*args, **kwargs)
+
+
+class AlgorithmExecutor(object):
+    """Static class running algorithms in a pool of processes shared by all
+       the sessions, so heavy computations do not block the server. Numeric
+       arguments are passed through shared memory. Algorithms must be module
+       level functions, like the registered ones, so they can be pickled
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Number of worker processes. 0 runs the algorithms in the calling thread
+    MAX_WORKERS = max(1, multiprocessing.cpu_count() // 2)
+    # tmpfs directory used to share the arrays, if available
+    SHARED_MEMORY_DIRECTORY = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    _EXECUTOR = None
+    # dictionary with the shape {session_id, Set<Future>} of the pending futures
+    _SESSION_FUTURE_DIC = dict()
+    _LOCK = threading.RLock()
+
+    @staticmethod
+    def set_max_workers(max_workers):
+        """Changes the number of worker processes. The running algorithms
+           finish in the previous pool
+           max_workers: (int) number of processes, 0 to run inline
+        """
+        with AlgorithmExecutor._LOCK:
+            AlgorithmExecutor.MAX_WORKERS = max_workers
+            AlgorithmExecutor.shutdown()
+
+    @staticmethod
+    def shutdown(wait=False):
+        """Stops the worker processes once they finish the running
+           algorithms. A later submit starts new ones
+           [wait=False]: (Boolean) wait for the processes to exit
+        """
+        with AlgorithmExecutor._LOCK:
+            if AlgorithmExecutor._EXECUTOR is not None:
+                AlgorithmExecutor._EXECUTOR.shutdown(wait=wait)
+                AlgorithmExecutor._EXECUTOR = None
+
+    @staticmethod
+    def _get_executor():
+        with AlgorithmExecutor._LOCK:
+            if AlgorithmExecutor._EXECUTOR is None:
+                AlgorithmExecutor.LOGGER.debug("Starting %s worker processes",
+                                               AlgorithmExecutor.MAX_WORKERS)
+                AlgorithmExecutor._EXECUTOR = ProcessPoolExecutor(AlgorithmExecutor.MAX_WORKERS)
+            return AlgorithmExecutor._EXECUTOR
+
+    @staticmethod
+    def submit(session_id, algorithm, *args, **kwargs):
+        """Schedules the algorithm in the process pool
+           session_id: (String) session requesting the execution, used to
+           cancel its pending executions (see cancel_session)
+           algorithm: (func) module level function
+           *args, **kwargs: arguments of the algorithm
+           Returns: (concurrent.futures.Future) result of the algorithm
+        """
+        if not AlgorithmExecutor.MAX_WORKERS:
+            return AlgorithmExecutor._execute_inline(algorithm, args, kwargs)
+        shared_values = []
+        def share(element):
+            if not SharedValues.can_share(element):
+                return element
+            shared_values.append(SharedValues(element,
+                                              AlgorithmExecutor.SHARED_MEMORY_DIRECTORY))
+            return shared_values[-1]
+        args = [share(arg) for arg in args]
+        kwargs = dict((key, share(value)) for key, value in kwargs.items())
+        with AlgorithmExecutor._LOCK:
+            future = AlgorithmExecutor._get_executor().submit(_execute, algorithm, args, kwargs)
+            AlgorithmExecutor.track(session_id, future)
+
+        def clean(future):
+            for shared_element in shared_values:
+                shared_element.remove()
+        future.add_done_callback(clean)
+        return future
+
+    @staticmethod
+    def track(session_id, future):
+        """Adds a future of another executor, e.g. a thread pool, to the
+           executions of the session, so cancel_session cancels it too
+           session_id: (String) session waiting for the future
+           future: (concurrent.futures.Future) pending execution
+        """
+        with AlgorithmExecutor._LOCK:
+            AlgorithmExecutor._SESSION_FUTURE_DIC.setdefault(session_id, set()).add(future)
+
+        def untrack(future):
+            with AlgorithmExecutor._LOCK:
+                session_futures = AlgorithmExecutor._SESSION_FUTURE_DIC.get(session_id, set())
+                session_futures.discard(future)
+                if not session_futures:
+                    AlgorithmExecutor._SESSION_FUTURE_DIC.pop(session_id, None)
+        future.add_done_callback(untrack)
+
+    @staticmethod
+    def cancel_session(session_id):
+        """Cancels the executions of the session that have not started. The
+           results of the running ones should be ignored by the session
+        """
+        with AlgorithmExecutor._LOCK:
+            session_futures = list(AlgorithmExecutor._SESSION_FUTURE_DIC.get(session_id, ()))
+        if session_futures:
+            AlgorithmExecutor.LOGGER.debug("Cancelling %s executions of session %s",
+                                           len(session_futures), session_id)
+        for future in session_futures:
+            future.cancel()
+
+    @staticmethod
+    def _execute_inline(algorithm, args, kwargs):
+        future = Future()
+        try:
+            future.set_result(algorithm(*args, **kwargs))
+        except Exception as exception:
+            future.set_exception(exception)
+        return future
@@ -0,0 +1,63 @@
+"""
+    CovarianceStatistics
+"""
+
+from __future__ import division
+import numpy as np
+
+class CovarianceStatistics(object):
+    """Sufficient statistics of a set of values for the linear projections:
+       number of values, mean and scatter matrix of the dimensions. They are
+       computed in a single pass, after which the within-class scatter of any
+       assignment of the values to classes only needs the class means
+    """
+
+    def __init__(self, values_df):
+        """values_df: (pandas.DataFrame) product_id X dimensional_values"""
+        m = values_df.values.astype(np.float64)
+        self._columns = values_df.columns
+        self._n = len(m)
+        self._mean = m.mean(axis=0)
+        m -= self._mean
+        self._scatter = np.dot(m.T, m)
+
+    def get_number_of_values(self):
+        return self._n
+
+    def get_mean(self):
+        """Returns: (numpy.ndarray) mean of every dimension"""
+        return self._mean
+
+    def get_covariance(self):
+        """Returns: (numpy.ndarray) dimensions X dimensions covariance matrix"""
+        return self._scatter / max(self._n - 1, 1)
+
+    def get_class_statistics(self, values_df, classes):
+        """values_df: (pandas.DataFrame) same values the statistics were computed from
+           classes: (List<Object>) class of every value, in the same order
+           Returns: (numpy.ndarray) number of values of every class, sorted by class
+                    (numpy.ndarray) classes X dimensions means of the classes
+                    (numpy.ndarray) dimensions X dimensions within-class scatter
+        """
+        grouped = values_df.astype(np.float64).groupby(np.asarray(classes))
+        counts = grouped.size().values.astype(np.float64)
+        means = grouped.mean().values
+        deviations = means - self._mean
+        between_scatter = np.dot((counts[:, np.newaxis] * deviations).T, deviations)
+        return counts, means, self._scatter - between_scatter
+
+    def get_memory_usage(self):
+        """Returns: (int) bytes held by the statistics"""
+        return self._mean.nbytes + self._scatter.nbytes
+
+
+def solve_from_statistics(statistics_algorithm, values_df, *args):
+    """Computes the statistics of the values and solves the algorithm from
+       them. Module level, so it can run in the AlgorithmExecutor
+       statistics_algorithm: (func) algorithm receiving the statistics
+       values_df: (pandas.DataFrame) product_id X dimensional_values
+       Returns: result of the algorithm
+                (CovarianceStatistics) statistics of the values
+    """
+    statistics = CovarianceStatistics(values_df)
+    return statistics_algorithm(values_df, *args, statistics=statistics), statistics
@@ -2,35 +2,53 @@
     ErrorUtils
 """
 
+import numpy as np
+import pandas as pd
+
 class ErrorUtils(object):
     """Class holding common utils for error algorithms"""
+    # Number of points processed at once. Bounds the size of the temporary
+    # matrices to CHUNK_SIZE X dimensions instead of points X dimensions
+    CHUNK_SIZE = 65536
 
     @staticmethod
-    def get_general_error_df(values_df, vectors_df, mapped_points_df):
+    def get_general_error_df(values_df, vectors_df, mapped_points_df, chunk_size=CHUNK_SIZE):
         """
             values_df: (pandas.DataFrame) product_id X dimensional_value
             vectors_df: (pandas.DataFrame) dimension X (v_x,v_y) columns
             mapped_points_df: (pandas.DataFrame) product_id X (x,y) columns
+            [chunk_size=CHUNK_SIZE]: (int) number of points computed at once.
+            None computes all points in a single step
             Returns: (pandas.DataFrame) product_id X (x,y) columns where each cell contains
             the absolute error value for that point on that coordenate component
         """
-        def get_column_error(column, vectors_df, mapped_points_df_t):
-            column_expected_x = (column * vectors_df['x']).abs()
-            column_expected_y = (column * vectors_df['y']).abs()
-            column_index = column.name
-            column_mapped_x = mapped_points_df_t[column_index]['x']
-            column_mapped_y = mapped_points_df_t[column_index]['y']
-            column_error_x = (column_expected_x - column_mapped_x).abs()
-            column_error_y = (column_expected_y - column_mapped_y).abs()
-            column_error = column_error_x + column_error_y
-            return column_error
+        values_mx = values_df.values
+        # Align the vectors with the columns of the values
+        vectors_df = vectors_df.reindex(values_df.columns)
+        vectors_x = vectors_df['x'].values
+        vectors_y = vectors_df['y'].values
+        mapped_x = mapped_points_df['x'].values[:, np.newaxis]
+        mapped_y = mapped_points_df['y'].values[:, np.newaxis]
+        n_points = len(values_mx)
+        if not chunk_size:
+            chunk_size = max(n_points, 1)
+
+        error_mx = np.empty(values_mx.shape, dtype=float)
+        for start in xrange(0, n_points, chunk_size):
+            end = start + chunk_size
+            chunk_values = values_mx[start:end]
+            error_x = error_mx[start:end]
+            # |(|value * v_x| - mapped_x)|
+            np.multiply(chunk_values, vectors_x, out=error_x)
+            np.abs(error_x, out=error_x)
+            error_x -= mapped_x[start:end]
+            np.abs(error_x, out=error_x)
+            # |(|value * v_y| - mapped_y)|
+            error_y = np.multiply(chunk_values, vectors_y)
+            np.abs(error_y, out=error_y)
+            error_y -= mapped_y[start:end]
+            np.abs(error_y, out=error_y)
+            error_x += error_y
 
-        values_df_t_cp = values_df.transpose()
-        mapped_points_df_t = mapped_points_df.transpose()
-        # Avoid duplicated names assigning new column IDs
-        column_ids = [i for i in xrange(0, len(values_df_t_cp.columns))]
-        values_df_t_cp.columns = column_ids
-        mapped_points_df_t.columns = column_ids
-        values_df_t_cp = values_df_t_cp.apply(lambda column: get_column_error(column, vectors_df, mapped_points_df_t), axis=0)
-        general_error_df = values_df_t_cp.transpose()
-        return general_error_df
+        # Avoid duplicated names assigning new row IDs
+        return pd.DataFrame(error_mx, index=pd.RangeIndex(n_points), columns=values_df.columns)
@@ -0,0 +1,100 @@
+"""
+    NormalizationUtils
+"""
+
+from __future__ import division
+import warnings
+import numpy as np
+import pandas as pd
+from .online_statistics import OnlineStatistics
+
+class NormalizationUtils(object):
+    """Class holding common utils for normalization algorithms.
+       Statistics are computed once, either per column or for the whole
+       DataFrame, and applied to the underlying matrix as array operations.
+       Missing values are skipped by the statistics and stay missing
+    """
+    # dictionary with the shape {numpy reduction, OnlineStatistics name}
+    ONLINE_STATISTIC_DIC = {
+        np.nanmin: OnlineStatistics.MINIMUM,
+        np.nanmax: OnlineStatistics.MAXIMUM,
+        np.nanmean: OnlineStatistics.MEAN,
+        np.nanstd: OnlineStatistics.STD
+        }
+
+    @staticmethod
+    def get_matrix(df):
+        """df: (pandas.DataFrame) numeric values
+           Returns: (numpy.ndarray) float copy of the values of the DataFrame
+        """
+        return np.array(df.values, dtype=float)
+
+    @staticmethod
+    def get_statistic(matrix, statistic, df_level=False, statistics=None, columns=None):
+        """matrix: (numpy.ndarray) n_values X n_columns matrix
+           statistic: (func) numpy reduction skipping NaN like numpy.nanmax
+           [df_level=False]: (Boolean) Whether the statistic should be taken
+           from the whole matrix or per column
+           [statistics=None]: (OnlineStatistics) statistics gathered while
+           reading the values. Column statistics are taken from them when
+           they cover all the columns instead of reducing the matrix
+           [columns=None]: (List<String>) labels of the columns of the matrix
+           Returns: (float || numpy.ndarray) statistic of the matrix or one
+                    statistic per column
+        """
+        if statistics is not None and not df_level:
+            online_statistic = statistics.get_statistic(
+                NormalizationUtils.ONLINE_STATISTIC_DIC[statistic], columns)
+            if online_statistic is not None:
+                return online_statistic
+        with warnings.catch_warnings():
+            # Columns without values give NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            if df_level:
+                return statistic(matrix)
+            return statistic(matrix, axis=0)
+
+    @staticmethod
+    def scale_by_range(matrix, offset, maximum, minimum):
+        """Applies (x - offset) / (maximum - minimum) to every value of the
+           matrix, in place. Results greater than 1 are clipped to 1, columns
+           whose range is 0 are set to 1 and negative ranges are set to 0
+           matrix: (numpy.ndarray) float matrix to normalize
+           offset, maximum, minimum: (float || numpy.ndarray) scalars or
+           one value per column
+           Returns: (numpy.ndarray) the normalized matrix
+        """
+        diff = np.asarray(maximum - minimum, dtype=float)
+        matrix -= offset
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrix /= diff
+        np.minimum(matrix, 1, out=matrix)
+        if diff.ndim == 0:
+            if diff == 0:
+                matrix[:] = 1
+            elif diff < 0:
+                matrix[:] = 0
+        else:
+            matrix[:, diff == 0] = 1
+            matrix[:, diff < 0] = 0
+        return matrix
+
+    @staticmethod
+    def scale_by_deviation(matrix, mean, std):
+        """Applies (x - mean) / std to every value of the matrix, in place
+           matrix: (numpy.ndarray) float matrix to normalize
+           mean, std: (float || numpy.ndarray) scalars or one value per column
+           Returns: (numpy.ndarray) the normalized matrix
+        """
+        matrix -= mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrix /= std
+        return matrix
+
+    @staticmethod
+    def to_df(matrix, df):
+        """matrix: (numpy.ndarray) normalized values
+           df: (pandas.DataFrame) original DataFrame providing index and columns
+           Returns: (pandas.DataFrame) DataFrame holding the normalized matrix
+        """
+        return pd.DataFrame(matrix, index=df.index, columns=df.columns)
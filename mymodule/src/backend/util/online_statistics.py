@@ -0,0 +1,94 @@
+"""
+    OnlineStatistics
+"""
+
+from __future__ import division
+import numpy as np
+
+class OnlineStatistics(object):
+    """Per column minimum, maximum, mean and standard deviation of a DataFrame
+       that is received in chunks. Each chunk is reduced once and merged into
+       the running statistics, so the whole DataFrame is never needed.
+       Missing values are skipped, like the nan functions of numpy do
+    """
+    MINIMUM = 'min'
+    MAXIMUM = 'max'
+    MEAN = 'mean'
+    STD = 'std'
+
+    def __init__(self):
+        # dictionary with the shape {column, [count, nan_count, min, max, mean, m2]}
+        self._column_dic = dict()
+        # Columns that stopped being numeric in some chunk
+        self._invalid_columns = set()
+
+    def update(self, chunk_df):
+        """Merges the numeric columns of the chunk into the statistics
+           chunk_df: (pandas.DataFrame) next rows of the DataFrame
+        """
+        for column in chunk_df.columns:
+            if column in self._invalid_columns:
+                continue
+            values = chunk_df[column].values
+            if values.dtype.kind not in 'biuf':
+                self._invalid_columns.add(column)
+                self._column_dic.pop(column, None)
+                continue
+            self._update_column(column, np.asarray(values, dtype=float))
+
+    def _update_column(self, column, values):
+        nan_mask = np.isnan(values)
+        nan_count = int(nan_mask.sum())
+        if nan_count:
+            values = values[~nan_mask]
+        count = len(values)
+        if column not in self._column_dic:
+            self._column_dic[column] = [0, 0, np.inf, -np.inf, 0., 0.]
+        stats = self._column_dic[column]
+        stats[1] += nan_count
+        if not count:
+            return
+        chunk_mean = values.mean()
+        chunk_m2 = np.square(values - chunk_mean).sum()
+        # Chan et al. parallel combination of mean and sum of squares
+        total = stats[0] + count
+        delta = chunk_mean - stats[4]
+        stats[4] += delta * count / total
+        stats[5] += chunk_m2 + delta ** 2 * stats[0] * count / total
+        stats[0] = total
+        stats[2] = min(stats[2], values.min())
+        stats[3] = max(stats[3], values.max())
+
+    def has_columns(self, columns):
+        """Returns: (Boolean) True if there are statistics for all the columns"""
+        return all(column in self._column_dic for column in columns)
+
+    def get_rows(self, column):
+        """Returns: (int) number of values merged for the column, missing included"""
+        stats = self._column_dic[column]
+        return stats[0] + stats[1]
+
+    def get_statistic(self, name, columns):
+        """name: (String) MINIMUM, MAXIMUM, MEAN or STD (population deviation)
+           columns: (List<String>) columns of the statistic
+           Returns: (numpy.ndarray) one value per column or None if some column
+                    has no statistics
+        """
+        if not self.has_columns(columns):
+            return None
+        return np.array([self._get_column_statistic(name, column) for column in columns],
+                        dtype=float)
+
+    def _get_column_statistic(self, name, column):
+        count, nan_count, minimum, maximum, mean, m2 = self._column_dic[column]
+        if not count:
+            return np.nan
+        if name == OnlineStatistics.MINIMUM:
+            return minimum
+        if name == OnlineStatistics.MAXIMUM:
+            return maximum
+        if name == OnlineStatistics.MEAN:
+            return mean
+        if name == OnlineStatistics.STD:
+            return np.sqrt(m2 / count)
+        raise ValueError("Unknown statistic '{}'".format(name))
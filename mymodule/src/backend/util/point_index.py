@@ -0,0 +1,72 @@
+"""
+    PointIndex
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+class PointIndex(object):
+    """Index of the points by name and by position. Names are hashed to their
+       rows, and a KD-tree over the coordinates answers nearest point queries,
+       like those of the hover of aggregated points. The tree is built on the
+       first query after the coordinates change, so animations and mappings
+       nobody queries do not pay for it. Points with missing coordinates are
+       never found by position
+    """
+
+    def __init__(self, names):
+        """names: (List<String>) unique names of the points, in row order"""
+        self._names = names
+        self._row_dic = dict((name, row) for row, name in enumerate(names))
+        self._x = None
+        self._y = None
+        self._tree = None
+        # Rows of the points in the tree
+        self._tree_rows = None
+
+    def get_number_of_points(self):
+        return len(self._names)
+
+    def has_point(self, name):
+        return name in self._row_dic
+
+    def get_row(self, name):
+        """Returns: (int) row of the point or None if there is no such point"""
+        return self._row_dic.get(name)
+
+    def get_name(self, row):
+        return self._names[row]
+
+    def update_coordinates(self, x, y):
+        """x: (numpy.ndarray) x of every point, in row order
+           y: (numpy.ndarray) y of every point, in row order
+        """
+        if len(x) != len(self._names) or len(y) != len(self._names):
+            raise ValueError("Expected {} coordinates, received {} and {}"
+                             .format(len(self._names), len(x), len(y)))
+        self._x = np.asarray(x, dtype=float)
+        self._y = np.asarray(y, dtype=float)
+        self._tree = None
+
+    def get_nearest_row(self, x, y, max_distance=np.inf):
+        """Returns: (int) row of the point nearest to (x, y) or None if there
+                    is none within max_distance
+        """
+        tree = self._get_tree()
+        if tree is None:
+            return None
+        distance, tree_row = tree.query([x, y], distance_upper_bound=max_distance)
+        if not np.isfinite(distance):
+            return None
+        return int(self._tree_rows[tree_row])
+
+    def _get_tree(self):
+        """Returns: (scipy.spatial.cKDTree) tree of the current coordinates
+                    or None if there are no positioned points
+        """
+        if self._tree is None and self._x is not None:
+            self._tree_rows = np.flatnonzero(np.isfinite(self._x) & np.isfinite(self._y))
+            if len(self._tree_rows):
+                self._tree = cKDTree(np.column_stack((self._x[self._tree_rows],
+                                                      self._y[self._tree_rows])))
+        return self._tree
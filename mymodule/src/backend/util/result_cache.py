@@ -0,0 +1,147 @@
+"""
+    ResultCache
+"""
+
+import hashlib
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+class ResultCache(object):
+    """Thread safe LRU cache of algorithm results, bounded by the estimated
+       bytes of the stored results. Keys are meant to be content addressed:
+       built with the fingerprints of the inputs instead of their identity,
+       so equal inputs reuse the results across views and sessions
+    """
+    LOGGER = logging.getLogger(__name__)
+    # dictionary with the shape {id(element), (weakref, fingerprint)} of the
+    # elements already fingerprinted
+    _FINGERPRINT_DIC = dict()
+    _FINGERPRINT_LOCK = threading.RLock()
+
+    @staticmethod
+    def get_fingerprint(element):
+        """Hashes the content of the element. The fingerprint of elements
+           supporting weak references is remembered while they are alive, so
+           they must not be modified once fingerprinted
+           element: (pandas.DataFrame || pandas.Series || numpy.ndarray || List)
+           Returns: (String) hex digest of the values and labels of the element
+        """
+        element_id = id(element)
+        with ResultCache._FINGERPRINT_LOCK:
+            if element_id in ResultCache._FINGERPRINT_DIC:
+                reference, fingerprint = ResultCache._FINGERPRINT_DIC[element_id]
+                if reference() is element:
+                    return fingerprint
+        fingerprint = ResultCache._hash(element)
+        try:
+            def forget(_):
+                with ResultCache._FINGERPRINT_LOCK:
+                    ResultCache._FINGERPRINT_DIC.pop(element_id, None)
+            reference = weakref.ref(element, forget)
+        except TypeError:
+            # Lists and other built-in types cannot be weakly referenced
+            return fingerprint
+        with ResultCache._FINGERPRINT_LOCK:
+            ResultCache._FINGERPRINT_DIC[element_id] = (reference, fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def _hash(element):
+        sha1 = hashlib.sha1()
+        if isinstance(element, (pd.Series, pd.DataFrame)):
+            sha1.update(repr(element.index.tolist()).encode('utf-8'))
+            if isinstance(element, pd.DataFrame):
+                sha1.update(repr(element.columns.tolist()).encode('utf-8'))
+            element = element.values
+        values = np.asarray(element)
+        sha1.update(str(values.dtype).encode('utf-8'))
+        sha1.update(str(values.shape).encode('utf-8'))
+        if values.dtype == object:
+            # Hashed by their codes, so only the distinct values are
+            # converted to text
+            codes, uniques = pd.factorize(values.ravel())
+            sha1.update(repr(uniques.tolist()).encode('utf-8'))
+            sha1.update(codes.view(np.uint8))
+        else:
+            sha1.update(np.ascontiguousarray(values).view(np.uint8))
+        return sha1.hexdigest()
+
+    @staticmethod
+    def _get_memory_usage(result):
+        if isinstance(result, pd.DataFrame):
+            return int(result.memory_usage(index=True).sum())
+        if isinstance(result, pd.Series):
+            return int(result.memory_usage(index=True))
+        if hasattr(result, 'get_memory_usage'):
+            return int(result.get_memory_usage())
+        return int(np.asarray(result).nbytes)
+
+    def __init__(self, name, memory_limit):
+        """name: (String) name of the cache for the logs
+           memory_limit: (int) maximum bytes of results before evicting the
+           least recently used
+        """
+        self._name = name
+        self._memory_limit = memory_limit
+        # dictionary with the shape {key, (result, bytes)} sorted from least
+        # to most recently used
+        self._result_dic = OrderedDict()
+        self._memory_usage = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the result stored for the key, marking it as most recently
+           used, or default if there is none
+        """
+        with self._lock:
+            if key not in self._result_dic:
+                return default
+            entry = self._result_dic.pop(key)
+            self._result_dic[key] = entry
+            return entry[0]
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._result_dic
+
+    def put(self, key, result):
+        """Stores the result as the most recently used one, evicting the least
+           recently used results over the memory limit. The last result is
+           always kept
+        """
+        memory_usage = ResultCache._get_memory_usage(result)
+        with self._lock:
+            if key in self._result_dic:
+                self._memory_usage -= self._result_dic.pop(key)[1]
+            self._result_dic[key] = (result, memory_usage)
+            self._memory_usage += memory_usage
+            while self._memory_usage > self._memory_limit and len(self._result_dic) > 1:
+                evicted_key, (_, evicted_memory_usage) = self._result_dic.popitem(last=False)
+                ResultCache.LOGGER.debug("Evicting %s result %s", self._name, evicted_key)
+                self._memory_usage -= evicted_memory_usage
+
+    def get_or_compute(self, key, compute):
+        """Returns the result stored for the key, computing and storing it
+           if there is none
+           compute: (func) function without arguments returning the result
+        """
+        result = self.get(key, default=self)
+        if result is self:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._result_dic = OrderedDict()
+            self._memory_usage = 0
+
+    def get_memory_usage(self):
+        return self._memory_usage
+
+    def __len__(self):
+        return len(self._result_dic)
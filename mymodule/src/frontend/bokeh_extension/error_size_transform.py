@@ -0,0 +1,50 @@
+from bokeh.models import Transform, ColumnDataSource
+from bokeh.core.properties import Instance, Float
+
+
+class ErrorSizeTransform(Transform):
+    """Maps the error of the points to their size in the browser, scaling it
+       between the initial size, for the lowest error, and the final size,
+       for the highest. Its changes render again the glyphs of the source,
+       which do not compute their sizes again otherwise
+    """
+    __implementation__ = """
+Transform = require "models/transforms/transform"
+p = require "core/properties"
+
+class ErrorSizeTransform extends Transform.Model
+  type: "ErrorSizeTransform"
+
+  initialize: (attrs, options) ->
+    super(attrs, options)
+    @listenTo(@, 'change', () -> @source?.trigger('change'))
+
+  compute: (x) ->
+    if @high > @low
+      x = (x - @low) / (@high - @low)
+    else
+      x = 0
+    return @initial_size + (@final_size - @initial_size) * x
+
+  v_compute: (xs) ->
+    result = new Float64Array(xs.length)
+    for x, i in xs
+      result[i] = @compute(x)
+    return result
+
+  @define {
+      low:                    [ p.Number, 0 ]
+      high:                   [ p.Number, 1 ]
+      initial_size:           [ p.Number, 4 ]
+      final_size:             [ p.Number, 12 ]
+      source:                 [ p.Instance ]
+    }
+module.exports =
+  Model: ErrorSizeTransform
+    """
+
+    low = Float(default=0)
+    high = Float(default=1)
+    initial_size = Float(default=4)
+    final_size = Float(default=12)
+    source = Instance(ColumnDataSource)
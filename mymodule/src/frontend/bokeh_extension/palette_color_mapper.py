@@ -0,0 +1,27 @@
+from bokeh.models import LinearColorMapper, ColumnDataSource
+from bokeh.core.properties import Instance
+
+
+class PaletteColorMapper(LinearColorMapper):
+    """Linear color mapper whose changes render again the glyphs of the
+       source, which do not compute their colors again otherwise
+    """
+    __implementation__ = """
+LinearColorMapper = require "models/mappers/linear_color_mapper"
+p = require "core/properties"
+
+class PaletteColorMapper extends LinearColorMapper.Model
+  type: "PaletteColorMapper"
+
+  initialize: (attrs, options) ->
+    super(attrs, options)
+    @listenTo(@, 'change', () -> @source?.trigger('change'))
+
+  @define {
+      source:                 [ p.Instance ]
+    }
+module.exports =
+  Model: PaletteColorMapper
+    """
+
+    source = Instance(ColumnDataSource)
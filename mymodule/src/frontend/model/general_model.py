@@ -1,12 +1,23 @@
 """
     General Model
 """
+import functools
 import logging
+import time
 from bokeh.io import curdoc
 from bokeh.layouts import row, column
 from .handlers.view_menu_handler import ViewMenuHandler
 from ..view.star_coordinates_view import StarCoordinatesView
 from ..menu.general_view_menu import GeneralViewMenu
+from ...backend.util.algorithm_executor import AlgorithmExecutor
+
+def _action(method):
+    """Decorates the actions of the model, recording them as its last one"""
+    @functools.wraps(method)
+    def record_action(self, *args, **kwargs):
+        self._record_action(method.__name__)
+        return method(self, *args, **kwargs)
+    return record_action
 
 class GeneralModel(object):
     """The general Model places itself in the middle between the views
@@ -30,13 +41,17 @@ class GeneralModel(object):
         self._active_root = None
         self._active_menu = None
         self._active_view = None
+        # Last action requested to the model and when
+        self._last_action = None
+        self._last_action_time = time.time()
 
     def add_star_coordinates_view(self, alias, file, active=True, sync_menu=True):
         """Will generate a a new Star Coordinates view
            file: (String) path to the source file of the view
            [active=True]: set this view as the new active view
         """
-        view = StarCoordinatesView(alias, file)
+        view = StarCoordinatesView(alias, file, doc=self._doc,
+                                   activity_callback=self._record_action)
         self._view_menu_handler.add_view(alias, view)
         if active:
             self.set_active_view(alias)
@@ -60,10 +75,51 @@ class GeneralModel(object):
         file_ = new_file
         if not file_:
             file_ = self._active_view.get_file()
+        # Release the old view after adding the new one so reloading the
+        # same file reuses its shared dataset
+        old_view = self._active_view
         # Add view back again, synchronize for file change
         self.add_star_coordinates_view(alias, file_, sync_menu=False)
+        old_view.close()
         self._active_menu.synchronize_on_file_change()
 
+    def close(self):
+        """Releases the resources held by all the views of the model and
+           cancels the pending executions of its session
+        """
+        if self._doc.session_context is not None:
+            AlgorithmExecutor.cancel_session(self._doc.session_context.id)
+        for alias in self._view_menu_handler.get_available_views():
+            self._view_menu_handler.get_view_from_alias(alias).close()
+
+    def get_document(self):
+        return self._doc
+
+    def get_number_of_values(self):
+        """Returns: (int) number of values of the biggest view"""
+        return max([self._view_menu_handler.get_view_from_alias(alias).get_number_of_values()
+                    for alias in self._view_menu_handler.get_available_views()] or [0])
+
+    def get_memory_usage(self):
+        """Returns: (int) estimated bytes held by all the views of the model,
+                    including the datasets they share with other sessions
+        """
+        return sum(self._view_menu_handler.get_view_from_alias(alias).get_memory_usage()
+                   for alias in self._view_menu_handler.get_available_views())
+
+    def get_last_action(self):
+        """Returns: (String) name of the last action requested or None"""
+        return self._last_action
+
+    def get_idle_time(self):
+        """Returns: (float) seconds since the last action requested"""
+        return time.time() - self._last_action_time
+
+    def _record_action(self, action):
+        """action: (String) name of the action, from the menus or the figure"""
+        self._last_action = action
+        self._last_action_time = time.time()
+
     def init_layouts(self):
         GeneralModel.LOGGER.debug("Generating layouts")
         layout = self._get_layout()
@@ -95,6 +151,7 @@ class GeneralModel(object):
                               self._active_menu.get_outer_right_menu_layout())),
                    name='main_layout')
 
+    @_action
     def new_add_view_action(self, name=None):
         name = name
         filename = self._active_view.get_file()
@@ -109,47 +166,58 @@ class GeneralModel(object):
         self.init_layouts()
         return name
 
+    @_action
     def new_mapping_select_action(self, new):
         GeneralModel.LOGGER.info("Updating mapping algorithm to '%s'", new)
         self._active_view.update_mapping_algorithm(new)
 
+    @_action
     def new_normalization_select_action(self, new):
         GeneralModel.LOGGER.info("Updating normalization algorithm to '%s'", new)
         self._active_view.update_normalization_algorithm(new)
 
+    @_action
     def new_clustering_select_action(self, new):
         GeneralModel.LOGGER.info("Updating clustering algorithm to '%s'", new)
         self._active_view.update_clustering_algorithm(new)
 
+    @_action
     def new_error_select_action(self, new):
         GeneralModel.LOGGER.info("Updating error algorithm to '%s'", new)
         self._active_view.update_error_algorithm(new)
 
+    @_action
     def new_axis_select_action(self, new):
         GeneralModel.LOGGER.info("Selecting axis '%s'", new)
         self._active_view.update_selected_axis(new)
 
+    @_action
     def new_category_source_select_action(self, new):
         GeneralModel.LOGGER.info("Selecting category source '%s'", new)
         self._active_view.update_selected_category_source(new)
 
+    @_action
     def new_color_method_select(self, new):
         GeneralModel.LOGGER.info("Updating coloring method to '%s'", new)
         self._active_view.update_color_method(new)
 
+    @_action
     def new_palette_select_action(self, new):
         GeneralModel.LOGGER.info("Coloring using palette '%s'", new)
         self._active_view.update_palette(new)
 
+    @_action
     def new_file_select_action(self, filename):
         GeneralModel.LOGGER.info("Loading new file '%s'", filename)
         self.reset_active_view(filename)
         self.init_layouts()
 
+    @_action
     def new_classification_action(self, new):
         GeneralModel.LOGGER.info("Classifying with '%s'", new)
         self._active_view.update_classification_algorithm(new)
 
+    @_action
     def new_view_select_action(self, alias):
         GeneralModel.LOGGER.info("Setting active view: '%s'", alias)
         view = self._view_menu_handler.get_view_from_alias(alias)
@@ -160,31 +228,39 @@ class GeneralModel(object):
         self._active_menu.synchronize_menu()
         self.init_layouts()
 
+    @_action
     def new_number_of_clusters_action(self, new):
         self._active_view.update_number_of_clusters(new)
 
+    @_action
     def new_initial_size_action(self, new):
         self._active_view.update_initial_size_input(new)
 
+    @_action
     def new_final_size_action(self, new):
         self._active_view.update_final_size_input(new)
 
+    @_action
     def new_color_method_action(self, new):
         GeneralModel.LOGGER.info("Setting color method to: '%s'", new)
         self._active_view.update_color_method(new)
 
+    @_action
     def new_point_label_visibility_action(self, new):
         GeneralModel.LOGGER.info("Setting labels visibility to: '%s'", new)
         self._active_view.update_point_label_visibility(new)
 
+    @_action
     def new_select_point_action(self, new):
         GeneralModel.LOGGER.info("Selecting point '%s'", new)
         self._active_view.update_selected_point(new)
 
+    @_action
     def new_axis_checkboxgroup_action(self, new):
         GeneralModel.LOGGER.info("Updating axis with pair '%s'", new)
         self._active_view.update_axis_visibility(new)
 
+    @_action
     def new_hover_tips_checkboxgroup_action(self, new):
         GeneralModel.LOGGER.info("Updating hover tips with pair '%s'", new)
         self._active_view.update_hover_tips_visibility(new)
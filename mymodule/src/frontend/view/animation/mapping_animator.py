@@ -5,95 +5,149 @@
 from __future__ import division
 import logging
 import time
-import pandas as pd
-from ....backend.util.line_equation import calculate_line_equation
+import numpy as np
 
 
 class MappingAnimator(object):
     """Object that creates animations between two positions for points"""
     LOGGER = logging.getLogger(__name__)
-
-    def __init__(self, point_controller):
-        """source_points: (ColumnDataSource) source where to update the values
-        """
-        self._point_controller = point_controller
-
-    @staticmethod
-    def step_x_exponential(step_points_df, final_points, step, total_steps):
-        for i in range(0, len(step_points_df['x'])):
-            x0 = step_points_df['x'][i]
-            xf = final_points['x'][i]
-            step_points_df['x'][i] = x0 + step * (xf - x0) / total_steps
-        return step_points_df
+    # Maximum number of intermediate frames of an animation
+    MAX_STEPS = 30
+    # Maximum number of coordinates held by the frames buffer
+    # (steps X 2 X points). Limits the steps for big sets of points
+    MAX_BUFFER_SIZE = 2 ** 24
 
     @staticmethod
-    def step_x_constant(original_points, step_points_df, final_points, step, total_steps):
-        for i in range(0, len(original_points['x'])):
-            x0 = original_points['x'][i]
-            xf = final_points['x'][i]
-            step_points_df['x'][i] = x0 + step * (xf - x0) / total_steps
-        return step_points_df
+    def get_number_of_steps(n_points, max_steps=MAX_STEPS):
+        """n_points: (int) number of points to animate
+           [max_steps=MAX_STEPS]: (int) maximum number of frames
+           Returns: (int) number of frames fitting in the buffer, at least 1
+        """
+        buffer_steps = MappingAnimator.MAX_BUFFER_SIZE // max(2 * n_points, 1)
+        return int(max(1, min(max_steps, buffer_steps)))
 
     @staticmethod
-    def evaluate_y(points_df, formula):
-        points_df.eval('y = {}'.format(formula), inplace=True)
+    def get_frames(original_points, mapped_points, n_steps):
+        """Linearly interpolates the points from their original to their
+           mapped position. Unlike a y = mx + c formulation, vertical moves
+           are also supported
+           original_points: (pandas.Dataframe || dict) position of the points before
+           mapped_points: (pandas.Dataframe || dict) end position of the points
+           n_steps: (int) number of frames
+           Returns: (numpy.ndarray) contiguous buffer with shape
+                    (n_steps X 2 X points) where [step, 0] holds the x
+                    coordinates of that frame and [step, 1] the y ones.
+                    The last frame matches the mapped points
+        """
+        start = np.array([original_points['x'], original_points['y']], dtype=float)
+        end = np.array([mapped_points['x'], mapped_points['y']], dtype=float)
+        end -= start
+        fractions = np.arange(1, n_steps + 1, dtype=float) / n_steps
+        frames = np.empty((n_steps,) + start.shape, dtype=float)
+        np.multiply(fractions[:, np.newaxis, np.newaxis], end, out=frames)
+        frames += start
+        return frames
 
-    def calculate_time_cost(self, points_df, mapped_points, formula):
-        start_time = time.time()
-        MappingAnimator.step_x_exponential(points_df, mapped_points, 0, 1)
-        MappingAnimator.evaluate_y(points_df, formula)
-        self._point_controller.update_coordinates(points_df['x'], points_df['y'])
-        end_time = time.time()
-        time_cost = end_time - start_time
-        MappingAnimator.LOGGER.debug("Time cost: {}s".format(time_cost))
-        MappingAnimator.LOGGER.debug("Freq: {}s".format(1/time_cost))
-        return time_cost
+    def __init__(self, point_controller, doc=None):
+        """point_controller: (PointController) controller of the source where
+           the coordinates are updated
+           [doc=None]: (bokeh.document.Document) document of the session. When
+           it belongs to a server session the frames are pushed from periodic
+           callbacks of the IOLoop instead of blocking it
+        """
+        self._point_controller = point_controller
+        self._doc = doc
+        # State of the scheduled animation
+        self._frames = None
+        self._final_points = None
+        self._max_time = None
+        self._start_time = None
+        self._is_animating = False
+        # Coordinates of the last pushed frame
+        self._current_points = None
 
     def get_animation_sequence(self, original_points, mapped_points, max_time=2):
         """Will map the points for every step of the sequence by updating
-           the ColumnDataSource
+           the ColumnDataSource. If an animation is still running it is
+           cancelled and the new one starts from the current position of the
+           points, so rapid consecutive calls only animate the latest target
 
            original_points: (pandas.Dataframe) position of the points before
            mapped_points: (pandas.Dataframe) end position of the points
+           [max_time=2]: (float) seconds available for the animation
         """
+        if self._is_animating:
+            MappingAnimator.LOGGER.debug("Retargeting running animation")
+            self.cancel()
+            original_points = self._current_points
+        else:
+            self._current_points = original_points
+        n_steps = MappingAnimator.get_number_of_steps(len(mapped_points.index))
+        frames = MappingAnimator.get_frames(original_points, mapped_points, n_steps)
+        MappingAnimator.LOGGER.debug("Total steps: %s", n_steps)
+        if not self._in_server_session():
+            self._animate_blocking(frames, mapped_points, max_time)
+            return
+        self._frames = frames
+        self._final_points = mapped_points
+        self._max_time = max_time
+        self._start_time = time.time()
+        self._is_animating = True
+        period_milliseconds = max(1, int(1000 * max_time / n_steps))
+        self._doc.add_periodic_callback(self._push_scheduled_frame, period_milliseconds)
+
+    def cancel(self):
+        """Stops the running animation, leaving the points where they are"""
+        if not self._is_animating:
+            return
+        self._is_animating = False
+        self._frames = None
+        self._final_points = None
+        try:
+            self._doc.remove_periodic_callback(self._push_scheduled_frame)
+        except ValueError:
+            MappingAnimator.LOGGER.warn("Animation callback was already removed")
+
+    def is_animating(self):
+        return self._is_animating
 
-        # First, we get the cost time by simulating an animation from P0 to P'0
-        # where P'0 has the same coordinates (this way we include the
-        # rendering time without modifying the position)
-        # TODO gchicafernandez - Find a way to parallelize this. Takes forever!
-        step_points_cp, formula = self._get_equation_dataframe(original_points, mapped_points)
-        time_cost = self.calculate_time_cost(step_points_cp, mapped_points, formula)
-        total_steps = int(max_time // time_cost)
-        MappingAnimator.LOGGER.debug("Total steps: {}".format(total_steps))
-        for step in range(0, total_steps):
-            MappingAnimator.step_x_exponential(step_points_cp, mapped_points, step, total_steps)
-            MappingAnimator.evaluate_y(step_points_cp, formula)
-            self._point_controller.update_coordinates(step_points_cp['x'], step_points_cp['y'])
+    def _in_server_session(self):
+        return self._doc is not None and self._doc.session_context is not None
 
+    def _push_scheduled_frame(self):
+        """Periodic callback pushing the frame matching the elapsed time.
+           Pushes the final position and stops once the time is over
+        """
+        n_steps = len(self._frames)
+        elapsed_time = time.time() - self._start_time
+        step = int(n_steps * elapsed_time / self._max_time)
+        if step < n_steps - 1:
+            self._push_frame(self._frames[step, 0], self._frames[step, 1])
+            return
+        final_points = self._final_points
+        self.cancel()
+        self._push_frame(final_points['x'], final_points['y'])
         MappingAnimator.LOGGER.debug("Finished animation")
-        self._point_controller.update_coordinates(mapped_points['x'], mapped_points['y'])
 
-    def _get_equation_dataframe(self, original_points, mapped_points):
-        """Being the equation of the line: y = mx + c where m and c are
-           constants, this method will return a dataframe composed by the
-           following columns:
-           'x': x points (with values as per original_points df)
-           'm': calculated p constant for each point
-           'c': calculated c constant for each point
-           'y': equation 'mx + c'
+    def _animate_blocking(self, frames, mapped_points, max_time):
+        """Pushes the frames within the time budget from the current thread.
+           When pushing a frame takes longer than planned, the frames that no
+           longer fit are skipped
         """
-        formula = 'm * x + c'
-        original_points_cp = original_points.copy()
-        x_coords = zip(original_points['x'], mapped_points['x'])
-        y_coords = zip(original_points['y'], mapped_points['y'])
-        points = zip(x_coords, y_coords)
-        m_l = []
-        c_l = []
-        for x0x1, y0y1 in points:
-            m, c = calculate_line_equation(x0x1, y0y1)
-            m_l.append(m)
-            c_l.append(c)
-        original_points_cp['m'] = pd.Series(m_l, index=original_points_cp.index)
-        original_points_cp['c'] = pd.Series(c_l, index=original_points_cp.index)
+        n_steps = len(frames)
+        start_time = time.time()
+        step = 0
+        pushed_steps = 0
+        while step < n_steps - 1:
+            self._push_frame(frames[step, 0], frames[step, 1])
+            pushed_steps += 1
+            elapsed_time = time.time() - start_time
+            step = max(step + 1, int(n_steps * elapsed_time / max_time))
+
+        MappingAnimator.LOGGER.debug("Finished animation. Pushed %s of %s steps",
+                                     pushed_steps, n_steps)
+        self._push_frame(mapped_points['x'], mapped_points['y'])
 
-        return original_points_cp, formula
+    def _push_frame(self, x, y):
+        self._point_controller.update_coordinates(x, y)
+        self._current_points = dict(x=x, y=y)
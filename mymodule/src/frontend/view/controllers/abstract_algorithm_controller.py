@@ -3,6 +3,8 @@
 """
 import logging
 from abc import ABCMeta
+from concurrent.futures import Future
+from ....backend.util.algorithm_executor import AlgorithmExecutor
 
 class AbstractAlgorithmController(object):
     """Abstract class holding the common methods for all algorithm controllers
@@ -13,6 +15,29 @@ class AbstractAlgorithmController(object):
     LOGGER = logging.getLogger(__name__)
     NONE_ALGORITHM_ID = 'None'
 
+    @staticmethod
+    def _store_when_done(future, store):
+        """future: (concurrent.futures.Future) result of an algorithm
+           store: (Func) receives the result of the algorithm and stores it
+           Returns: (concurrent.futures.Future) completed once the result is
+                    stored, or cancelled or failed like the future
+        """
+        stored_future = Future()
+        def on_done(future):
+            if future.cancelled():
+                stored_future.cancel()
+            elif future.exception() is not None:
+                stored_future.set_exception(future.exception())
+            else:
+                try:
+                    store(future.result())
+                except Exception as exception:
+                    stored_future.set_exception(exception)
+                else:
+                    stored_future.set_result(None)
+        future.add_done_callback(on_done)
+        return stored_future
+
     def __init__(self, default_algorithm_id, algorithm_dict,
                  active_algorithm_id=None,
                  none_algorithm=False):
@@ -64,6 +89,16 @@ class AbstractAlgorithmController(object):
           raise ValueError('No active algorithm has been defined')
         return self._active_algorithm(*args, **kwargs)
 
+    def submit_active_algorithm(self, session_id, *args, **kwargs):
+        """Same as execute_active_algorithm but running the algorithm in the
+           process pool of the AlgorithmExecutor
+           session_id: (String) session requesting the execution
+           Returns: (concurrent.futures.Future) result of the algorithm
+        """
+        if not self.has_active_algorithm():
+          raise ValueError('No active algorithm has been defined')
+        return AlgorithmExecutor.submit(session_id, self._active_algorithm, *args, **kwargs)
+
     def get_all_options(self):
         """Returns a list of the available algorithm ids
            (i.e. the keys of the dictionary)
@@ -2,8 +2,12 @@
     Classification controller
 """
 import logging
+from concurrent.futures import Future
 from ....backend.algorithms.classification.classification_register import ClassificationRegister
 from ....backend.algorithms.classification.lda_classification import LDA_ID
+from ....backend.util.covariance_statistics import CovarianceStatistics, solve_from_statistics
+from ....backend.util.algorithm_executor import AlgorithmExecutor
+from ....backend.util.result_cache import ResultCache
 from .abstract_algorithm_controller import AbstractAlgorithmController
 
 class ClassificationController(AbstractAlgorithmController):
@@ -12,6 +16,17 @@ class ClassificationController(AbstractAlgorithmController):
        PCA or LDA
     """
     LOGGER = logging.getLogger(__name__)
+    # Relocated axis of the process, with the shape
+    # {(values fingerprint, algorithm_id, categories fingerprint), axis DataFrame}
+    CACHE = ResultCache('classification', 64 * 1024 ** 2)
+    # Covariance statistics of the process, with the shape
+    # {values fingerprint, CovarianceStatistics}
+    STATISTICS_CACHE = ResultCache('covariance statistics', 64 * 1024 ** 2)
+    # Number of values from which the scalable version of the algorithm is used
+    ROW_THRESHOLD = 100000
+    # Maximum number of dimensions for which the algorithms are solved from
+    # the covariance statistics
+    STATISTICS_MAX_DIMENSIONS = 500
 
     CLUSTER_SOURCE_ID = 'Clustering'
     NONE_SOURCE_ID = 'None'
@@ -41,21 +56,14 @@ class ClassificationController(AbstractAlgorithmController):
             return
         ClassificationController.LOGGER.debug("Relocating axis classifying with %s",
                                               self.get_active_algorithm_id())
-        categories = self.get_categories()
-        number_of_categories = len(set(categories))
-        relocated_axis = None
-        dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
-        if self._is_LDA_active():
-            if categories is None\
-               or number_of_categories == 0:
-                raise ValueError("Attempted to relocate with LDA but no categories\
-                                  were specified")
-            if number_of_categories < 3:
-                raise ValueError("Attempted to relocate with LDA with less than 3 categories")
-            relocated_axis = self.execute_active_algorithm(dimension_values_df_norm,
-                                                           categories)
+        dimension_values_df_norm, categories, cache_key = self._get_relocation_input()
+        relocated_axis = ClassificationController.CACHE.get(cache_key)
+        if relocated_axis is not None:
+            ClassificationController.LOGGER.debug("Reusing cached relocation")
         else:
-            relocated_axis = self.execute_active_algorithm(dimension_values_df_norm)
+            relocated_axis = self._execute_algorithm(dimension_values_df_norm,
+                                                     *self._get_algorithm_args(categories))
+            ClassificationController.CACHE.put(cache_key, relocated_axis)
         for source in self._axis_sources:
             axis_id = source.data['name'][0]
             if self._input_data_controller.is_label_active(axis_id):
@@ -64,6 +72,49 @@ class ClassificationController(AbstractAlgorithmController):
         ClassificationController.LOGGER.debug("Relocation completed")
         return relocated_axis
 
+    def submit_relocation(self, session_id):
+        """Runs the active algorithm in the process pool of the
+           AlgorithmExecutor, unless its relocation is already cached
+           session_id: (String) session requesting the relocation
+           Returns: (concurrent.futures.Future) completed once relocate_axis
+                    can reuse the relocation
+        """
+        stored_future = Future()
+        if not self.has_active_algorithm():
+            stored_future.set_result(None)
+            return stored_future
+        values_df, categories, cache_key = self._get_relocation_input()
+        if cache_key in ClassificationController.CACHE:
+            stored_future.set_result(None)
+            return stored_future
+        args = self._get_algorithm_args(categories)
+        def store(relocated_axis):
+            ClassificationController.CACHE.put(cache_key, relocated_axis)
+        statistics_algorithm = self._get_statistics_algorithm(values_df)
+        if statistics_algorithm is not None:
+            statistics_key = ResultCache.get_fingerprint(values_df)
+            statistics = ClassificationController.STATISTICS_CACHE.get(statistics_key)
+            if statistics is None:
+                # The statistics are computed in the worker too
+                future = AlgorithmExecutor.submit(session_id, solve_from_statistics,
+                                                  statistics_algorithm, values_df, *args)
+                def store_with_statistics(result):
+                    relocated_axis, statistics = result
+                    ClassificationController.STATISTICS_CACHE.put(statistics_key, statistics)
+                    store(relocated_axis)
+                return AbstractAlgorithmController._store_when_done(future,
+                                                                    store_with_statistics)
+            future = AlgorithmExecutor.submit(session_id, statistics_algorithm, values_df,
+                                              *args, statistics=statistics)
+        else:
+            scalable_algorithm = self._get_scalable_algorithm(values_df)
+            if scalable_algorithm is not None:
+                future = AlgorithmExecutor.submit(session_id, scalable_algorithm,
+                                                  values_df, *args)
+            else:
+                future = self.submit_active_algorithm(session_id, values_df, *args)
+        return AbstractAlgorithmController._store_when_done(future, store)
+
     def update_active_source(self, source_id):
         """Updates the classification source
            source_id: (String) one of the source ids provided by this class
@@ -140,6 +191,69 @@ class ClassificationController(AbstractAlgorithmController):
     def in_active_mode(self):
         return self.has_active_algorithm()
 
+    def _execute_algorithm(self, values_df, *args):
+        """Executes the version of the active algorithm solved from the
+           covariance statistics of the values, computed once per values, if
+           any. Otherwise its scalable version if there are too many values,
+           otherwise the algorithm itself
+        """
+        statistics_algorithm = self._get_statistics_algorithm(values_df)
+        if statistics_algorithm is not None:
+            statistics = ClassificationController.STATISTICS_CACHE\
+                         .get_or_compute(ResultCache.get_fingerprint(values_df),
+                                         lambda: CovarianceStatistics(values_df))
+            return statistics_algorithm(values_df, *args, statistics=statistics)
+        scalable_algorithm = self._get_scalable_algorithm(values_df)
+        if scalable_algorithm is not None:
+            return scalable_algorithm(values_df, *args)
+        return self.execute_active_algorithm(values_df, *args)
+
+    def _get_relocation_input(self):
+        """Returns: (pandas.DataFrame) last normalized values
+                    (List<String>) categories of the values
+                    (Tuple) key of their relocation in the cache
+        """
+        categories = self.get_categories()
+        dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
+        cache_key = (ResultCache.get_fingerprint(dimension_values_df_norm),
+                     self.get_active_algorithm_id(),
+                     ResultCache.get_fingerprint(categories) if self._is_LDA_active() else None)
+        return dimension_values_df_norm, categories, cache_key
+
+    def _get_algorithm_args(self, categories):
+        """Returns: (Tuple) arguments of the active algorithm after the values,
+                    the categories for LDA
+        """
+        if not self._is_LDA_active():
+            return ()
+        number_of_categories = len(set(categories))
+        if categories is None\
+           or number_of_categories == 0:
+            raise ValueError("Attempted to relocate with LDA but no categories\
+                              were specified")
+        if number_of_categories < 3:
+            raise ValueError("Attempted to relocate with LDA with less than 3 categories")
+        return (categories,)
+
+    def _get_statistics_algorithm(self, values_df):
+        """Returns: (Func) version of the active algorithm solved from the
+                    covariance statistics, if there are few enough
+                    dimensions, otherwise None
+        """
+        if len(values_df.columns) > ClassificationController.STATISTICS_MAX_DIMENSIONS:
+            return None
+        statistics_dict = ClassificationRegister.get_statistics_algorithm_dict()
+        return statistics_dict.get(self.get_active_algorithm_id())
+
+    def _get_scalable_algorithm(self, values_df):
+        """Returns: (Func) scalable version of the active algorithm if there
+                    are too many values for it, otherwise None
+        """
+        if len(values_df.index) < ClassificationController.ROW_THRESHOLD:
+            return None
+        scalable_dict = ClassificationRegister.get_scalable_algorithm_dict()
+        return scalable_dict.get(self.get_active_algorithm_id())
+
     def _is_LDA_active(self):
         return self.get_active_algorithm_id() == LDA_ID
 
@@ -152,7 +266,7 @@ class ClassificationController(AbstractAlgorithmController):
         if axis_id is None:
             axis_id = self._active_source
         ClassificationController.LOGGER.debug("Updating categories from axis '%s'", axis_id)
-        categories = self._input_data_controller.get_column_from_raw_input(axis_id).astype(str)
+        categories = self._input_data_controller.get_category_labels(axis_id)
         return categories
 
     def _get_categories_from_cluster(self):
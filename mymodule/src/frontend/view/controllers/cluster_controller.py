@@ -2,15 +2,44 @@
     Clustering controller
 """
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError, Future
+from ....backend.util.result_cache import ResultCache
+from ....backend.util.algorithm_executor import AlgorithmExecutor
 from ....backend.algorithms.clustering.clustering_register import ClusteringRegister
 from ....backend.algorithms.clustering.kmeans_clustering import KMEANS_ID
 from .abstract_algorithm_controller import AbstractAlgorithmController
 
 class ClusterController(AbstractAlgorithmController):
-    """Controls the clustering of the values for the values dataframe"""
+    """Controls the clustering of the values for the values dataframe.
+       Clusterings for the numbers of clusters around the selected one can be
+       precomputed in the background so changing it does not block
+    """
     LOGGER = logging.getLogger(__name__)
+    # Number of values from which the scalable version of the algorithm is used
+    ROW_THRESHOLD = 100000
+    # Inclusive range of numbers of clusters precomputed in the background
+    PRECOMPUTE_RANGE = (3, 10)
+    # Clusterings of the process, with the shape
+    # {(values fingerprint, algorithm_id, n_clusters), categories}
+    CACHE = ResultCache('clustering', 256 * 1024 ** 2)
+    # Workers shared by all the controllers of the process
+    MAX_WORKERS = 2
+    _EXECUTOR = None
+    _EXECUTOR_LOCK = threading.Lock()
 
-    def __init__(self, normalization_controller, algorithm_id=None, n_clusters=3):
+    @staticmethod
+    def _get_executor():
+        with ClusterController._EXECUTOR_LOCK:
+            if ClusterController._EXECUTOR is None:
+                ClusterController._EXECUTOR = ThreadPoolExecutor(ClusterController.MAX_WORKERS)
+            return ClusterController._EXECUTOR
+
+    def __init__(self, normalization_controller, algorithm_id=None, n_clusters=3,
+                 row_threshold=ROW_THRESHOLD):
+        """[row_threshold=ROW_THRESHOLD]: (int) number of values from which the
+           scalable version of the algorithm is used. None to never use it
+        """
         algorithm_dict = ClusteringRegister.get_algorithm_dict()
         super(ClusterController, self).\
               __init__(KMEANS_ID,
@@ -18,26 +47,129 @@ class ClusterController(AbstractAlgorithmController):
                        active_algorithm_id=algorithm_id,
                        none_algorithm=True)
         self._normalization_controller = normalization_controller
-        self._clustering_dic = dict()
         self._n_clusters = n_clusters
+        self._row_threshold = row_threshold
+        # dictionary with the shape {(algorithm_id, n_clusters), centroids}
+        # of the scalable clusterings, used to warm-start the next ones
+        self._centroids_dic = dict()
+        # Last normalized values clustered and their fingerprint
+        self._values_df = None
+        self._fingerprint = None
+        # dictionary with the shape {(algorithm_id, n_clusters), Future}
+        # of the clusterings of the last values being computed in the background
+        self._future_dic = dict()
+        self._lock = threading.RLock()
 
     def execute_clustering(self):
-        """dimension_values_df_norm: (pandas.Dataframe) values of the points
+        """Clusters the last normalized values, waiting for the background
+           clustering if it is already running
+           Returns: (List<String>) list of category labels matching the values
+                    or None if there is no active algorithm
         """
         if not self.has_active_algorithm():
             ClusterController.LOGGER.warn("Could not execute clustering because "
                                           "there is no active algorithm")
-            return
+            return None
         dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
+        self._check_values(dimension_values_df_norm)
         algorithm_id = self.get_active_algorithm_id()
-        categories = None
         pair_key = (algorithm_id, self._n_clusters)
-        if pair_key in self._clustering_dic:
-            categories = self._clustering_dic[pair_key]
+        with self._lock:
+            future = self._future_dic.get(pair_key)
+            # Queued clusterings are computed here instead of waiting for
+            # the ones ahead of them
+            if future is not None and future.cancel():
+                self._future_dic.pop(pair_key)
+                future = None
+        if future is not None:
+            ClusterController.LOGGER.debug("Waiting for background clustering %s", pair_key)
+            try:
+                future.result()
+            except CancelledError:
+                pass
+        n_clusters = self._n_clusters
+        return ClusterController.CACHE.get_or_compute(self._get_cache_key(algorithm_id,
+                                                                          n_clusters),
+                                                      lambda: self._cluster(
+                                                          dimension_values_df_norm,
+                                                          algorithm_id, n_clusters))
+
+    def submit_clustering(self, session_id):
+        """Runs the clustering of the selected number of clusters in the
+           process pool of the AlgorithmExecutor, unless it is already cached
+           or being computed in the background
+           session_id: (String) session requesting the clustering. Its
+           cancellation cancels the background clustering too
+           Returns: (concurrent.futures.Future) completed once the categories
+                    are available through get_categories
+        """
+        stored_future = Future()
+        if not self.has_active_algorithm():
+            stored_future.set_result(None)
+            return stored_future
+        dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
+        self._check_values(dimension_values_df_norm)
+        algorithm_id = self.get_active_algorithm_id()
+        n_clusters = self._n_clusters
+        cache_key = self._get_cache_key(algorithm_id, n_clusters)
+        with self._lock:
+            background_future = self._future_dic.get((algorithm_id, n_clusters))
+        if background_future is not None:
+            AlgorithmExecutor.track(session_id, background_future)
+            return background_future
+        if cache_key in ClusterController.CACHE:
+            stored_future.set_result(None)
+            return stored_future
+
+        scalable = self._should_scale(dimension_values_df_norm, algorithm_id)
+        if scalable:
+            scalable_algorithm = ClusterController._get_scalable_algorithm(algorithm_id)
+            init_centroids = self._get_init_centroids(algorithm_id, n_clusters)
+            future = AlgorithmExecutor.submit(session_id, scalable_algorithm,
+                                              dimension_values_df_norm, n_clusters=n_clusters,
+                                              init_centroids=init_centroids)
         else:
-            categories = self.execute_active_algorithm(dimension_values_df_norm,
-                                                       n_clusters=self._n_clusters)
-            self._clustering_dic[pair_key] = categories
+            future = self.submit_active_algorithm(session_id, dimension_values_df_norm,
+                                                  n_clusters=n_clusters)
+        def store(categories):
+            if scalable:
+                categories, centroids = categories
+                self._store_centroids(dimension_values_df_norm, algorithm_id,
+                                      n_clusters, centroids)
+            ClusterController.CACHE.put(cache_key, categories)
+        return AbstractAlgorithmController._store_when_done(future, store)
+
+    def precompute_clusterings(self, n_clusters_range=PRECOMPUTE_RANGE):
+        """Computes in the background the clusterings of the active algorithm
+           for the range of numbers of clusters, closest to the selected one
+           first. Background clusterings of previous values are cancelled
+           [n_clusters_range=PRECOMPUTE_RANGE]: (Tuple<int>) inclusive range
+        """
+        if not self.has_active_algorithm():
+            return
+        dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
+        self._check_values(dimension_values_df_norm)
+        algorithm_id = self.get_active_algorithm_id()
+        all_n_clusters = sorted(range(n_clusters_range[0], n_clusters_range[1] + 1),
+                                key=lambda n_clusters: abs(n_clusters - self._n_clusters))
+        executor = ClusterController._get_executor()
+        with self._lock:
+            for n_clusters in all_n_clusters:
+                pair_key = (algorithm_id, n_clusters)
+                if pair_key in self._future_dic\
+                   or self._get_cache_key(algorithm_id, n_clusters) in ClusterController.CACHE:
+                    continue
+                self._future_dic[pair_key] = executor.submit(self._precompute_clustering,
+                                                             dimension_values_df_norm,
+                                                             self._fingerprint,
+                                                             algorithm_id, n_clusters)
+
+    def cancel_precomputation(self):
+        """Cancels the background clusterings that have not started yet"""
+        with self._lock:
+            for future in self._future_dic.values():
+                future.cancel()
+            self._future_dic = dict()
 
     def update_number_of_clusters(self, n_clusters):
         if n_clusters < 3:
@@ -49,13 +181,104 @@ class ClusterController(AbstractAlgorithmController):
         return self._n_clusters
 
     def get_categories(self):
-        active_algorithm_id = self.get_active_algorithm_id()
-        pair_key = (active_algorithm_id, self._n_clusters)
-        if not pair_key in self._clustering_dic:
-            ClusterController.LOGGER.warn("""No categories were found for pair
-                                             (%s, %s)""", active_algorithm_id,
-                                             self._n_clusters)
+        """Returns: (List<String>) copy of the category labels of the last
+                    normalized values, clustering them if they were not yet
+        """
+        categories = self.execute_clustering()
+        if categories is None:
+            ClusterController.LOGGER.warn("No categories were found for pair (%s, %s)",
+                                          self.get_active_algorithm_id(), self._n_clusters)
             return []
-        categories = self._clustering_dic[pair_key]
         # Return a copy
         return categories[:]
+
+    def _get_cache_key(self, algorithm_id, n_clusters, fingerprint=None):
+        """Returns: (Tuple) key of the clustering of the last normalized values
+                    or those with the given fingerprint
+        """
+        if fingerprint is None:
+            fingerprint = self._fingerprint
+        return (fingerprint, algorithm_id, n_clusters)
+
+    def _check_values(self, values_df):
+        """Fingerprints the normalized values when they change, cancelling
+           the background clusterings of the previous ones. Clusterings of
+           the previous values are kept in the cache for when they come back
+        """
+        with self._lock:
+            if values_df is self._values_df:
+                return
+            ClusterController.LOGGER.debug("Normalized values changed")
+            self.cancel_precomputation()
+            self._centroids_dic = dict()
+            self._values_df = values_df
+            self._fingerprint = ResultCache.get_fingerprint(values_df)
+
+    def _precompute_clustering(self, values_df, fingerprint, algorithm_id, n_clusters):
+        """Background task computing and storing a single clustering"""
+        cache_key = self._get_cache_key(algorithm_id, n_clusters, fingerprint=fingerprint)
+        try:
+            ClusterController.CACHE.get_or_compute(cache_key,
+                                                   lambda: self._cluster(values_df, algorithm_id,
+                                                                         n_clusters))
+        except Exception:
+            ClusterController.LOGGER.warn("Background clustering %s failed", cache_key,
+                                          exc_info=True)
+        finally:
+            with self._lock:
+                if fingerprint == self._fingerprint:
+                    self._future_dic.pop((algorithm_id, n_clusters), None)
+
+    def _cluster(self, values_df, algorithm_id, n_clusters):
+        """Returns: (List<String>) list of category labels matching input values"""
+        if self._should_scale(values_df, algorithm_id):
+            return self._execute_scalable_algorithm(values_df, algorithm_id, n_clusters)
+        ClusterController.LOGGER.debug("Clustering with %s and %s clusters",
+                                       algorithm_id, n_clusters)
+        _, algorithm = self._get_algorithm(algorithm_id)
+        return algorithm(values_df, n_clusters=n_clusters)
+
+    def _should_scale(self, values_df, algorithm_id):
+        """Returns: (Boolean) True if there are too many values for the
+                    algorithm and it has a scalable version
+        """
+        return self._row_threshold is not None\
+               and len(values_df.index) >= self._row_threshold\
+               and self._get_scalable_algorithm(algorithm_id) is not None
+
+    @staticmethod
+    def _get_scalable_algorithm(algorithm_id):
+        """Returns: (Func) scalable version of the algorithm or None"""
+        scalable_dict = ClusteringRegister.get_scalable_algorithm_dict()
+        return scalable_dict.get(algorithm_id)
+
+    def _execute_scalable_algorithm(self, values_df, algorithm_id, n_clusters):
+        """Executes the scalable algorithm warm-starting from the centroids of
+           the clustering with one cluster more or less, if any
+           Returns: (List<String>) list of category labels matching input values
+        """
+        ClusterController.LOGGER.debug("Clustering %s values with the scalable %s",
+                                       len(values_df.index), algorithm_id)
+        scalable_algorithm = ClusterController._get_scalable_algorithm(algorithm_id)
+        categories, centroids = scalable_algorithm(values_df, n_clusters=n_clusters,
+                                                   init_centroids=self._get_init_centroids(
+                                                       algorithm_id, n_clusters))
+        self._store_centroids(values_df, algorithm_id, n_clusters, centroids)
+        return categories
+
+    def _get_init_centroids(self, algorithm_id, n_clusters):
+        """Returns: (numpy.ndarray) centroids of the clustering of the last
+                    values with one cluster more or less, or None
+        """
+        with self._lock:
+            for near_n_clusters in (n_clusters - 1, n_clusters + 1):
+                if (algorithm_id, near_n_clusters) in self._centroids_dic:
+                    ClusterController.LOGGER.debug("Warm-starting from %s clusters",
+                                                   near_n_clusters)
+                    return self._centroids_dic[(algorithm_id, near_n_clusters)]
+        return None
+
+    def _store_centroids(self, values_df, algorithm_id, n_clusters, centroids):
+        with self._lock:
+            if values_df is self._values_df:
+                self._centroids_dic[(algorithm_id, n_clusters)] = centroids
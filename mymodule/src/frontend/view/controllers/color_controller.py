@@ -3,14 +3,18 @@
 """
 import logging
 import numpy as np
-from pandas import DataFrame
+import pandas as pd
 from bokeh.palettes import inferno, grey, viridis
+from ....backend.util.online_statistics import OnlineStatistics
+from ...bokeh_extension.palette_color_mapper import PaletteColorMapper
 
 class ColorController(object):
     """Controls the color of the elements based on the selected method
        and the active palette. When coloring by classification only one
        type of palette will be available. The rest of palettes are
-       available when an axis is selected
+       available when an axis is selected. The points receive the index of
+       their color in the palette, mapped to it in the browser by the color
+       mapper, so switching the palette only sends the new one
     """
     LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +45,10 @@ class ColorController(object):
     NONE_METHOD_ID = 'None'
     NONE_AXIS_ID = 'None'
     DEFAULT_METHOD_ID = NONE_METHOD_ID
+    # Number of palette indexes the values of an axis are binned into
+    LEVELS = 256
+    # Color of the points without value in the colored axis
+    NAN_COLOR = "gray"
 
     @staticmethod
     def _get_axis_palette_dict():
@@ -59,19 +67,34 @@ class ColorController(object):
         self._normalization_controller = normalization_controller
         self._classification_controller = classification_controller
         self._point_controller = point_controller
+        # Maps the palette index of every point to its color
+        self._color_mapper = PaletteColorMapper(palette=ColorController.NONE_PALETTE,
+                                                low=0, high=len(ColorController.NONE_PALETTE),
+                                                nan_color=ColorController.NAN_COLOR,
+                                                source=point_controller.get_source())
+        # dictionary with the shape {axis_id, palette indexes} of the axes colored
+        self._axis_index_dic = dict()
         self._active_palette_id = ColorController.NONE_PALETTE_ID
         self._selected_axis_id = ColorController.NONE_AXIS_ID
-        self.update_palette(palette_id)
         self._active_method = ColorController.DEFAULT_METHOD_ID
         # Prevents any coloring when a user has selected a valid point
         # Note that the name must be unique
         self._selected_point_name = None
+        self.update_palette(palette_id)
 
     def update_palette(self, palette_id):
         if palette_id not in self._palette_dict:
             ColorController.LOGGER.warn("Palette id '%s' is not known", palette_id)
         else:
             self._active_palette_id = palette_id
+            if self.in_axis_mode() and not self._selected_point_name:
+                self._color_mapper.palette = self._get_palette()
+
+    def get_color_mapper(self):
+        """Returns: (PaletteColorMapper) mapper of the color column of the
+                    points to their colors
+        """
+        return self._color_mapper
 
     def update_colors(self):
         """Update points' color accoring to selected method and axis or categories"""
@@ -142,12 +165,12 @@ class ColorController(object):
         return self._selected_point_name
 
     def _update_colors_by_point(self, point_name):
-        new_colors = [ColorController.POINT_UNSELECTED_COLOR\
-                      if name != point_name\
-                      else ColorController.POINT_SELECTED_COLOR\
-                      for name in self._point_controller.get_point_names()]
-
-        self._point_controller.update_colors(new_colors)
+        palette = [ColorController.POINT_UNSELECTED_COLOR, ColorController.POINT_SELECTED_COLOR]
+        palette_indexes = np.zeros(self._point_controller.get_number_of_points(), dtype=np.uint8)
+        row = self._point_controller.get_point_index(point_name)
+        if row is not None:
+            palette_indexes[row] = 1
+        self._map_source_points_color(palette_indexes, palette)
 
     def in_axis_mode(self):
         return self._active_method == ColorController.AXIS_METHOD_ID
@@ -158,23 +181,53 @@ class ColorController(object):
     def _color_points_by_initial_settings(self):
         """Will set the color of all points based on the initial palette"""
         ColorController.LOGGER.debug("Coloring by initial settings")
-        palette_index_list = np.zeros(self._input_data_controller.get_number_of_values())
-        self._map_source_points_color(palette_index_list, ColorController.NONE_PALETTE)
+        palette_indexes = np.zeros(self._input_data_controller.get_number_of_values(),
+                                   dtype=np.uint8)
+        self._map_source_points_color(palette_indexes, ColorController.NONE_PALETTE)
 
     def _color_points_by_axis(self):
-        # get index of colors, we normalize by Feature Scaling to get all values between 0 and 1
-        # and then multiply by the length of the palette
         ColorController.LOGGER.debug("Coloring by axis '%s'", self._selected_axis_id)
         if self._selected_axis_id == ColorController.NONE_AXIS_ID:
             ColorController.LOGGER.warn("No coloring was made since selected axis was None")
             return
-        active_palette = self._get_palette()
-        values_df = self._input_data_controller.get_dimensional_values(filtered=False)
-        column_norm = self._normalization_controller\
-                      .normalize_feature_scaling(values_df)[self._selected_axis_id]
-        palette_index_list = (column_norm * len(active_palette) - 1).astype(int)
-        # map index with color in the palette and assign to points
-        self._map_source_points_color(palette_index_list, active_palette)
+        # The palette is resampled to the levels by the color mapper
+        self._map_source_points_color(self._get_axis_indexes(self._selected_axis_id),
+                                      self._get_palette(), levels=ColorController.LEVELS)
+
+    def _get_axis_indexes(self, axis_id):
+        """Bins the values of the axis into LEVELS equal intervals between
+           their minimum and maximum. Missing values get a NaN index, which
+           the color mapper draws with NAN_COLOR
+           Returns: (numpy.ndarray) palette index of every point
+        """
+        if axis_id in self._axis_index_dic:
+            return self._axis_index_dic[axis_id]
+        values = self._input_data_controller.get_dimensional_values(filtered=False)[axis_id]\
+                     .values.astype(float)
+        minimum, maximum = self._get_axis_bounds(axis_id, values)
+        if not maximum > minimum:
+            palette_indexes = np.zeros(len(values), dtype=np.uint8)
+        else:
+            bins = np.linspace(minimum, maximum, ColorController.LEVELS + 1)[1:-1]
+            palette_indexes = np.digitize(values, bins).astype(np.uint8)
+        missing = np.isnan(values)
+        if missing.any():
+            palette_indexes = palette_indexes.astype(np.float32)
+            palette_indexes[missing] = np.nan
+        self._axis_index_dic[axis_id] = palette_indexes
+        return palette_indexes
+
+    def _get_axis_bounds(self, axis_id, values):
+        """Returns: (float, float) minimum and maximum of the axis, from the
+                    statistics of the input if they are known
+        """
+        statistics = self._input_data_controller.get_statistics()
+        if statistics is not None and statistics.has_columns([axis_id]):
+            minimum = statistics.get_statistic(OnlineStatistics.MINIMUM, [axis_id])[0]
+            maximum = statistics.get_statistic(OnlineStatistics.MAXIMUM, [axis_id])[0]
+            if np.isfinite(minimum) and np.isfinite(maximum):
+                return minimum, maximum
+        return np.nanmin(values), np.nanmax(values)
 
     def _color_points_by_categories(self):
         ColorController.LOGGER.debug("Coloring by category")
@@ -184,43 +237,43 @@ class ColorController(object):
             return
         palette = ColorController.CATEGORY_PALETTE
         # Map each category into a specific index
-        palette_index_list = self._get_palette_index_list(categories, palette)
-        self._map_source_points_color(palette_index_list, ColorController.CATEGORY_PALETTE)
-
-    def _map_source_points_color(self, palette_index_list, palette):
-        max_index_list = max(palette_index_list)
-        max_index_palette = len(palette) - 1
-        if max_index_list > max_index_palette:
+        palette_indexes = self._get_palette_index_list(categories, palette)
+        self._map_source_points_color(palette_indexes, palette)
+
+    def _map_source_points_color(self, palette_indexes, palette, levels=None):
+        """palette_indexes: (numpy.ndarray) index of the color of every point
+           palette: (List<String>) colors of the points
+           [levels=None]: (int) number of indexes the palette is resampled to,
+           its length by default
+        """
+        if levels is None:
+            levels = len(palette)
+        max_index = np.nanmax(palette_indexes) if np.isfinite(palette_indexes).any() else 0
+        if max_index >= levels:
             ColorController.LOGGER.warn(("Max index (%s) in palette index list is"
                                          "higher than the palette one (%s), "
                                          "higher indexes will be assigned the "
                                          "highest palette value"),
-                                        max_index_list, max_index_palette)
-        new_colors = [palette[min(max_index_palette, index)]
-                      for index in palette_index_list]
-        self._point_controller.update_colors(new_colors)
+                                        max_index, levels - 1)
+        # Only the properties that change are sent
+        if list(self._color_mapper.palette) != list(palette):
+            self._color_mapper.palette = palette
+        if self._color_mapper.high != levels:
+            self._color_mapper.high = levels
+        self._point_controller.update_colors(palette_indexes)
 
     def _get_palette(self):
         return self._palette_dict[self._active_palette_id]
 
-    def _get_palette_index_list(self, categories, palette):
+    @staticmethod
+    def _get_palette_index_list(categories, palette):
         """Receives a list of category elements, of any type, and returns
-           a list of numeric values which are the indexes of the palette
+           the indexes of the palette distributing them over it, in order of
+           appearance
+           Returns: (numpy.ndarray) palette index of every element
         """
-        palette_index_list = []
-        category_dict = dict()
-        shift = 0
-        for category in categories:
-            if not category in category_dict:
-                category_dict[category] = shift
-                shift += 1
-            palette_index_list.append(category_dict[category])
-        # Once we have the categories indexed, we normalize and multiply
-        # by the length of the palette in order to distribute the values
-        # return palette_index_list
-
-        # _ is what you use when you run out of ideas for names
-        _ = self._normalization_controller\
-                .normalize_feature_scaling(DataFrame(palette_index_list))
-
-        return (_ * (len(palette) - 1)).astype(int)[0]
+        category_indexes = pd.factorize(np.asarray(categories, dtype=object))[0]
+        n_categories = category_indexes.max() + 1
+        if n_categories < 2:
+            return np.zeros(len(category_indexes), dtype=np.uint8)
+        return (category_indexes * (len(palette) - 1) // (n_categories - 1)).astype(np.uint8)
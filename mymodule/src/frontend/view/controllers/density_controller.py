@@ -0,0 +1,261 @@
+"""
+    Density Controller
+"""
+from __future__ import division
+import logging
+import numpy as np
+from bokeh.models import ColumnDataSource, CustomJS, HoverTool
+
+
+class DensityController(object):
+    """Controls the level of detail of the points. When more than
+       POINT_THRESHOLD points are in the visible region of the figure, they
+       are binned in the server into an image of their density instead of
+       sending one glyph per point to the browser. Zooming into a region with
+       fewer points draws them individually again, with their hover. All the
+       rows are kept by the PointController, so searching a point works on
+       them anyway and the selected point is always drawn. While aggregated,
+       the point nearest to the cursor is drawn too, so it shows its hover
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Number of visible points from which their density is drawn instead
+    POINT_THRESHOLD = 200000
+    # Pixels of the figure per bin of the density image
+    BIN_PIXELS = 4
+    # Colors of the bins, from the least to the most dense
+    PALETTE = ['#C6DBEF', '#9ECAE1', '#6BAED6', '#4292C6', '#2171B5', '#08519C', '#08306B']
+    ALPHA = 200
+    # Bins around the cursor where the nearest point is looked for
+    HOVER_BINS = 2
+    # Sends the position of the cursor to the server while aggregated, only
+    # when it enters another bin of the image
+    _CURSOR_CODE = """
+var data = image.data;
+if (data['image'].length == 0) {
+    return;
+}
+var x = cb_data['geometry'].x;
+var y = cb_data['geometry'].y;
+function get_bin(x, y) {
+    return [Math.floor((x - data['x'][0]) / data['bin_width'][0]),
+            Math.floor((y - data['y'][0]) / data['bin_height'][0])];
+}
+if (cursor.data['x'].length > 0) {
+    var last_bin = get_bin(cursor.data['x'][0], cursor.data['y'][0]);
+    var bin = get_bin(x, y);
+    if (bin[0] == last_bin[0] && bin[1] == last_bin[1]) {
+        return;
+    }
+}
+cursor.data = {x: [x], y: [y]};
+"""
+    _EMPTY_IMAGE = dict(image=[], x=[], y=[], dw=[], dh=[], bin_width=[], bin_height=[])
+
+    @staticmethod
+    def _get_bounds(range_, values):
+        """Returns: (float, float) visible bounds of the range, or those of
+                    the values if the browser has not set them yet
+        """
+        start = end = None
+        if range_ is not None:
+            start, end = range_.start, range_.end
+        if start is None or end is None:
+            finite_values = values[np.isfinite(values)]
+            if not len(finite_values):
+                return 0., 1.
+            start, end = finite_values.min(), finite_values.max()
+        start, end = min(start, end), max(start, end)
+        if start == end:
+            start, end = start - 0.5, end + 0.5
+        return float(start), float(end)
+
+    @staticmethod
+    def _to_rgba(counts):
+        """counts: (numpy.ndarray) y_bins X x_bins number of points
+           Returns: (numpy.ndarray) uint32 RGBA image, log scaled through the
+                    palette and transparent where there are no points
+        """
+        palette = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)]
+                            + [DensityController.ALPHA]
+                            for color in DensityController.PALETTE], dtype=np.uint8)
+        levels = np.log1p(counts)
+        levels *= (len(palette) - 1) / max(levels.max(), 1e-12)
+        rgba = palette[np.round(levels).astype(int)]
+        rgba[counts == 0] = 0
+        return rgba.view(np.uint32).reshape(counts.shape)
+
+    def __init__(self, point_controller, width, height, point_threshold=POINT_THRESHOLD,
+                 doc=None, activity_callback=None):
+        """point_controller: (PointController) whose rows are selected
+           width: (int) pixels of the figure
+           height: (int) pixels of the figure
+           [point_threshold=POINT_THRESHOLD]: (int) number of visible points
+           from which their density is drawn
+           [doc=None]: (bokeh.document.Document) document of the session. When
+           it belongs to a server session the rows are selected once per tick
+           [activity_callback=None]: (Func) receives 'range_change' when the
+           user pans or zooms the figure and 'hover' when the cursor moves
+        """
+        self._point_controller = point_controller
+        self._doc = doc
+        self._activity_callback = activity_callback
+        self._bins = (max(width // DensityController.BIN_PIXELS, 1),
+                      max(height // DensityController.BIN_PIXELS, 1))
+        self._point_threshold = point_threshold
+        self._image_source = ColumnDataSource(dict(DensityController._EMPTY_IMAGE))
+        # Corners of all the points, drawn invisible so the figure fits them
+        # all when reset even if only some of them are drawn
+        self._bounds_source = ColumnDataSource(dict(x=[], y=[]))
+        # Position of the cursor over the aggregated points
+        self._cursor_source = ColumnDataSource(dict(x=[], y=[]))
+        self._cursor_source.on_change('data', self._on_cursor_change)
+        self._x_range = None
+        self._y_range = None
+        # Size of the bins of the image in data units
+        self._bin_size = None
+        # Coordinates and bounds the image was drawn for
+        self._image_key = None
+        self._selected_index = None
+        self._hovered_index = None
+        self._is_selection_scheduled = False
+        point_controller.set_row_selector(self.select_rows)
+
+    def get_image_source(self):
+        return self._image_source
+
+    def is_aggregated(self):
+        """Returns: (Boolean) True if the density of the points is drawn"""
+        return len(self._image_source.data['image']) > 0
+
+    def set_figure(self, figure_):
+        """Draws the density image on the figure, selecting the rows again
+           whenever its visible region changes
+        """
+        self._x_range = figure_.x_range
+        self._y_range = figure_.y_range
+        figure_.image_rgba(image='image', x='x', y='y', dw='dw', dh='dh',
+                           source=self._image_source)
+        bounds = figure_.circle('x', 'y', size=0, alpha=0, source=self._bounds_source)
+        figure_.add_tools(HoverTool(tooltips=None, renderers=[bounds],
+                                    callback=CustomJS(args=dict(cursor=self._cursor_source,
+                                                                image=self._image_source),
+                                                      code=DensityController._CURSOR_CODE)))
+        for range_ in (self._x_range, self._y_range):
+            range_.on_change('start', self._on_range_change)
+            range_.on_change('end', self._on_range_change)
+        self._point_controller.select_rows()
+
+    def select_point(self, name):
+        """Draws the point even if the others are aggregated
+           name: (String) point selected or None to unselect it
+        """
+        self._selected_index = self._point_controller.get_point_index(name)\
+                               if name is not None else None
+        self._point_controller.select_rows()
+
+    def select_rows(self, x, y):
+        """Row selector of the PointController
+           x: (numpy.ndarray) x of all the points
+           y: (numpy.ndarray) y of all the points
+           Returns: (numpy.ndarray) indices of the rows drawn individually or
+                    None if all of them are
+        """
+        if len(x) <= self._point_threshold:
+            self._clear_image()
+            return None
+        x_bounds = DensityController._get_bounds(self._x_range, x)
+        y_bounds = DensityController._get_bounds(self._y_range, y)
+        if self._is_image_current(x, y, x_bounds, y_bounds):
+            # Only the hovered or selected points change
+            visible = np.zeros(len(x), dtype=bool)
+        else:
+            self._update_bounds(x, y)
+            visible = (x >= x_bounds[0]) & (x <= x_bounds[1])\
+                      & (y >= y_bounds[0]) & (y <= y_bounds[1])
+            if np.count_nonzero(visible) <= self._point_threshold:
+                DensityController.LOGGER.debug("Drawing the visible points")
+                self._clear_image()
+            else:
+                self._update_image(x[visible], y[visible], x_bounds, y_bounds)
+                self._image_key = (x, y, x_bounds, y_bounds)
+                visible[:] = False
+        if self.is_aggregated() and self._hovered_index is not None:
+            visible[self._hovered_index] = True
+        if self._selected_index is not None:
+            visible[self._selected_index] = True
+        return np.flatnonzero(visible)
+
+    def _is_image_current(self, x, y, x_bounds, y_bounds):
+        """Returns: (Boolean) True if the image was drawn for the same
+                    coordinates and bounds
+        """
+        if self._image_key is None:
+            return False
+        image_x, image_y, image_x_bounds, image_y_bounds = self._image_key
+        return image_x_bounds == x_bounds and image_y_bounds == y_bounds\
+               and (image_x is x or np.array_equal(image_x, x))\
+               and (image_y is y or np.array_equal(image_y, y))
+
+    def _on_range_change(self, attr, old, new):
+        self._record_activity('range_change')
+        self._schedule_row_selection()
+
+    def _on_cursor_change(self, attr, old, new):
+        self._record_activity('hover')
+        self._schedule_row_selection()
+
+    def _record_activity(self, action):
+        if self._activity_callback is not None:
+            self._activity_callback(action)
+
+    def _schedule_row_selection(self):
+        """Selects the rows again on the next tick of the session, once for
+           all the changes of the ranges and the cursor received meanwhile
+        """
+        if self._doc is None or self._doc.session_context is None:
+            self._select_rows()
+        elif not self._is_selection_scheduled:
+            self._is_selection_scheduled = True
+            self._doc.add_next_tick_callback(self._select_rows)
+
+    def _select_rows(self):
+        self._is_selection_scheduled = False
+        self._update_hovered_index()
+        self._point_controller.select_rows()
+
+    def _update_hovered_index(self):
+        """Looks for the point nearest to the cursor while aggregated"""
+        self._hovered_index = None
+        cursor = self._cursor_source.data
+        if not self.is_aggregated() or not len(cursor['x']):
+            return
+        name = self._point_controller.get_nearest_point(
+            cursor['x'][0], cursor['y'][0],
+            max_distance=DensityController.HOVER_BINS * self._bin_size)
+        if name is not None:
+            self._hovered_index = self._point_controller.get_point_index(name)
+
+    def _update_image(self, x, y, x_bounds, y_bounds):
+        DensityController.LOGGER.debug("Drawing the density of %s points", len(x))
+        counts, _, _ = np.histogram2d(x, y, bins=self._bins, range=[x_bounds, y_bounds])
+        # The rows of the image go along y
+        image = DensityController._to_rgba(counts.T)
+        bin_width = (x_bounds[1] - x_bounds[0]) / self._bins[0]
+        bin_height = (y_bounds[1] - y_bounds[0]) / self._bins[1]
+        self._bin_size = max(bin_width, bin_height)
+        self._image_source.data = dict(image=[image], x=[x_bounds[0]], y=[y_bounds[0]],
+                                       dw=[x_bounds[1] - x_bounds[0]],
+                                       dh=[y_bounds[1] - y_bounds[0]],
+                                       bin_width=[bin_width], bin_height=[bin_height])
+
+    def _update_bounds(self, x, y):
+        x_bounds = DensityController._get_bounds(None, x)
+        y_bounds = DensityController._get_bounds(None, y)
+        bounds_dic = dict(x=list(x_bounds), y=list(y_bounds))
+        if self._bounds_source.data != bounds_dic:
+            self._bounds_source.data = bounds_dic
+
+    def _clear_image(self):
+        self._image_key = None
+        if self.is_aggregated():
+            self._image_source.data = dict(DensityController._EMPTY_IMAGE)
@@ -4,6 +4,7 @@
 import logging
 from ....backend.algorithms.error.error_register import ErrorRegister
 from ....backend.algorithms.error.absolute_sum_error import ABSOLUTE_SUM_ID
+from ....backend.util.error_utils import ErrorUtils
 from .abstract_algorithm_controller import AbstractAlgorithmController
 
 class ErrorController(AbstractAlgorithmController):
@@ -26,6 +27,11 @@ class ErrorController(AbstractAlgorithmController):
         self._last_point_error_s = None
         self._last_axis_error_s_norm = None
         self._last_point_error_s_norm = None
+        # Point X axis error contributions and the inputs they come from
+        self._last_general_error_df = None
+        self._last_values_df_norm = None
+        self._last_vectors_df = None
+        self._last_mapped_points_df = None
 
     def calculate_error(self):
         """values_df_norm: (pandas.DataFrame) product X dimension_value
@@ -37,10 +43,14 @@ class ErrorController(AbstractAlgorithmController):
         values_df_norm = self._normalization_controller.get_last_normalized_values()
         vectors_df = self._vector_controller.get_vectors()
         mapped_points_df = self._mapper_controller.get_mapped_points()
+        general_error_df = self._get_general_error_df(values_df_norm,
+                                                      vectors_df,
+                                                      mapped_points_df)
         axis_error_df, \
         point_error_df = self.execute_active_algorithm(values_df_norm,
                                                        vectors_df,
-                                                       mapped_points_df)
+                                                       mapped_points_df,
+                                                       general_error_df=general_error_df)
         # Normalize the error values at DataFrame level (i.e. comparing all matrix values)
         self._last_axis_error_s_norm = self._normalization_controller\
                                         .normalize_feature_scaling(axis_error_df, df_level=True)[0]
@@ -70,6 +80,26 @@ class ErrorController(AbstractAlgorithmController):
         self._last_point_error_s = point_error_s
         return axis_error_s, point_error_s
 
+    def _get_general_error_df(self, values_df_norm, vectors_df, mapped_points_df):
+        """Returns: (pandas.DataFrame) point X axis error contributions. They are
+           reused when the values, vectors and mapped points have not changed
+           since the last calculation (e.g. when only the error algorithm changes)
+        """
+        if values_df_norm is self._last_values_df_norm\
+           and mapped_points_df is self._last_mapped_points_df\
+           and self._last_vectors_df is not None\
+           and vectors_df.equals(self._last_vectors_df):
+            ErrorController.LOGGER.debug("Reusing last error contributions")
+            return self._last_general_error_df
+        general_error_df = ErrorUtils.get_general_error_df(values_df_norm,
+                                                           vectors_df,
+                                                           mapped_points_df)
+        self._last_general_error_df = general_error_df
+        self._last_values_df_norm = values_df_norm
+        self._last_vectors_df = vectors_df.copy()
+        self._last_mapped_points_df = mapped_points_df
+        return general_error_df
+
     def get_last_axis_error(self, normalized=False):
         """Returns (pandas.Series) last calculated error value for each axis"""
         last_axis_error = self._last_axis_error_s
@@ -83,7 +113,7 @@ class ErrorController(AbstractAlgorithmController):
 
     def get_last_point_error(self, normalized=False):
         """Returns (pandas.Series) last calculated error value for each point"""
-        last_point_error = self._last_axis_error_s
+        last_point_error = self._last_point_error_s
         if normalized:
             last_point_error = self._last_point_error_s_norm
 
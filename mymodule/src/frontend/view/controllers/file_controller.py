@@ -2,7 +2,8 @@
     File Controller
 """
 import logging
-from os import path, listdir
+from os import path
+from ....backend.io.directory_index import DirectoryIndex
 
 
 class FileController(object):
@@ -10,10 +11,22 @@ class FileController(object):
     LOGGER = logging.getLogger(__name__)
     DEFAULT_DIRECTORY = path.abspath(path.relpath(path.join('mymodule', 'src', 'server', 'resources')))
     AVAILABLE_EXTENSIONS = ["CSV"]
+    # Prefix of the hidden files marking the files that are not ready yet
+    PENDING_PREFIX = '.pending.'
 
     @staticmethod
-    def _list_files(directory=DEFAULT_DIRECTORY):
-        """Returns: (String[]) available files on the given directory"""
+    def get_pending_marker(file_path):
+        """Returns: (String) path of the file whose existence hides the given
+                    one from the available files, e.g. while it is converted
+        """
+        directory, filename = path.split(file_path)
+        return path.join(directory, FileController.PENDING_PREFIX + filename)
+
+    @staticmethod
+    def list_files(directory=DEFAULT_DIRECTORY):
+        """Returns: (String[]) available files on the given directory, from its
+                    shared DirectoryIndex
+        """
         def has_valid_extension(filename):
             """file: (String | File) filename
                Returns True if the file has an extension of AVAILABLE_EXTENSIONS
@@ -21,8 +34,10 @@ class FileController(object):
             return filename.split('.')[-1].upper() in FileController.AVAILABLE_EXTENSIONS
         if not path.isdir(directory):
             raise ValueError("ERROR: '%s' is not a valid directory", directory)
-        return [f for f in listdir(directory) if path.isfile(path.join(directory, f))
-                and has_valid_extension(f)]
+        filenames = DirectoryIndex.get_index(directory).get_filenames()
+        filename_set = set(filenames)
+        return [f for f in filenames if has_valid_extension(f)
+                and FileController.PENDING_PREFIX + f not in filename_set]
 
     def __init__(self, filename=None, directory=DEFAULT_DIRECTORY):
         """[filename=None]: initial active file, if none specified then it will take
@@ -30,7 +45,7 @@ class FileController(object):
            [directory=DEFAULT_DIRECTORY]: self explanatory
         """
         self._directory = directory
-        self._files = FileController._list_files(directory=directory)
+        self._files = FileController.list_files(directory=directory)
         FileController.LOGGER.debug("Available files: %s", self._files)
         self.update_active_file(filename)
         FileController.LOGGER.debug("Active file: %s", filename)
@@ -55,4 +70,4 @@ class FileController(object):
 
     def get_available_files(self):
         """Self explanatory"""
-        return FileController._list_files(self._directory)
+        return FileController.list_files(self._directory)
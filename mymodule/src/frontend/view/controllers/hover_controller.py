@@ -61,6 +61,10 @@ class HoverController(object):
         self._figure.add_tools(self._hover)
         
 
+    def set_renderers(self, renderers):
+        """renderers: (List<Renderer>) renderers whose glyphs show the hover"""
+        self._hover.renderers = renderers
+
     def get_available_properties(self):
         """Returns available properties (selected and non-selected"""
         property_index_tuples = zip(self._property_dict.keys(), self._property_dict.values())
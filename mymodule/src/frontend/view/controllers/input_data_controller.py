@@ -2,25 +2,39 @@
     Input Data Controller
 """
 import logging
-import numbers
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_bool_dtype, is_categorical_dtype
 
 class InputDataController(object):
     """Class in charge of holding the raw data coming from the Reader
        and manipulate the data, keeping a centralized copy of it
     """
     LOGGER = logging.getLogger(__name__)
+    # Whether dimensional columns are stored as float32 and nominal ones
+    # as categories, roughly halving the memory of the values
+    DOWNCAST = False
 
     @staticmethod
-    def _split_dimensional_nominal_values(raw_input_df):
+    def _is_dimensional_column(column):
+        """column: (pandas.Series) column of the raw input
+           Returns: (Boolean) True if the dtype of the whole column is numeric
+        """
+        return is_numeric_dtype(column) and not is_bool_dtype(column)
+
+    @staticmethod
+    def _split_dimensional_nominal_values(raw_input_df, downcast=DOWNCAST):
         """raw_input_df: (pandas.DataFrame) input as coming from the file
-           Returns: (pandas.DataFrame) DataFrame holding the nominal values
-                    (pandas.DataFrame) DataFrame holding the numeric values
+           [downcast=DOWNCAST]: (Boolean) convert the dimensional values to
+           float32 and the nominal ones to categories
+           Returns: (pandas.DataFrame) DataFrame holding the numeric values
+                    (pandas.DataFrame) DataFrame holding the nominal values
         """
         #TODO gchicafernandez - Rename repeated labels to guarantee uniqueness
         dimensional_labels = []
         nominal_labels = []
         for i in xrange(len(raw_input_df.columns)):
-            if isinstance(raw_input_df.iat[0, i], numbers.Number):
+            if InputDataController._is_dimensional_column(raw_input_df.iloc[:, i]):
                 dimensional_labels.append(raw_input_df.columns[i])
             else:
                 nominal_labels.append(raw_input_df.columns[i])
@@ -29,13 +43,44 @@ class InputDataController(object):
         InputDataController.LOGGER.info("Nominal columns found: %s", nominal_labels)
         dimensional_values_df = raw_input_df.drop(nominal_labels, axis=1, inplace=False)
         nominal_values_df = raw_input_df.drop(dimensional_labels, axis=1, inplace=False)
+        if downcast:
+            # Values with more than 24 significant bits lose precision
+            dimensional_values_df = dimensional_values_df.astype(np.float32)
+            # Converted column by column, since older pandas do not support
+            # categories on DataFrames. apply fails on those without columns
+            if nominal_labels:
+                nominal_values_df = nominal_values_df.apply(
+                    lambda column: column.astype('category'))
 
         return dimensional_values_df, nominal_values_df
 
-    def __init__(self, raw_input_df):
+    @staticmethod
+    def from_dataset(dataset):
+        """Creates the controller over a Dataset shared through the
+           DatasetRegistry. The values are split only once per dataset and
+           the resulting DataFrames are shared with every other controller
+           dataset: (Dataset) dataset of the file
+        """
+        raw_input_df = dataset.get_raw_input_df()
+        split_values = dataset.get_derived('dimensional_nominal_values',
+                                           lambda: InputDataController\
+                                           ._split_dimensional_nominal_values(raw_input_df))
+        return InputDataController(raw_input_df, split_values=split_values,
+                                   statistics=dataset.get_statistics())
+
+    def __init__(self, raw_input_df, split_values=None, statistics=None):
+        """raw_input_df: (pandas.DataFrame) input as coming from the file
+           [split_values=None]: (Tuple<pandas.DataFrame>) dimensional and
+           nominal DataFrames already split from raw_input_df. They are not
+           modified by this controller, so they can be shared
+           [statistics=None]: (OnlineStatistics) statistics of the numeric
+           columns gathered while reading the input
+        """
         self._raw_input_df = raw_input_df
-        self._dimensional_values_df, self._nominal_values_df\
-            = InputDataController._split_dimensional_nominal_values(raw_input_df)
+        if split_values is None:
+            split_values = InputDataController._split_dimensional_nominal_values(raw_input_df)
+        self._dimensional_values_df, self._nominal_values_df = split_values
+        self._statistics = statistics
         self._ignored_dimensional_labels = set()
         self._ignored_nominal_labels = set()
 
@@ -49,6 +94,12 @@ class InputDataController(object):
             return self.filter_df(self._nominal_values_df, nominal=True)
         return self._nominal_values_df
 
+    def get_statistics(self):
+        """Returns: (OnlineStatistics) statistics of the input numeric columns
+                    or None if they are not known
+        """
+        return self._statistics
+
     def get_number_of_values(self):
         return len(self._raw_input_df.index)
 
@@ -73,6 +124,22 @@ class InputDataController(object):
                                 from the raw input DataFrame""", label)
         return self._raw_input_df[label]
 
+    def get_category_labels(self, label):
+        """Returns the values of a column as strings, to be used as the
+           categories of a classification
+           label: (String) unique ID matching a column of the raw input DataFrame
+           Returns: (pandas.Series) string value of every element
+        """
+        column = self.get_column_from_raw_input(label)
+        if label in self._nominal_values_df:
+            column = self._nominal_values_df[label]
+        if not is_categorical_dtype(column):
+            return column.astype(str)
+        # Convert only the distinct values, missing ones (code -1) map
+        # to the last label as astype(str) does
+        labels = np.append(column.cat.categories.astype(str), str(np.nan))
+        return pd.Series(labels[column.cat.codes], index=column.index, name=column.name)
+
     def get_element_names(self):
         return self._dimensional_values_df.index
 
@@ -12,9 +12,12 @@ class MapperController(AbstractAlgorithmController):
        to perform remapping by modifying particular vectors (e.g hiding an axis)
     """
     LOGGER = logging.getLogger(__name__)
+    # Number of consecutive incremental mappings after which a full mapping
+    # is forced, bounding the accumulated floating point error
+    RESYNC_PERIOD = 50
 
     def __init__(self, input_data_controller, point_controller, vector_controller, normalization_controller,
-                 source_points=None, mapping_id=None, animator=None):
+                 source_points=None, mapping_id=None, animator=None, incremental=True):
         algorithm_dict = MappingRegister.get_algorithm_dict()
         super(MapperController, self).__init__(STAR_COORDINATES_ID,
                                                algorithm_dict,
@@ -26,6 +29,11 @@ class MapperController(AbstractAlgorithmController):
         self._normalization_controller = normalization_controller
         self._animator = animator
         self._last_mapped_points_df = None
+        # Inputs of the last mapping, used to detect single axis changes
+        self._incremental = incremental
+        self._last_values_df = None
+        self._last_vectors_df = None
+        self._incremental_count = 0
 
     def execute_mapping(self):
         """Will recalculate the mapping for the points
@@ -36,18 +44,61 @@ class MapperController(AbstractAlgorithmController):
         # ignored labels set of InputDataController
         dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
         vectors_df = self._vector_controller.get_vectors()
-        MapperController.LOGGER.debug("Mapping with %s", self.get_active_algorithm_id())
-        mapped_points_df = self.execute_active_algorithm(dimension_values_df_norm,
-                                                         vectors_df)
+        delta_vectors_df = self._get_delta_vectors(dimension_values_df_norm, vectors_df)
+        if delta_vectors_df is not None:
+            MapperController.LOGGER.debug("Incremental mapping of %s with %s",
+                                          delta_vectors_df.index.tolist(),
+                                          self.get_active_algorithm_id())
+            incremental_algorithm = self._get_incremental_algorithm()
+            mapped_points_df = incremental_algorithm(dimension_values_df_norm,
+                                                     delta_vectors_df,
+                                                     self._last_mapped_points_df)
+            self._incremental_count += 1
+        else:
+            MapperController.LOGGER.debug("Mapping with %s", self.get_active_algorithm_id())
+            mapped_points_df = self.execute_active_algorithm(dimension_values_df_norm,
+                                                             vectors_df)
+            self._incremental_count = 0
+        self._last_values_df = dimension_values_df_norm
+        self._last_vectors_df = vectors_df.copy()
         if self._animator and self._last_mapped_points_df is not None:
+            # The animator takes care of pushing the final coordinates
             MapperController.LOGGER.debug("Executing animation")
             self._animator.get_animation_sequence(self._last_mapped_points_df,
                                                   mapped_points_df)
+        else:
+            self._point_controller.update_coordinates(mapped_points_df['x'],
+                                                      mapped_points_df['y'])
         self._last_mapped_points_df = mapped_points_df
-        self._point_controller.update_coordinates(mapped_points_df['x'], mapped_points_df['y'])
 
         return mapped_points_df
 
+    def _get_incremental_algorithm(self):
+        """Returns: (Func) incremental version of the active algorithm or None"""
+        incremental_dict = MappingRegister.get_incremental_algorithm_dict()
+        return incremental_dict.get(self.get_active_algorithm_id())
+
+    def _get_delta_vectors(self, dimension_values_df_norm, vectors_df):
+        """Compares the vectors with those of the last mapping
+           Returns: (pandas.DataFrame) changed vector_id X (x, y) differences
+                    or None if the mapping must be fully recalculated, which
+                    happens when the normalized values changed (e.g. an axis
+                    was toggled or the normalization was updated), when all or
+                    none of the vectors changed or when a resync is due
+        """
+        if not self._incremental\
+           or self._get_incremental_algorithm() is None\
+           or self._last_mapped_points_df is None\
+           or dimension_values_df_norm is not self._last_values_df\
+           or not vectors_df.index.equals(self._last_vectors_df.index)\
+           or self._incremental_count >= MapperController.RESYNC_PERIOD:
+            return None
+        delta_vectors_df = vectors_df - self._last_vectors_df
+        changed = (delta_vectors_df != 0).any(axis=1)
+        if not changed.any() or changed.all():
+            return None
+        return delta_vectors_df[changed]
+
     def get_mapped_points(self):
         return self._last_mapped_points_df
 
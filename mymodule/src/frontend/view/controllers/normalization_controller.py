@@ -4,13 +4,29 @@
 
 import logging
 from collections import Counter
+from concurrent.futures import Future
 from ....backend.algorithms.normalization.normalization_register import NormalizationRegister
+from ....backend.util.result_cache import ResultCache
 from ....backend.algorithms.normalization.feature_scaling_normalization import FEATURE_SCALING_ID
 from .abstract_algorithm_controller import AbstractAlgorithmController
 
 class NormalizationController(AbstractAlgorithmController):
     """Controls the normalization applied to the values dataframe"""
     LOGGER = logging.getLogger(__name__)
+    # Normalized values of the process, with the shape
+    # {(values fingerprint, labels, algorithm_id), normalized DataFrame}
+    CACHE = ResultCache('normalization', 512 * 1024 ** 2)
+
+    @staticmethod
+    def _fill_missing_values(normalized_df):
+        """Missing values are placed at the mean of their normalized column,
+           so every point can be mapped, clustered and projected
+           Returns: (pandas.DataFrame) normalized values without NaN
+        """
+        if not normalized_df.isnull().values.any():
+            return normalized_df
+        NormalizationController.LOGGER.debug("Filling missing values")
+        return normalized_df.fillna(normalized_df.mean()).fillna(0.)
 
     def __init__(self, input_data_controller, algorithm_id=None):
         algorithm_dict = NormalizationRegister.get_algorithm_dict()
@@ -26,12 +42,51 @@ class NormalizationController(AbstractAlgorithmController):
         """[df_level=False]: (Boolean) Whether values maximum/minimum"""
         NormalizationController.LOGGER.debug("Normalizing values using %s",
                                              self.get_active_algorithm_id())
-        values_df = self._input_data_controller.get_dimensional_values()
-        normalized_df = self.execute_active_algorithm(values_df,
-                                                      df_level=False)
+        values_df, cache_key, statistics = self._get_normalization_input()
+        normalized_df = NormalizationController.CACHE\
+                        .get_or_compute(cache_key,
+                                        lambda: NormalizationController._fill_missing_values(
+                                            self.execute_active_algorithm(values_df,
+                                                                          df_level=False,
+                                                                          statistics=statistics)))
         self._last_normalized_values_df = normalized_df
         return normalized_df
 
+    def submit_normalization(self, session_id):
+        """Runs the active normalization in the process pool of the
+           AlgorithmExecutor, unless it is already cached
+           session_id: (String) session requesting the normalization
+           Returns: (concurrent.futures.Future) completed once
+                    execute_normalization can reuse the normalized values
+        """
+        values_df, cache_key, statistics = self._get_normalization_input()
+        if cache_key in NormalizationController.CACHE:
+            stored_future = Future()
+            stored_future.set_result(None)
+            return stored_future
+        future = self.submit_active_algorithm(session_id, values_df, df_level=False,
+                                              statistics=statistics)
+        def store(normalized_df):
+            NormalizationController.CACHE.put(cache_key,
+                                              NormalizationController
+                                              ._fill_missing_values(normalized_df))
+        return AbstractAlgorithmController._store_when_done(future, store)
+
+    def _get_normalization_input(self):
+        """Returns: (pandas.DataFrame) filtered values to normalize
+                    (Tuple) key of their normalization in the cache
+                    (OnlineStatistics) statistics of the values or None
+        """
+        values_df = self._input_data_controller.get_dimensional_values()
+        # The unfiltered values are shared and never modified, so their
+        # fingerprint is computed only once
+        all_values_df = self._input_data_controller.get_dimensional_values(filtered=False)
+        cache_key = (ResultCache.get_fingerprint(all_values_df),
+                     tuple(values_df.columns),
+                     self.get_active_algorithm_id())
+        # Statistics gathered while reading the file save a pass over the values
+        return values_df, cache_key, self._input_data_controller.get_statistics()
+
     def get_last_normalized_values(self):
         if self._should_update_last_values():
             self.execute_normalization()
@@ -2,12 +2,23 @@
     Point Controller
 """
 import logging
+import numpy as np
 from bokeh.models import ColumnDataSource
+from ....backend.util.point_index import PointIndex
 
 
 class PointController(object):
-    """Controls the point column data source"""
+    """Controls the point column data source. The columns updated while
+       handling an action are sent to the browser together once the action
+       finishes: as a patch of the changed points if few of them changed,
+       otherwise as a single replacement of the data. All the rows are kept
+       in the server, but a row selector may restrict the ones sent
+    """
     LOGGER = logging.getLogger(__name__)
+    # Fraction of changed points up to which a column is patched
+    PATCH_FRACTION = 0.1
+    # Decimals kept of the numeric columns, shortening their serialization
+    DECIMALS = 6
 
     @staticmethod
     def _get_unique_names(names):
@@ -29,15 +40,61 @@ class PointController(object):
 
         return new_names
 
-    def __init__(self, input_data_controller, classification_controller):
-        """input_data_controller: (InputDataController)"""
+    @staticmethod
+    def _to_column(values):
+        """Returns: (numpy.ndarray || List) rounded array for numeric values,
+                    otherwise a list
+        """
+        array = np.asarray(values)
+        if array.dtype.kind in 'iu':
+            return array
+        if array.dtype.kind == 'f':
+            return np.round(array.astype(float), PointController.DECIMALS)
+        return list(values)
+
+    @staticmethod
+    def _get_changed_indices(old_values, new_values):
+        """Returns: (numpy.ndarray) indices of the changed values or None if
+                    so many changed that the whole column should be replaced
+        """
+        if len(old_values) != len(new_values):
+            return None
+        if isinstance(new_values, np.ndarray):
+            old_values = np.asarray(old_values)
+            if old_values.dtype != new_values.dtype:
+                return None
+            changed = old_values != new_values
+            if new_values.dtype.kind == 'f':
+                changed &= ~(np.isnan(old_values) & np.isnan(new_values))
+        else:
+            changed = np.asarray(old_values, dtype=object) != np.asarray(new_values, dtype=object)
+        changed_indices = np.flatnonzero(changed)
+        if len(changed_indices) > PointController.PATCH_FRACTION * len(new_values):
+            return None
+        return changed_indices
+
+    def __init__(self, input_data_controller, classification_controller, doc=None):
+        """input_data_controller: (InputDataController)
+           [doc=None]: (bokeh.document.Document) document of the session. When
+           it belongs to a server session the updates are sent on the next tick
+        """
         self._source = ColumnDataSource()
+        self._doc = doc
+        # dictionary with the shape {column, values} of all the rows
+        self._data_dic = dict()
+        # Func receiving the x and y columns and returning the indices of the
+        # rows in the source, or None for all of them
+        self._row_selector = None
+        self._row_indices = None
+        # dictionary with the shape {column, values} of the updates not sent yet
+        self._pending_dic = dict()
+        self._is_flush_scheduled = False
         unique_names = PointController._get_unique_names(input_data_controller.get_element_names())
+        self._point_index = PointIndex(unique_names)
         self.add_attribute('name', unique_names)
         self.add_attribute('category', classification_controller.get_categories())
         self.add_attribute('color', [])
         self.add_attribute('error', [])
-        self.add_attribute('size', [])
         self.add_attribute('x', [])
         self.add_attribute('y', [])
 
@@ -45,29 +102,144 @@ class PointController(object):
         return self._source
         
     def get_point_names(self):
-        return [name for name in self._source.data['name']]
+        return [name for name in self._data_dic['name']]
 
     def get_number_of_points(self):
-        return len(self._source.data['name'])
+        return self._point_index.get_number_of_points()
 
     def is_valid_point(self, name):
-        return name in self._source.data['name']
+        return self._point_index.has_point(name)
+
+    def get_point_index(self, name):
+        """Returns: (int) row of the point or None if there is no such point"""
+        return self._point_index.get_row(name)
+
+    def get_nearest_point(self, x, y, max_distance=np.inf):
+        """Returns: (String) name of the point nearest to (x, y) or None if
+                    there is none within max_distance
+        """
+        row = self._point_index.get_nearest_row(x, y, max_distance=max_distance)
+        return self._point_index.get_name(row) if row is not None else None
+
+    def get_coordinates(self):
+        """Returns: (numpy.ndarray, numpy.ndarray) x and y of all the points,
+                    including the updates not sent yet
+        """
+        x = self._pending_dic.get('x', self._data_dic['x'])
+        y = self._pending_dic.get('y', self._data_dic['y'])
+        return np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+
+    def get_row_indices(self):
+        """Returns: (numpy.ndarray) rows in the source or None if all of them"""
+        return self._row_indices
+
+    def set_row_selector(self, row_selector):
+        """row_selector: (Func) receives the x and y columns of all the points
+           and returns the indices of the rows sent to the browser, or None
+           for all of them. None to send all the rows
+        """
+        self._row_selector = row_selector
+        self.select_rows()
+
+    def select_rows(self):
+        """Asks the row selector again for the rows in the source, e.g. after
+           the visible region of the figure changed, replacing its data in a
+           single message if they are different
+        """
+        if self._row_selector_changes_rows():
+            self._replace_data()
 
     def update_coordinates(self, x, y):
-        self._source.data['x'] = x
-        self._source.data['y'] = y
+        self._update_columns(x=x, y=y)
+        self._point_index.update_coordinates(*self.get_coordinates())
 
     def update_categories(self, categories):
-        self._source.data['category'] = categories
+        self._update_columns(category=categories)
 
     def update_colors(self, colors):
-        self._source.data['color'] = colors
+        self._update_columns(color=colors)
 
     def update_errors(self, errors):
-        self._source.data['error'] = errors
+        self._update_columns(error=errors)
+
+    def flush(self):
+        """Sends the pending updates of the columns in a single message"""
+        self._is_flush_scheduled = False
+        pending_dic, self._pending_dic = self._pending_dic, dict()
+        self._data_dic.update(pending_dic)
+        if ('x' in pending_dic or 'y' in pending_dic) and self._row_selector_changes_rows():
+            PointController.LOGGER.debug("Replacing rows")
+            self._replace_data()
+            return
+        patches = dict()
+        replaced_dic = dict()
+        for name in pending_dic:
+            values = self._get_rows(self._data_dic[name])
+            changed_indices = PointController._get_changed_indices(self._source.data[name],
+                                                                   values)
+            if changed_indices is None:
+                replaced_dic[name] = values
+            elif len(changed_indices):
+                patches[name] = [(int(i), PointController._to_scalar(values[i]))
+                                 for i in changed_indices]
+        if replaced_dic:
+            PointController.LOGGER.debug("Replacing columns %s", sorted(pending_dic))
+            data = dict(self._source.data)
+            # The columns that could be patched travel in the same message
+            data.update((name, self._get_rows(self._data_dic[name])) for name in patches)
+            data.update(replaced_dic)
+            self._source.data = data
+        elif patches:
+            PointController.LOGGER.debug("Patching columns %s", sorted(patches))
+            self._source.patch(patches)
 
-    def update_sizes(self, sizes):
-        self._source.data['size'] = sizes
+    def _row_selector_changes_rows(self):
+        """Returns: (Boolean) True if the row selector picked different rows"""
+        row_indices = None
+        x, y = self._data_dic['x'], self._data_dic['y']
+        if self._row_selector is not None and len(x) == len(y) == self.get_number_of_points():
+            row_indices = self._row_selector(np.asarray(x, dtype=float),
+                                             np.asarray(y, dtype=float))
+        if row_indices is None and self._row_indices is None:
+            return False
+        if row_indices is not None and self._row_indices is not None\
+           and np.array_equal(row_indices, self._row_indices):
+            return False
+        self._row_indices = row_indices
+        return True
+
+    def _get_rows(self, values):
+        """Returns: (numpy.ndarray || List) values of the rows in the source"""
+        if self._row_indices is None or len(values) != self.get_number_of_points():
+            return values
+        if isinstance(values, np.ndarray):
+            return values[self._row_indices]
+        return [values[i] for i in self._row_indices]
+
+    def _replace_data(self):
+        self._source.data = dict((name, self._get_rows(values))
+                                 for name, values in self._data_dic.items())
+
+    def _update_columns(self, **columns):
+        for name, values in columns.items():
+            self._pending_dic[name] = PointController._to_column(values)
+        if self._doc is None or self._doc.session_context is None:
+            self.flush()
+        elif not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            self._doc.add_next_tick_callback(self.flush)
+
+    @staticmethod
+    def _to_scalar(value):
+        """Returns: (Object) JSON safe value, with the non-finite floats as
+                    the strings Bokeh uses for them in whole columns
+        """
+        value = value.item() if isinstance(value, np.generic) else value
+        if isinstance(value, float) and not np.isfinite(value):
+            return 'NaN' if np.isnan(value) else ('Infinity' if value > 0 else '-Infinity')
+        return value
 
     def add_attribute(self, attr_name, items):
-        self._source.add(items, name=attr_name)
+        items = PointController._to_column(items)
+        self._data_dic[attr_name] = items
+        self._source.add(self._get_rows(items), name=attr_name)
@@ -2,14 +2,17 @@
     Point Size controller
 """
 import logging
-from ....backend.util.line_equation import calculate_line_equation
+import numpy as np
+from ...bokeh_extension.error_size_transform import ErrorSizeTransform
 
 class PointSizeController(object):
     """Controller capable of setting sizes to points
        If there is an error value for the point, it will scale the size
        of the point between the size set for the minimum error and the size
        set for the maximum error, using a line function shaped by the points
-       (0, initial_size) and (1, final_size)
+       (0, initial_size) and (1, final_size). The sizes are computed in the
+       browser from the error column of the points, so the server only sends
+       the sizes and the bounds of the error
     """
     LOGGER = logging.getLogger(__name__)
     # Size of the point with MIN error
@@ -18,13 +21,6 @@ class PointSizeController(object):
     DEFAULT_FINAL_SIZE = 12
     MIN_SIZE = 1
 
-    @staticmethod
-    def _calculate_line_equation(initial_size, final_size):
-        x0x1 = (0, 1)
-        y0y1 = (initial_size, final_size)
-        # y = mx + c
-        return calculate_line_equation(x0x1, y0y1)
-
     @staticmethod
     def _get_valid_size(size):
         """Will return the original size or the minimum valid one"""
@@ -42,27 +38,34 @@ class PointSizeController(object):
         """
         self._error_controller = error_controller
         self._point_controller = point_controller
-        self._m, self._c = self._calculate_line_equation(initial_size, final_size)
         self._initial_size = initial_size
         self._final_size = final_size
+        self._size_transform = ErrorSizeTransform(initial_size=initial_size,
+                                                  final_size=final_size,
+                                                  source=point_controller.get_source())
+
+    def get_size_transform(self):
+        """Returns: (ErrorSizeTransform) transform of the error column of the
+                    points into their sizes
+        """
+        return self._size_transform
 
     def set_single_size(self, new_size):
         """Sets a common size for all the source points
            new_size: (int)
         """
         new_size = PointSizeController._get_valid_size(new_size)
-        no_points = self._point_controller.get_number_of_points()
-        self._point_controller.update_sizes([new_size for i in range(0, no_points)])
+        self._update_transform(initial_size=new_size, final_size=new_size)
 
     def set_initial_size(self, new_size):
         """new_size: (int >= MIN_SIZE)"""
         self._initial_size = PointSizeController._get_valid_size(new_size)
-        self.update_sizes()
+        self._update_transform(initial_size=self._initial_size)
 
     def set_final_size(self, new_size):
         """new_size: (int >= MIN_SIZE)"""
         self._final_size = PointSizeController._get_valid_size(new_size)
-        self.update_sizes()
+        self._update_transform(final_size=self._final_size)
 
     def get_initial_size(self):
         return self._initial_size
@@ -71,12 +74,22 @@ class PointSizeController(object):
         return self._final_size
 
     def update_sizes(self):
-        """Normalize the source point sizes using the normalized error
-           We cannot use the error of the source because internally Bokeh turns
-           it into an array.
+        """Scales the sizes between the bounds of the last point error, the
+           same the normalized error is computed from
         """
-        point_error_s = self._error_controller.get_last_point_error(normalized=True)
+        point_error_s = self._error_controller.get_last_point_error()
         PointSizeController.LOGGER.debug("Updating sizes: %s-%s",
                                          self._initial_size, self._final_size)
-        self._m, self._c = self._calculate_line_equation(self._initial_size, self._final_size)
-        self._point_controller.update_sizes(self._m * point_error_s + self._c)
+        if point_error_s is None or point_error_s.empty:
+            return
+        low, high = np.nanmin(point_error_s.values), np.nanmax(point_error_s.values)
+        if not np.isfinite(low) or not np.isfinite(high):
+            low, high = 0., 1.
+        self._update_transform(low=float(low), high=float(high),
+                               initial_size=self._initial_size, final_size=self._final_size)
+
+    def _update_transform(self, **properties):
+        """Only the properties that change are sent"""
+        for name, value in properties.items():
+            if getattr(self._size_transform, name) != value:
+                setattr(self._size_transform, name, value)
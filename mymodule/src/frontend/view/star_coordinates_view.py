@@ -9,7 +9,7 @@ from bokeh.plotting import figure
 from bokeh.models import Label, ColumnDataSource, LabelSet, HoverTool, WheelZoomTool,\
                          PanTool, PolySelectTool, TapTool, ResizeTool, SaveTool, ResetTool
 
-from ...backend.io.reader import Reader
+from ...backend.io.dataset_registry import DatasetRegistry
 
 from .controllers.input_data_controller import InputDataController
 from .controllers.vector_controller import VectorController
@@ -20,6 +20,7 @@ from .controllers.cluster_controller import ClusterController
 from .controllers.file_controller import FileController
 from .controllers.point_size_controller import PointSizeController
 from .controllers.point_controller import PointController
+from .controllers.density_controller import DensityController
 from .controllers.error_controller import ErrorController
 from .controllers.color_controller import ColorController
 from .controllers.hover_controller import HoverController
@@ -55,16 +56,23 @@ class StarCoordinatesView(object):
     def _set_source_attribute(source, attr_name, attr_list):
         source.add(attr_list, name=attr_name)
 
-    def __init__(self, alias, filename=None, width=800, height=800):
+    def __init__(self, alias, filename=None, width=800, height=800, doc=None,
+                 activity_callback=None):
         """Creates a new Star Coordinates View object and instantiates
            its elements
+           [doc=None]: (bokeh.document.Document) document of the session
+           where the view is displayed, used to schedule the animations
+           [activity_callback=None]: (Func) receives the name of every
+           interaction made directly on the figure, like dragging an axis
         """
         self._alias = alias
+        self._doc = doc
+        self._activity_callback = activity_callback
         # Configuration elements
         self._width = width
         self._height = height
         self._filename = filename
-        self._reader = None
+        self._dataset = None
         self._selected_axis = None
         # Figure elements
         self._figure = None
@@ -87,6 +95,7 @@ class StarCoordinatesView(object):
         self._file_controller = None
         self._axis_checkboxes = None
         self._point_controller = None
+        self._density_controller = None
         self._point_size_controller = None
         self._error_controller = None
         self._color_controller = None
@@ -99,8 +108,10 @@ class StarCoordinatesView(object):
         """Load data from file and initialize dataframe values"""
         self._file_controller = FileController(filename=self._filename)
 
-        raw_input_df = Reader.read_from_file(self._file_controller.get_active_file())
-        self._input_data_controller = InputDataController(raw_input_df)
+        # The input data is shared with every view of the same file
+        self._dataset = DatasetRegistry.acquire(self._file_controller.get_active_file(),
+                                                progress_callback=self._log_read_progress)
+        self._input_data_controller = InputDataController.from_dataset(self._dataset)
         self._vector_controller = VectorController(self._input_data_controller)
         self._normalization_controller = NormalizationController(self._input_data_controller)
         self._normalization_controller.execute_normalization()
@@ -118,15 +129,21 @@ class StarCoordinatesView(object):
 
         self._cluster_controller = ClusterController(self._normalization_controller)
         self._cluster_controller.execute_clustering()
+        self._cluster_controller.precompute_clusterings()
         self._classification_controller = ClassificationController(self._input_data_controller,
                                                                    self._cluster_controller,
                                                                    self._normalization_controller,
                                                                    self._axis_sources)
 
         self._point_controller = PointController(self._input_data_controller,
-                                                 self._classification_controller)
+                                                 self._classification_controller,
+                                                 doc=self._doc)
+        self._density_controller = DensityController(self._point_controller,
+                                                     self._width, self._height,
+                                                     doc=self._doc,
+                                                     activity_callback=self._record_activity)
 
-        mapping_animator = MappingAnimator(self._point_controller)
+        mapping_animator = MappingAnimator(self._point_controller, doc=self._doc)
         self._mapper_controller = MapperController(self._input_data_controller,
                                                    self._point_controller,
                                                    self._vector_controller,
@@ -170,6 +187,7 @@ class StarCoordinatesView(object):
     def _init_square_mapper(self):
         def remap(attr, old, new):
             StarCoordinatesView.LOGGER.debug("Remap - Drag && Drop")
+            self._record_activity('remap')
             StarCoordinatesView.LOGGER.debug("axis: %s; x: %s; y: %s",
                                              self._square_mapper.glyph.name,
                                              self._square_mapper.glyph.x,
@@ -190,6 +208,13 @@ class StarCoordinatesView(object):
         square.on_change('visible', remap)
         return square
 
+    @staticmethod
+    def _log_read_progress(chunked_reader):
+        """chunked_reader: (ChunkedFileReader) reader of the active file"""
+        StarCoordinatesView.LOGGER.info("Read %s rows, %.0f%% of the file",
+                                        chunked_reader.get_rows_read(),
+                                        100 * chunked_reader.get_progress())
+
     def _init_figure(self):
         """Updates the visual elements on the figure"""
         wheel_zoom_tool = WheelZoomTool()
@@ -277,16 +302,23 @@ class StarCoordinatesView(object):
 
     def _init_points(self):
         """Will draw the circles representing the dots on the plot
-           source_points: (ColumnDataSource) x, y, size and color for each point
+           source_points: (ColumnDataSource) x, y, error, mapped to the size,
+           and palette index of the color for each point
         """
         source_points = self._point_controller.get_source()
-        self._figure.circle('x',
-                            'y',
-                            size='size',
-                            color='color',
-                            alpha=StarCoordinatesView._CIRCLE_ALPHA,
-                            legend='category',
-                            source=source_points)
+        self._density_controller.set_figure(self._figure)
+        circles = self._figure.circle('x',
+                                      'y',
+                                      size={'field': 'error',
+                                            'transform': self._point_size_controller
+                                                         .get_size_transform()},
+                                      color={'field': 'color',
+                                             'transform': self._color_controller
+                                                          .get_color_mapper()},
+                                      alpha=StarCoordinatesView._CIRCLE_ALPHA,
+                                      legend='category',
+                                      source=source_points)
+        self._hover_controller.set_renderers([circles])
 
         self._labels_points = LabelSet(x='x', y='y', text='name', name='name', level='glyph',
                                        x_offset=5, y_offset=5, text_font_size='0pt',
@@ -305,6 +337,57 @@ class StarCoordinatesView(object):
                 self._color_controller.update_colors()
             self._execute_classification()
 
+    def _apply_clustering(self, n_clusters):
+        """Applies the clustering once computed, unless the number of clusters
+           has changed meanwhile
+        """
+        if self._dataset is None\
+           or n_clusters != self._cluster_controller.get_number_of_clusters():
+            return
+        self._execute_clustering()
+
+    def _apply_classification(self, algorithm_id):
+        """Applies the relocation once computed, unless the classification
+           algorithm has changed meanwhile
+        """
+        if self._dataset is None\
+           or algorithm_id != self._classification_controller.get_active_algorithm_id():
+            return
+        self._execute_classification()
+
+    def _apply_normalization(self, algorithm_id):
+        """Applies the normalization once computed, unless the normalization
+           algorithm has changed meanwhile
+        """
+        if self._dataset is None\
+           or algorithm_id != self._normalization_controller.get_active_algorithm_id():
+            return
+        self._execute_normalization()
+
+    def _submit_and_apply(self, submit, apply, description):
+        """Runs an algorithm in the process pool and applies its result from
+           the IOLoop of the session once it is available, so it is not
+           blocked meanwhile. Outside a server session it is applied inline
+           submit: (Func) receives the session id and returns a Future
+           completed once the result can be applied
+           apply: (Func) applies the result, without arguments
+           description: (String) of the algorithm, for the errors
+        """
+        session_id = self._get_session_id()
+        if session_id is None:
+            apply()
+            return
+        future = submit(session_id)
+        def on_done(future):
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                StarCoordinatesView.LOGGER.error("%s failed: %s", description,
+                                                 future.exception())
+                return
+            self._doc.add_next_tick_callback(apply)
+        future.add_done_callback(on_done)
+
     def _execute_classification(self):
         self._color_controller.update_legend()
         if self._classification_controller.in_active_mode():
@@ -319,10 +402,21 @@ class StarCoordinatesView(object):
     def _execute_normalization(self):
         self._normalization_controller.execute_normalization()
         self._execute_mapping()
+        self._cluster_controller.precompute_clusterings()
 
     def _update_layout(self):
         self._layout = row(self._figure, name='view')
 
+    def _get_session_id(self):
+        """Returns: (String) id of the server session of the view or None"""
+        if self._doc is None or self._doc.session_context is None:
+            return None
+        return self._doc.session_context.id
+
+    def _record_activity(self, action):
+        if self._activity_callback is not None:
+            self._activity_callback(action)
+
     def _is_valid_point(self, name):
         return self._point_controller.is_valid_point(name)
 
@@ -341,6 +435,30 @@ class StarCoordinatesView(object):
         # Redraw points
         self._init_points()
 
+    def close(self):
+        """Releases the shared resources of the view. It must not be used
+           afterwards
+        """
+        self._cluster_controller.cancel_precomputation()
+        if self._dataset is not None:
+            DatasetRegistry.release(self._dataset)
+            self._dataset = None
+
+    def get_number_of_values(self):
+        return self._input_data_controller.get_number_of_values()
+
+    def get_memory_usage(self):
+        """Returns: (int) estimated bytes held by the view, including its
+                    dataset, which may be shared with other views
+        """
+        memory_usage = 0
+        if self._dataset is not None:
+            memory_usage += self._dataset.get_memory_usage()
+        normalized_values_df = self._normalization_controller.get_last_normalized_values()
+        if normalized_values_df is not None:
+            memory_usage += int(normalized_values_df.memory_usage(index=True).sum())
+        return memory_usage
+
     # UPDATE methods
     def update_mapping_algorithm(self, new):
         self._mapper_controller.update_algorithm(new)
@@ -348,15 +466,20 @@ class StarCoordinatesView(object):
 
     def update_classification_algorithm(self, new):
         self._classification_controller.update_algorithm(new)
-        self._execute_classification()
+        self._submit_and_apply(self._classification_controller.submit_relocation,
+                               lambda: self._apply_classification(new),
+                               "Classification with {}".format(new))
 
     def update_normalization_algorithm(self, new):
         self._normalization_controller.update_algorithm(new)
-        self._execute_normalization()
+        self._submit_and_apply(self._normalization_controller.submit_normalization,
+                               lambda: self._apply_normalization(new),
+                               "Normalization with {}".format(new))
 
     def update_clustering_algorithm(self, new):
         self._cluster_controller.update_algorithm(new)
         self._execute_clustering()
+        self._cluster_controller.precompute_clusterings()
 
     def update_error_algorithm(self, new):
         self._error_controller.update_algorithm(new)
@@ -379,9 +502,8 @@ class StarCoordinatesView(object):
         self._color_controller.update_colors()
 
     def update_palette(self, new):
+        # Only the palette of the color mapper changes
         self._color_controller.update_palette(new)
-        if self._color_controller.in_axis_mode():
-            self._color_controller.update_colors()
 
     def update_axis_visibility(self, new):
         axis_id, is_visible = new
@@ -392,6 +514,8 @@ class StarCoordinatesView(object):
         # Tries to hide the axis element. If a change is made then execute mapping
         if self._axis_elements[axis_id].visible(is_visible):
             self._execute_mapping()
+            # Clusterings of the previous axis are discarded
+            self._cluster_controller.precompute_clusterings()
 
     def update_hover_tips_visibility(self, new):
         hover_tip, is_visible = new
@@ -408,7 +532,9 @@ class StarCoordinatesView(object):
     def update_number_of_clusters(self, new):
         # Will update the cluster categories too
         self._cluster_controller.update_number_of_clusters(new)
-        self._execute_clustering()
+        self._submit_and_apply(self._cluster_controller.submit_clustering,
+                               lambda: self._apply_clustering(new),
+                               "Clustering with {} clusters".format(new))
 
     def update_initial_size_input(self, new):
         self._point_size_controller.set_initial_size(new)
@@ -422,8 +548,10 @@ class StarCoordinatesView(object):
         """
         if self._is_valid_point(new):
             self._color_controller.select_point(new)
+            self._density_controller.select_point(new)
         else:
             self._color_controller.unselect_point()
+            self._density_controller.select_point(None)
 
     # GET methods
     def get_alias(self):
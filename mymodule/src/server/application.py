@@ -3,20 +3,33 @@
     http://localhost:5000
 """
 
-from os import path, getenv, listdir
-from flask import Flask, redirect, render_template, request, Markup
+import atexit
+import itertools
+import json
+import multiprocessing
+from os import path, getenv
+from urlparse import urlparse
+from flask import Flask, render_template, Markup, Response
 from bokeh.application import Application
-from bokeh.application.handlers import FunctionHandler
+from bokeh.application.handlers import FunctionHandler, Handler
 from bokeh.embed import autoload_server
 from bokeh.server.server import Server
-from tornado.ioloop import IOLoop
+from tornado import gen
+from tornado.httpclient import AsyncHTTPClient
+from tornado.ioloop import IOLoop, PeriodicCallback
+from tornado.wsgi import WSGIContainer
+from tornado.web import Application as TornadoApplication, FallbackHandler, RequestHandler
 from .logger.logger import Logger
+from .session_manager import SessionManager
+from .upload_handler import UploadHandler, UploadProgressHandler
 import logging
+from ..backend.io.directory_index import DirectoryIndex
+from ..backend.util.algorithm_executor import AlgorithmExecutor
 from ..frontend.model.general_model import GeneralModel
+from ..frontend.view.controllers.file_controller import FileController
 
 app = Flask(__name__)
 UPLOAD_FOLDER = path.join(path.dirname(path.realpath(__file__)), 'resources')
-AVAILABLE_EXTENSIONS = ["CSV"]
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
 # Initialize logging
@@ -34,6 +47,9 @@ if not DEFAULT_ACCESS_ADDRESS:
 BOKEH_PORT = '5006'
 FLASK_PORT = '5000'
 BOKEH_APP_PATH='/datavisualization'
+# Number of Bokeh server processes, listening on consecutive ports from
+# BOKEH_PORT. With 0 Bokeh is served from the process of Flask
+BOKEH_WORKERS = int(getenv('BOKEH_WORKERS', '0'))
 
 # Default to Docker Settings
 bokeh_access_address = flask_access_address_local = DEFAULT_ACCESS_ADDRESS
@@ -44,27 +60,151 @@ UPLOADER_URL = 'http://{}:{}/uploader'.format(flask_access_address_local, FLASK_
 
 
 def get_files():
-    def has_valid_extension(filename):
-        return filename.split('.')[-1].upper() in AVAILABLE_EXTENSIONS
+    return FileController.list_files(directory=UPLOAD_FOLDER)
 
-    return [f for f in listdir(UPLOAD_FOLDER) if path.isfile(path.join(UPLOAD_FOLDER, f))
-            and has_valid_extension(f)]
+def get_file_infos():
+    """Returns: (List<Tuple>) (filename, Dictionary) of the available files
+                with their details, read once per version of every file by
+                their DirectoryIndex
+    """
+    directory_index = DirectoryIndex.get_index(UPLOAD_FOLDER)
+    return [(filename, directory_index.get_file_details(filename)) for filename in get_files()]
+
+def get_file_rows(filename):
+    """Returns: (int) number of rows of the file, as known by its
+                DirectoryIndex, or None if unknown
+    """
+    details = DirectoryIndex.get_index(UPLOAD_FOLDER).get_file_details(filename)
+    return details.get(DirectoryIndex.ROWS) if details is not None else None
 
 def modify_doc(doc):
     filename = get_files()[0]
-    if filename:
-        GeneralModel.star_coordinates_init("SC", filename, doc=doc)
+    if not filename:
+        return
+    session_id = doc.session_context.id if doc.session_context is not None else None
+    # Admission is decided before loading anything, so a rejected session
+    # does not allocate its dataset
+    if session_id is not None and not SessionManager.reserve(session_id,
+                                                             get_file_rows(filename)):
+        LOGGER.info("Rejecting session %s", session_id)
+        doc.add_root(SessionManager.get_message(SessionManager.BUSY_REASON))
+        return
+    try:
+        model = GeneralModel.star_coordinates_init("SC", filename, doc=doc)
+    except:
+        if session_id is not None:
+            SessionManager.unregister(session_id)
+        raise
+    if session_id is not None:
+        SessionManager.register(session_id, model)
+
+
+class SessionCleanupHandler(Handler):
+    """Releases the shared resources of the model of a destroyed session"""
 
-bokeh_app = Application(FunctionHandler(modify_doc))
+    def on_session_destroyed(self, session_context):
+        SessionManager.unregister(session_context.id)
+
+bokeh_app = Application(FunctionHandler(modify_doc), SessionCleanupHandler())
 io_loop = IOLoop.current()
 
+def get_bokeh_ports(workers=BOKEH_WORKERS):
+    """[workers=BOKEH_WORKERS]: (int) number of Bokeh server processes
+       Returns: (List<int>) ports of the Bokeh servers
+    """
+    return [int(BOKEH_PORT) + worker for worker in range(max(workers, 1))]
+
+# Ports of the Bokeh servers in the order new pages are assigned to them
+bokeh_port_cycle = itertools.cycle(get_bokeh_ports())
+
+class SessionTableHandler(RequestHandler):
+    """Table of the sessions of a Bokeh server, as JSON records"""
+
+    def get(self):
+        self.set_header('Content-Type', 'application/json')
+        self.write(SessionManager.get_session_table().to_json(orient='records'))
+
+class WorkerSessionTableHandler(RequestHandler):
+    """Table of the sessions of all the Bokeh workers, as JSON records with
+       the port of their worker. Workers that do not answer are left out
+    """
+    # Seconds to wait for the table of a worker
+    TIMEOUT = 5
+
+    def initialize(self, urls):
+        """urls: (List<String>) urls of the session tables of the workers"""
+        self._urls = urls
+
+    @gen.coroutine
+    def get(self):
+        client = AsyncHTTPClient()
+        responses = yield [client.fetch(url, raise_error=False,
+                                        request_timeout=WorkerSessionTableHandler.TIMEOUT)
+                           for url in self._urls]
+        records = []
+        for url, response in zip(self._urls, responses):
+            if response.error:
+                LOGGER.warn("Could not get the sessions of %s: %s", url, response.error)
+                continue
+            for record in json.loads(response.body):
+                record['port'] = urlparse(url).port
+                records.append(record)
+        records.sort(key=lambda record: -record[SessionManager.IDLE_TIME])
+        self.set_header('Content-Type', 'application/json')
+        self.write(json.dumps(records))
+
+def start_bokeh_server(server_io_loop, port):
+    Server({BOKEH_APP_PATH: bokeh_app}, io_loop=server_io_loop, address=bokeh_listening_address,
+           port=port, allow_websocket_origin=["*"], host=["*"],
+           extra_patterns=[('/sessions', SessionTableHandler)])
+    PeriodicCallback(SessionManager.check_sessions, SessionManager.CHECK_INTERVAL,
+                     io_loop=server_io_loop).start()
+
 def init_bokeh_server():
     try:
-        Server({'/datavisualization': bokeh_app}, io_loop=io_loop, address=bokeh_listening_address,
-               allow_websocket_origin=["*"], host=["*"])
+        start_bokeh_server(io_loop, int(BOKEH_PORT))
     except:
         pass  # Server already started
 
+def run_bokeh_worker(port):
+    """Serves the Bokeh application from a worker process with its own IOLoop.
+       Its sessions stay in the worker, as the embedded page connects back to
+       the port that served it
+    """
+    worker_io_loop = IOLoop()
+    worker_io_loop.make_current()
+    start_bokeh_server(worker_io_loop, port)
+    LOGGER.info("Bokeh worker ready on port %s", port)
+    try:
+        worker_io_loop.start()
+    finally:
+        # The Bokeh server stops the IOLoop when the worker is terminated.
+        # The processes of its AlgorithmExecutor are stopped too instead of
+        # being orphaned
+        AlgorithmExecutor.shutdown(wait=True)
+
+# Processes of the Bokeh workers
+bokeh_workers = []
+
+def start_bokeh_workers():
+    """Starts the BOKEH_WORKERS processes. Uploaded files are shared through
+       the UPLOAD_FOLDER. They are not daemonic, so their AlgorithmExecutor
+       can start its own processes, and are stopped by stop_bokeh_workers
+    """
+    for port in get_bokeh_ports():
+        worker = multiprocessing.Process(target=run_bokeh_worker, args=(port,),
+                                         name='bokeh-worker-{}'.format(port))
+        worker.start()
+        bokeh_workers.append(worker)
+
+def stop_bokeh_workers():
+    """Terminates the Bokeh workers, waiting for them to exit"""
+    while bokeh_workers:
+        worker = bokeh_workers.pop()
+        LOGGER.info("Stopping Bokeh worker %s", worker.name)
+        worker.terminate()
+        worker.join()
+
 # Might need if we upgrade to 0.12.4
 #server.start()
 
@@ -74,32 +214,56 @@ def bokeh_server():
     bokeh_embed = ''
     if get_files():
         LOGGER.info("Rendering Bokeh with sample files from %s", UPLOAD_FOLDER)
-        init_bokeh_server()
+        if not BOKEH_WORKERS:
+            init_bokeh_server()
+        # Every page is served by the next Bokeh server
         bokeh_embed = autoload_server(model=None,
                                       app_path=BOKEH_APP_PATH,
-                                      url="http://{}:{}".format(bokeh_access_address, BOKEH_PORT))
+                                      url="http://{}:{}".format(bokeh_access_address,
+                                                                next(bokeh_port_cycle)))
 
     LOGGER.info("bokeh_server::END")
-    return render_template('index.html', uploader_url=Markup(UPLOADER_URL), bokeh_embed=Markup(bokeh_embed))
+    return render_template('index.html', uploader_url=Markup(UPLOADER_URL), bokeh_embed=Markup(bokeh_embed),
+                           file_infos=get_file_infos())
+
 
+@app.route('/sessions')
+def sessions():
+    """Table of the sessions of the Bokeh server, as JSON records. With
+       BOKEH_WORKERS the WorkerSessionTableHandler gathers the tables of
+       the workers instead
+    """
+    session_table_json = SessionManager.get_session_table().to_json(orient='records')
+    return Response(session_table_json, mimetype='application/json')
 
-@app.route('/uploader', methods=['GET', 'POST'])
-def upload_file():
-    LOGGER.info("upload_file::START")
-    if request.method == 'POST':
-        f = request.files['file']
-        f.save(path.join(app.config['UPLOAD_FOLDER'], f.filename))
 
-    LOGGER.info("upload_file::END")
-    return redirect('/')
+def get_web_application():
+    """Returns: (tornado.web.Application) streaming the uploads natively, so
+                they do not block the IOLoop, and serving the rest of the
+                requests through Flask
+    """
+    handlers = [
+        ('/uploader', UploadHandler, dict(upload_folder=app.config['UPLOAD_FOLDER'])),
+        ('/uploader/progress', UploadProgressHandler)
+        ]
+    if BOKEH_WORKERS:
+        handlers.append(('/sessions', WorkerSessionTableHandler,
+                         dict(urls=['http://{}:{}/sessions'.format(LOCALHOST, port)
+                                    for port in get_bokeh_ports()])))
+    handlers.append(('.*', FallbackHandler, dict(fallback=WSGIContainer(app))))
+    return TornadoApplication(handlers)
 
 if __name__ == '__main__':
     from tornado.httpserver import HTTPServer
-    from tornado.wsgi import WSGIContainer
     from bokeh.util.browser import view
+    if BOKEH_WORKERS:
+        LOGGER.info("Starting %s Bokeh workers", BOKEH_WORKERS)
+        # Before multiprocessing waits for them at exit
+        atexit.register(stop_bokeh_workers)
+        start_bokeh_workers()
     # Serve the Flask app
     LOGGER.info("Initializing WSGI Container")
-    http_server = HTTPServer(WSGIContainer(app))
+    http_server = HTTPServer(get_web_application())
     http_server.listen(FLASK_PORT, address=flask_listening_address)
     access_url = "http://{}:{}/".format(flask_listening_address, FLASK_PORT)
     LOGGER.info("Initializing IO Loop")
@@ -0,0 +1,183 @@
+"""
+    Session Manager
+"""
+
+import logging
+import threading
+import pandas as pd
+from bokeh.models.widgets import Div
+
+class SessionManager(object):
+    """Static class tracking the GeneralModel of every session of the server.
+       Sessions idle for longer than IDLE_TIMEOUT are evicted, releasing their
+       resources, and at most MAX_HEAVY_SESSIONS sessions may hold heavy
+       datasets at the same time
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Seconds without actions after which a session is evicted
+    IDLE_TIMEOUT = 30 * 60
+    # Maximum number of concurrent sessions with heavy datasets
+    MAX_HEAVY_SESSIONS = 4
+    # Seconds without actions after which a heavy session may be evicted
+    # to admit a new one
+    HEAVY_IDLE_TIMEOUT = 5 * 60
+    # Number of values from which a session is heavy
+    HEAVY_ROW_THRESHOLD = 100000
+    # Milliseconds between checks of the sessions
+    CHECK_INTERVAL = 60 * 1000
+    EVICTED_MESSAGE = "<h3>This session was closed {}. Reload the page to start again.</h3>"
+    BUSY_REASON = "because the server is busy"
+    # Columns of the session table
+    SESSION_ID = 'session_id'
+    ROWS = 'rows'
+    MEMORY = 'memory'
+    IDLE_TIME = 'idle_time'
+    LAST_ACTION = 'last_action'
+    HEAVY = 'heavy'
+    # dictionary with the shape {session_id, GeneralModel}
+    _SESSION_MODEL_DIC = dict()
+    # dictionary with the shape {session_id, rows} of the heavy sessions
+    # admitted by reserve whose model is being built
+    _RESERVED_DIC = dict()
+    _LOCK = threading.RLock()
+
+    @staticmethod
+    def reserve(session_id, rows):
+        """Decides whether a new session is admitted before its model is
+           built, so a rejected session does not load its dataset. Admitted
+           heavy sessions count as heavy until registered or unregistered
+           rows: (int) number of values of the file of the session or None
+           if unknown
+           Returns: (Boolean) True if the session was admitted
+        """
+        if rows is None or rows < SessionManager.HEAVY_ROW_THRESHOLD:
+            return True
+        with SessionManager._LOCK:
+            if not SessionManager._make_room(session_id):
+                return False
+            SessionManager._RESERVED_DIC[session_id] = rows
+            return True
+
+    @staticmethod
+    def register(session_id, model):
+        """Tracks the model of a new session. If it is heavy and there are
+           already MAX_HEAVY_SESSIONS heavy sessions, the most idle of them is
+           evicted if idle for HEAVY_IDLE_TIMEOUT. Otherwise the new session is
+           evicted instead
+           Returns: (Boolean) True if the session was admitted
+        """
+        with SessionManager._LOCK:
+            SessionManager._RESERVED_DIC.pop(session_id, None)
+            SessionManager._SESSION_MODEL_DIC[session_id] = model
+            if not SessionManager._is_heavy(model) or SessionManager._make_room(session_id):
+                return True
+            SessionManager.evict(session_id, SessionManager.BUSY_REASON)
+            return False
+
+    @staticmethod
+    def _make_room(session_id):
+        """Evicts the most idle heavy session if there are already
+           MAX_HEAVY_SESSIONS besides the given one and it has been idle for
+           HEAVY_IDLE_TIMEOUT
+           Returns: (Boolean) True if there is room for another heavy session
+        """
+        heavy_sessions = SessionManager._get_heavy_sessions(exclude=session_id)
+        reserved = len([reserved_id for reserved_id in SessionManager._RESERVED_DIC
+                        if reserved_id != session_id])
+        if len(heavy_sessions) + reserved < SessionManager.MAX_HEAVY_SESSIONS:
+            return True
+        if not heavy_sessions:
+            return False
+        idle_session_id, idle_model = heavy_sessions[0]
+        if idle_model.get_idle_time() < SessionManager.HEAVY_IDLE_TIMEOUT:
+            return False
+        SessionManager.evict(idle_session_id, "to make room for other sessions")
+        return True
+
+    @staticmethod
+    def unregister(session_id):
+        """Closes the model of a destroyed session, or frees its reservation
+           if the model was not registered
+        """
+        with SessionManager._LOCK:
+            SessionManager._RESERVED_DIC.pop(session_id, None)
+            model = SessionManager._SESSION_MODEL_DIC.pop(session_id, None)
+        if model is not None:
+            SessionManager.LOGGER.debug("Closing model of session %s", session_id)
+            model.close()
+
+    @staticmethod
+    def evict(session_id, reason):
+        """Closes the model of a session still connected, replacing its
+           document contents with a message
+           reason: (String) reason shown to the user
+        """
+        with SessionManager._LOCK:
+            model = SessionManager._SESSION_MODEL_DIC.pop(session_id, None)
+        if model is None:
+            return
+        SessionManager.LOGGER.info("Evicting session %s %s", session_id, reason)
+        model.close()
+        doc = model.get_document()
+        def show_message():
+            doc.clear()
+            doc.add_root(SessionManager.get_message(reason))
+        doc.add_next_tick_callback(show_message)
+
+    @staticmethod
+    def get_message(reason):
+        """reason: (String) reason the session was closed
+           Returns: (bokeh.models.widgets.Div) message shown to the user
+        """
+        return Div(text=SessionManager.EVICTED_MESSAGE.format(reason))
+
+    @staticmethod
+    def check_sessions():
+        """Evicts the sessions idle for longer than IDLE_TIMEOUT and the most
+           idle heavy sessions over MAX_HEAVY_SESSIONS
+        """
+        with SessionManager._LOCK:
+            for session_id, model in SessionManager._SESSION_MODEL_DIC.items():
+                if model.get_idle_time() > SessionManager.IDLE_TIMEOUT:
+                    SessionManager.evict(session_id, "after being idle")
+            heavy_sessions = SessionManager._get_heavy_sessions()
+            for session_id, _ in heavy_sessions[:-SessionManager.MAX_HEAVY_SESSIONS or None]:
+                SessionManager.evict(session_id, "to make room for other sessions")
+
+    @staticmethod
+    def get_model(session_id):
+        return SessionManager._SESSION_MODEL_DIC.get(session_id)
+
+    @staticmethod
+    def get_session_table():
+        """Returns: (pandas.DataFrame) row per session with its number of
+                    values, estimated memory, seconds idle and last action,
+                    sorted from most to least idle
+        """
+        with SessionManager._LOCK:
+            session_models = SessionManager._SESSION_MODEL_DIC.items()
+        table = [{SessionManager.SESSION_ID: session_id,
+                  SessionManager.ROWS: model.get_number_of_values(),
+                  SessionManager.MEMORY: model.get_memory_usage(),
+                  SessionManager.IDLE_TIME: model.get_idle_time(),
+                  SessionManager.LAST_ACTION: model.get_last_action(),
+                  SessionManager.HEAVY: SessionManager._is_heavy(model)}
+                 for session_id, model in session_models]
+        columns = [SessionManager.SESSION_ID, SessionManager.ROWS, SessionManager.MEMORY,
+                   SessionManager.IDLE_TIME, SessionManager.LAST_ACTION, SessionManager.HEAVY]
+        table_df = pd.DataFrame(table, columns=columns)
+        return table_df.sort_values(SessionManager.IDLE_TIME, ascending=False)
+
+    @staticmethod
+    def _is_heavy(model):
+        return model.get_number_of_values() >= SessionManager.HEAVY_ROW_THRESHOLD
+
+    @staticmethod
+    def _get_heavy_sessions(exclude=None):
+        """Returns: (List<Tuple>) (session_id, GeneralModel) of the heavy
+                    sessions, sorted from most to least idle
+        """
+        heavy_sessions = [(session_id, model) for session_id, model
+                          in SessionManager._SESSION_MODEL_DIC.items()
+                          if session_id != exclude and SessionManager._is_heavy(model)]
+        return sorted(heavy_sessions, key=lambda session: -session[1].get_idle_time())
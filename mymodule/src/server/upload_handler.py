@@ -0,0 +1,206 @@
+"""
+    Upload Handler
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tornado import web
+from ..backend.io.directory_index import DirectoryIndex
+from ..backend.io.reader import Reader
+from ..frontend.view.controllers.file_controller import FileController
+
+@web.stream_request_body
+class UploadHandler(web.RequestHandler):
+    """Receives the file of a multipart form in chunks, writing them to disk
+       as they arrive instead of buffering the whole body in memory. Once
+       received, the file is converted to the columnar cache in a background
+       worker and listed by the FileController when the conversion finishes
+    """
+    LOGGER = logging.getLogger(__name__)
+    # Maximum bytes of a request
+    MAX_SIZE = 2 * 1024 ** 3
+    # Maximum bytes of the headers of the file part
+    MAX_HEADER_SIZE = 64 * 1024
+    RECEIVED = 'received'
+    CONVERTING = 'converting'
+    READY = 'ready'
+    FAILED = 'failed'
+    # dictionary with the shape {filename, {'status', 'bytes', 'progress'}}
+    # of the uploads of the process
+    _PROGRESS_DIC = dict()
+    _LOCK = threading.Lock()
+    # Workers converting the uploaded files
+    MAX_WORKERS = 1
+    _EXECUTOR = None
+
+    @staticmethod
+    def _get_executor():
+        with UploadHandler._LOCK:
+            if UploadHandler._EXECUTOR is None:
+                UploadHandler._EXECUTOR = ThreadPoolExecutor(UploadHandler.MAX_WORKERS)
+            return UploadHandler._EXECUTOR
+
+    @staticmethod
+    def get_progress():
+        """Returns: (Dictionary) with the shape {filename, {'status', 'bytes',
+                    'progress'}} where progress is the fraction converted
+        """
+        with UploadHandler._LOCK:
+            return dict((filename, dict(progress))
+                        for filename, progress in UploadHandler._PROGRESS_DIC.items())
+
+    @staticmethod
+    def _set_progress(filename, **progress):
+        with UploadHandler._LOCK:
+            UploadHandler._PROGRESS_DIC.setdefault(filename, dict()).update(progress)
+
+    def initialize(self, upload_folder, redirect_url='/'):
+        """upload_folder: (String) directory where the files are stored
+           [redirect_url='/']: (String) page shown once the file is received
+        """
+        self._upload_folder = upload_folder
+        self._redirect_url = redirect_url
+        self._delimiter = None
+        self._buffer = b''
+        self._file = None
+        self._file_path = None
+        # Temporary file receiving the upload, renamed to _file_path once
+        # received completely
+        self._part_path = None
+        self._received = False
+        # Error found while streaming, answered once the body is consumed
+        self._error = None
+
+    def prepare(self):
+        self.request.connection.set_max_body_size(UploadHandler.MAX_SIZE)
+        content_length = int(self.request.headers.get('Content-Length', 0))
+        if content_length > UploadHandler.MAX_SIZE:
+            raise web.HTTPError(413, "Files can not be bigger than %s bytes",
+                                UploadHandler.MAX_SIZE)
+        if self.request.method != 'POST':
+            return
+        boundary = re.search(r'boundary="?([^";]+)"?',
+                             self.request.headers.get('Content-Type', ''))
+        if boundary is None:
+            raise web.HTTPError(400, "Expected a multipart form")
+        self._delimiter = b'\r\n--' + boundary.group(1).encode('latin-1')
+
+    def data_received(self, chunk):
+        if self._received or self._error is not None:
+            return
+        if self._file is None:
+            chunk = self._open_file(chunk)
+            if chunk is None:
+                return
+        # Keep back the bytes that could be the start of the delimiter
+        data = self._buffer + chunk
+        end = data.find(self._delimiter)
+        if end >= 0:
+            self._file.write(data[:end])
+            self._file.close()
+            self._received = True
+            return
+        keep = len(self._delimiter) - 1
+        self._file.write(data[:-keep])
+        self._buffer = data[-keep:]
+
+    def _open_file(self, chunk):
+        """Parses the headers of the file part, opening the temporary file
+           Returns: (String) data of the chunk after the headers or None if
+                    they are not complete yet
+        """
+        self._buffer += chunk
+        header_end = self._buffer.find(b'\r\n\r\n')
+        if header_end < 0:
+            if len(self._buffer) > UploadHandler.MAX_HEADER_SIZE:
+                self._error = web.HTTPError(400, "Could not find the file in the form")
+            return None
+        try:
+            headers = self._buffer[:header_end].decode('utf-8')
+        except UnicodeDecodeError:
+            self._error = web.HTTPError(400, "The headers of the file are not valid UTF-8")
+            return None
+        filename = re.search(r'filename="([^"]*)"', headers)
+        filename = os.path.basename(filename.group(1)) if filename else ''
+        if filename.split('.')[-1].upper() not in FileController.AVAILABLE_EXTENSIONS:
+            self._error = web.HTTPError(400, "'%s' is not a valid file", filename)
+            return None
+        self._file_path = os.path.join(self._upload_folder, filename)
+        # Unique for concurrent uploads of the same file, and not listed
+        # until renamed, as its extension is not valid
+        part_file, self._part_path = tempfile.mkstemp(dir=self._upload_folder, suffix='.part')
+        self._file = os.fdopen(part_file, 'wb')
+        chunk = self._buffer[header_end + 4:]
+        self._buffer = b''
+        return chunk
+
+    def on_connection_close(self):
+        if self._part_path is not None and not self._received:
+            UploadHandler.LOGGER.warn("Upload of '%s' interrupted", self._file_path)
+        self._remove_part()
+
+    def on_finish(self):
+        # Left only if the upload failed
+        self._remove_part()
+
+    def _remove_part(self):
+        """Removes the temporary file of an upload that was not stored"""
+        if self._part_path is None:
+            return
+        self._file.close()
+        if os.path.exists(self._part_path):
+            os.remove(self._part_path)
+        self._part_path = None
+
+    def get(self):
+        self.redirect(self._redirect_url)
+
+    def post(self):
+        if self._error is not None:
+            self._remove_part()
+            raise self._error
+        if not self._received:
+            self._remove_part()
+            raise web.HTTPError(400, "The file was not received completely")
+        filename = os.path.basename(self._file_path)
+        UploadHandler.LOGGER.info("Received '%s'", filename)
+        # The file is hidden until converted
+        open(FileController.get_pending_marker(self._file_path), 'w').close()
+        os.rename(self._part_path, self._file_path)
+        self._part_path = None
+        UploadHandler._set_progress(filename, status=UploadHandler.RECEIVED,
+                                    bytes=os.path.getsize(self._file_path), progress=0.)
+        UploadHandler._get_executor().submit(UploadHandler._convert, self._file_path)
+        self.redirect(self._redirect_url)
+
+    @staticmethod
+    def _convert(file_path):
+        """Reads the file, writing its columnar cache, and makes it available.
+           Files that can not be read are removed
+        """
+        filename = os.path.basename(file_path)
+        def update_progress(chunked_reader):
+            UploadHandler._set_progress(filename, status=UploadHandler.CONVERTING,
+                                        progress=chunked_reader.get_progress())
+        try:
+            Reader.read_from_file(file_path, use_cache=True, progress_callback=update_progress)
+            # Detected from the new cache for the upload page
+            DirectoryIndex.get_index(os.path.dirname(file_path)).get_file_details(filename)
+            UploadHandler._set_progress(filename, status=UploadHandler.READY, progress=1.)
+        except Exception:
+            UploadHandler.LOGGER.warn("Could not convert '%s'", filename, exc_info=True)
+            UploadHandler._set_progress(filename, status=UploadHandler.FAILED)
+            os.remove(file_path)
+        finally:
+            os.remove(FileController.get_pending_marker(file_path))
+
+
+class UploadProgressHandler(web.RequestHandler):
+    """Progress of the uploads, as JSON"""
+
+    def get(self):
+        self.write(UploadHandler.get_progress())
@@ -0,0 +1,16 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.backend.algorithms.classification.pca_classification import pca
+from .....src.backend.algorithms.classification.randomized_pca_classification import\
+     randomized_pca
+
+class RandomizedPCATest(unittest.TestCase):
+    def test_matches_exact_pca(self):
+        np.random.seed(0)
+        values_df = pd.DataFrame(np.random.randn(500, 6).dot(np.diag([5, 3, 1, .5, .2, .1])),
+                                 columns=list('abcdef'))
+        exact_df = pca(values_df)
+        randomized_df = randomized_pca(values_df)
+        self.assertEqual(exact_df.index.tolist(), randomized_df.index.tolist())
+        np.testing.assert_allclose(randomized_df.values, exact_df.values, atol=1e-8)
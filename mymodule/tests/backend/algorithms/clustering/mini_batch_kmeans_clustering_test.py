@@ -0,0 +1,26 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.backend.algorithms.clustering.mini_batch_kmeans_clustering import\
+     mini_batch_kmeans, adapt_centroids
+
+class MiniBatchKMeansTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.centers = np.array([[0., 0.], [0., 10.], [10., 0.], [10., 10.]])
+        points = self.centers[np.arange(400) % 4] + np.random.randn(400, 2) * 0.1
+        self.values_df = pd.DataFrame(points)
+
+    def test_adapt_centroids_keeps_previous_ones(self):
+        more = adapt_centroids(self.values_df.values, self.centers[:3], 4)
+        self.assertEqual(more.shape, (4, 2))
+        np.testing.assert_array_equal(more[:3], self.centers[:3])
+        self.assertTrue(np.linalg.norm(more[3] - self.centers[3]) < 1, 'New centroid not in gap')
+        fewer = adapt_centroids(self.values_df.values, self.centers, 3)
+        self.assertEqual(fewer.shape, (3, 2))
+
+    def test_warm_start_finds_clusters(self):
+        labels, centroids = mini_batch_kmeans(self.values_df, n_clusters=4,
+                                              init_centroids=self.centers[:3], batch_size=100)
+        self.assertEqual(len(set(labels)), 4)
+        self.assertEqual(centroids.shape, (4, 2))
@@ -0,0 +1,20 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates,\
+                                                                        star_coordinates_delta
+
+class StarCoordinatesMapperTest(unittest.TestCase):
+    def test_delta_matches_full_mapping(self):
+        np.random.seed(0)
+        values_df = pd.DataFrame(np.random.rand(10, 3), columns=['a', 'b', 'c'])
+        vectors_df = pd.DataFrame(np.random.rand(3, 2), index=['a', 'b', 'c'],
+                                  columns=['x', 'y'])
+        mapped_points_df = star_coordinates(values_df, vectors_df)
+        new_vectors_df = vectors_df.copy()
+        new_vectors_df.loc['c'] = [-0.5, 0.75]
+        delta_vectors_df = (new_vectors_df - vectors_df).loc[['c']]
+        delta_df = star_coordinates_delta(values_df, delta_vectors_df, mapped_points_df)
+        expected_df = star_coordinates(values_df, new_vectors_df)
+        np.testing.assert_allclose(delta_df.values, expected_df.values)
+        self.assertTrue(delta_df.index.equals(expected_df.index))
@@ -0,0 +1,46 @@
+import unittest
+import pandas as pd
+import numpy as np
+from .....src.backend.algorithms.normalization.feature_scaling_normalization import feature_scaling
+from .....src.backend.algorithms.normalization.centered_normalization import centered
+from .....src.backend.algorithms.normalization.standardized_normalization import standardized
+
+class NormalizationTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame([[1, 5, 2], [3, 5, 4], [5, 5, 9]],
+                               index=['p1', 'p2', 'p3'], columns=['a', 'b', 'c'])
+
+    def test_feature_scaling(self):
+        norm_df = feature_scaling(self.df)
+        self.assertEqual(list(norm_df['a']), [0, 0.5, 1], "Incorrect column 'a' scaling")
+        self.assertEqual(list(norm_df['b']), [1, 1, 1], "Zero range column must be 1")
+        self.assertTrue(norm_df.index.equals(self.df.index))
+        self.assertTrue(norm_df.columns.equals(self.df.columns))
+
+    def test_feature_scaling_df_level(self):
+        norm_df = feature_scaling(self.df, df_level=True)
+        self.assertEqual(list(norm_df['a']), [0, 0.25, 0.5], "Incorrect column 'a' scaling")
+        self.assertEqual(norm_df.at['p3', 'c'], 1, "Incorrect max value scaling")
+
+    def test_centered(self):
+        norm_df = centered(self.df)
+        self.assertEqual(list(norm_df['a']), [-0.5, 0, 0.5], "Incorrect column 'a' centering")
+        self.assertEqual(list(norm_df['b']), [1, 1, 1], "Zero range column must be 1")
+
+    def test_standardized(self):
+        norm_df = standardized(self.df)
+        column_a = norm_df['a']
+        self.assertAlmostEqual(np.mean(column_a), 0, msg="Incorrect column 'a' mean")
+        self.assertAlmostEqual(np.std(column_a), 1, msg="Incorrect column 'a' std")
+
+    def test_missing_values_are_skipped(self):
+        self.df = self.df.astype(float)
+        self.df.at['p1', 'a'] = np.nan
+        for normalization, expected in [(feature_scaling, [0, 1]),
+                                        (centered, [-0.5, 0.5]),
+                                        (standardized, [-1, 1])]:
+            column_a = normalization(self.df)['a']
+            self.assertTrue(np.isnan(column_a['p1']))
+            self.assertEqual(list(column_a[['p2', 'p3']]), expected,
+                             "Incorrect column 'a' {}".format(normalization.__name__))
+        self.assertEqual(feature_scaling(self.df, df_level=True).at['p3', 'c'], 1)
@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....src.backend.io.columnar_cache import ColumnarCache
+from ....src.backend.io.reader import Reader
+
+class ColumnarCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'sample.csv')
+        self._write_file("name;kind;a;b\np1;x;1;0.5\np2;y;2;1.5\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_from_cache(self):
+        self.assertFalse(ColumnarCache.has_cache(self.file_path, True))
+        original_df = Reader.read_from_file(self.file_path)
+        self.assertTrue(ColumnarCache.has_cache(self.file_path, True), 'Cache was not written')
+        cached_df = ColumnarCache.read(self.file_path, True)
+        self.assertTrue(original_df.equals(cached_df), 'Cached DataFrame differs')
+        self.assertEqual(original_df.index.name, cached_df.index.name)
+        self.assertEqual(list(original_df.dtypes), list(cached_df.dtypes))
+
+    def test_read_layout(self):
+        self.assertIsNone(ColumnarCache.read_layout(self.file_path, True))
+        original_df = Reader.read_from_file(self.file_path)
+        rows, dtypes = ColumnarCache.read_layout(self.file_path, True)
+        self.assertEqual(rows, 2)
+        self.assertEqual(list(dtypes.keys()), original_df.columns.tolist())
+        self.assertEqual(list(dtypes.values()), list(original_df.dtypes))
+
+    def test_modified_file_invalidates_cache(self):
+        Reader.read_from_file(self.file_path)
+        self._write_file("name;kind;a;b\np1;x;1;0.5\np2;y;2;1.5\np3;z;3;2.5\n")
+        self.assertIsNone(ColumnarCache.read(self.file_path, True), 'Cache should be stale')
+        self.assertEqual(len(Reader.read_from_file(self.file_path).index), 3)
+        cache_directory = os.path.join(self.directory, ColumnarCache.CACHE_DIRECTORY)
+        self.assertEqual(len(os.listdir(cache_directory)), 1, 'Previous cache was not removed')
+
+    def _write_file(self, content):
+        with open(self.file_path, 'w') as csv_file:
+            csv_file.write(content)
+        # Guarantee a different modification time
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, (stat.st_atime, stat.st_mtime + len(content)))
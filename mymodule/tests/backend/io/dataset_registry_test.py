@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from ....src.backend.io import dataset_registry
+from ....src.backend.io.dataset_registry import DatasetRegistry
+
+class ReaderStub(object):
+    """Counts the reads, waiting for the test to let those of the gated
+       file finish
+    """
+    def __init__(self, reader, gated_path):
+        self.reader = reader
+        self.gated_path = gated_path
+        self.read_paths = []
+        self.is_reading = False
+        self.started = threading.Event()
+        self.finish = threading.Event()
+
+    def read_from_file_with_statistics(self, file_path, *args, **kwargs):
+        self.read_paths.append(file_path)
+        if file_path == self.gated_path:
+            self.is_reading = True
+            self.started.set()
+            self.finish.wait(5)
+            self.is_reading = False
+        return self.reader.read_from_file_with_statistics(file_path, *args, **kwargs)
+
+class DatasetRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.memory_limit = DatasetRegistry.MEMORY_LIMIT
+        self.file_paths = []
+        for i in range(2):
+            file_path = os.path.join(self.directory, 'sample_{}.csv'.format(i))
+            with open(file_path, 'w') as csv_file:
+                csv_file.write("name;kind;a;b\np1;x;1;0.5\np2;y;{};1.5\n".format(i))
+            self.file_paths.append(file_path)
+
+    def tearDown(self):
+        DatasetRegistry.set_memory_limit(self.memory_limit)
+        shutil.rmtree(self.directory)
+
+    def test_acquire_shares_dataset(self):
+        first = DatasetRegistry.acquire(self.file_paths[0])
+        second = DatasetRegistry.acquire(self.file_paths[0])
+        self.assertIs(first, second, 'Dataset was read twice')
+        self.assertEqual(first.get_ref_count(), 2)
+        DatasetRegistry.release(first)
+        DatasetRegistry.release(second)
+        self.assertEqual(first.get_ref_count(), 0)
+
+    def test_evicts_only_unused_datasets(self):
+        used = DatasetRegistry.acquire(self.file_paths[0])
+        unused = DatasetRegistry.acquire(self.file_paths[1])
+        DatasetRegistry.release(unused)
+        DatasetRegistry.set_memory_limit(0)
+        registered_files = DatasetRegistry.get_registered_files()
+        self.assertIn(self.file_paths[0], registered_files, 'Dataset in use was evicted')
+        self.assertNotIn(self.file_paths[1], registered_files, 'Unused dataset was not evicted')
+        DatasetRegistry.release(used)
+        self.assertNotIn(self.file_paths[0], DatasetRegistry.get_registered_files())
+
+    def test_file_is_read_once_outside_the_lock(self):
+        reader_stub = ReaderStub(dataset_registry.Reader, self.file_paths[0])
+        dataset_registry.Reader = reader_stub
+        datasets = []
+        threads = [threading.Thread(target=lambda: datasets.append(
+            DatasetRegistry.acquire(self.file_paths[0]))) for _ in range(2)]
+        try:
+            for thread in threads:
+                thread.start()
+            self.assertTrue(reader_stub.started.wait(5))
+            # Other files are registered while the first one is being read
+            other = DatasetRegistry.acquire(self.file_paths[1])
+            self.assertTrue(reader_stub.is_reading, 'Other file waited for the first read')
+            DatasetRegistry.release(other)
+            reader_stub.finish.set()
+            for thread in threads:
+                thread.join(5)
+        finally:
+            dataset_registry.Reader = reader_stub.reader
+        for file_path in self.file_paths:
+            self.assertEqual(reader_stub.read_paths.count(file_path), 1,
+                             'Same file was read twice')
+        self.assertEqual(len(datasets), 2)
+        self.assertIs(datasets[0], datasets[1], 'Dataset is not shared')
+        self.assertEqual(datasets[0].get_ref_count(), 2)
+        for dataset in datasets:
+            DatasetRegistry.release(dataset)
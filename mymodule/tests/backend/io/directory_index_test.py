@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....src.backend.io.directory_index import DirectoryIndex
+from ....src.backend.io.reader import Reader
+
+class DirectoryIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self._write('b.csv', 'name;x;label\nfirst;1;a\nsecond;2;b\n')
+        os.mkdir(os.path.join(self.directory, 'sub'))
+        self.index = DirectoryIndex(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, filename, content):
+        with open(os.path.join(self.directory, filename), 'w') as output_file:
+            output_file.write(content)
+
+    def test_lists_regular_files(self):
+        self.assertEqual(self.index.get_filenames(), ['b.csv'])
+
+    def test_refreshes_when_directory_changes(self):
+        self.index.get_filenames()
+        self._write('a.csv', 'name;x\n')
+        # Make sure the modification time of the directory changes
+        os.utime(self.directory, (0, 0))
+        self.assertEqual(self.index.get_filenames(), ['a.csv', 'b.csv'])
+
+    def test_file_details(self):
+        self.assertNotIn(DirectoryIndex.ROWS, self.index.get_file_info('b.csv'))
+        details = self.index.get_file_details('b.csv')
+        self.assertEqual(details[DirectoryIndex.ROWS], 2)
+        self.assertEqual(details[DirectoryIndex.DIMENSIONAL], ['x'])
+        self.assertEqual(details[DirectoryIndex.NOMINAL], ['label'])
+        self.assertEqual(self.index.get_file_info('b.csv')[DirectoryIndex.ROWS], 2)
+        self.assertIsNone(self.index.get_file_info('missing.csv'))
+
+    def test_file_details_from_cache(self):
+        Reader.read_from_file(os.path.join(self.directory, 'b.csv'), use_cache=True)
+        details = self.index.get_file_details('b.csv')
+        self.assertEqual(details[DirectoryIndex.ROWS], 2)
+        self.assertEqual(details[DirectoryIndex.COLUMNS], 2)
+        self.assertEqual(details[DirectoryIndex.DIMENSIONAL], ['x'])
+        self.assertEqual(details[DirectoryIndex.NOMINAL], ['label'])
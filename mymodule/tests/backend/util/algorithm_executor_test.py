@@ -0,0 +1,29 @@
+import unittest
+import pandas as pd
+from concurrent.futures import Future
+from ....src.backend.util.algorithm_executor import AlgorithmExecutor, SharedValues
+from ....src.backend.algorithms.normalization.feature_scaling_normalization import feature_scaling
+
+class AlgorithmExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.values_df = pd.DataFrame(dict(a=[1., 2., 3.], b=[0., 5., 10.]),
+                                      index=['p1', 'p2', 'p3'])
+
+    def test_shared_values_round_trip(self):
+        shared_values = SharedValues(self.values_df, AlgorithmExecutor.SHARED_MEMORY_DIRECTORY)
+        try:
+            self.assertTrue(shared_values.load().equals(self.values_df))
+        finally:
+            shared_values.remove()
+        self.assertFalse(SharedValues.can_share(pd.Series(['x', 'y'])))
+
+    def test_submit_in_process_pool(self):
+        future = AlgorithmExecutor.submit('session', feature_scaling, self.values_df)
+        self.assertTrue(future.result(timeout=60).equals(feature_scaling(self.values_df)))
+
+    def test_cancel_session_cancels_tracked_futures(self):
+        future = Future()
+        AlgorithmExecutor.track('session', future)
+        AlgorithmExecutor.cancel_session('session')
+        self.assertTrue(future.cancelled(), 'Tracked future was not cancelled')
+        self.assertNotIn('session', AlgorithmExecutor._SESSION_FUTURE_DIC)
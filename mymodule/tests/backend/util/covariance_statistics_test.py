@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ....src.backend.util.covariance_statistics import CovarianceStatistics
+from ....src.backend.algorithms.classification.pca_classification import pca,\
+     pca_from_statistics
+from ....src.backend.algorithms.classification.lda_classification import lda,\
+     lda_from_statistics
+
+class CovarianceStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.classes = np.random.randint(0, 4, 300)
+        values = np.random.randn(300, 5).dot(np.diag([4, 3, 2, 1, .5]))
+        values += self.classes[:, np.newaxis] * np.arange(5)
+        self.values_df = pd.DataFrame(values, columns=list('abcde'))
+        self.statistics = CovarianceStatistics(self.values_df)
+
+    def test_covariance(self):
+        np.testing.assert_allclose(self.statistics.get_covariance(),
+                                   np.cov(self.values_df.values, rowvar=False))
+
+    def test_within_class_scatter(self):
+        _, means, within_scatter = self.statistics.get_class_statistics(self.values_df,
+                                                                        self.classes)
+        centered = self.values_df.values - means[self.classes]
+        np.testing.assert_allclose(within_scatter, centered.T.dot(centered))
+
+    def test_pca_from_statistics(self):
+        np.testing.assert_allclose(pca_from_statistics(self.values_df, self.statistics).values,
+                                   pca(self.values_df).values, atol=1e-8)
+
+    def test_lda_from_statistics(self):
+        # The sign of the LDA axes is arbitrary
+        np.testing.assert_allclose(np.abs(lda_from_statistics(self.values_df, self.classes,
+                                                              self.statistics).values),
+                                   np.abs(lda(self.values_df, self.classes).values), atol=1e-8)
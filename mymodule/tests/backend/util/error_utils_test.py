@@ -0,0 +1,27 @@
+import unittest
+import pandas as pd
+from ....src.backend.util.error_utils import ErrorUtils
+
+class ErrorUtilsTest(unittest.TestCase):
+    def setUp(self):
+        self.values_df = pd.DataFrame([[1, 0.5], [0, 1], [0.5, 0.5]],
+                                      index=['p', 'p', 'q'], columns=['a', 'b'])
+        self.vectors_df = pd.DataFrame([[1, 0], [0, -1]], index=['a', 'b'], columns=['x', 'y'])
+        self.mapped_points_df = self.values_df.dot(self.vectors_df)
+        self.mapped_points_df.columns = ['x', 'y']
+
+    def test_get_general_error_df(self):
+        error_df = ErrorUtils.get_general_error_df(self.values_df, self.vectors_df,
+                                                   self.mapped_points_df)
+        # Point 0 -> mapped (1, -0.5); axis 'a' expects (1, 0); axis 'b' expects (0, 0.5)
+        self.assertEqual(error_df.at[0, 'a'], 0.5, "Incorrect error of point 0 on axis 'a'")
+        self.assertEqual(error_df.at[0, 'b'], 2, "Incorrect error of point 0 on axis 'b'")
+        self.assertEqual(list(error_df.index), [0, 1, 2], 'Rows must be renumbered')
+        self.assertEqual(list(error_df.columns), ['a', 'b'], 'Columns must match the axis')
+
+    def test_get_general_error_df_chunked(self):
+        error_df = ErrorUtils.get_general_error_df(self.values_df, self.vectors_df,
+                                                   self.mapped_points_df, chunk_size=None)
+        chunked_error_df = ErrorUtils.get_general_error_df(self.values_df, self.vectors_df,
+                                                           self.mapped_points_df, chunk_size=2)
+        self.assertTrue(error_df.equals(chunked_error_df), 'Chunking must not change the result')
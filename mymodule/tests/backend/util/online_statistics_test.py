@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ....src.backend.util.online_statistics import OnlineStatistics
+
+class OnlineStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.df = pd.DataFrame(dict(a=np.random.rand(100) * 10,
+                                    b=np.random.randint(-5, 5, 100),
+                                    c=['label'] * 100))
+
+    def test_chunks_match_whole_dataframe(self):
+        statistics = OnlineStatistics()
+        for start in range(0, 100, 30):
+            statistics.update(self.df.iloc[start:start + 30])
+        values = self.df[['a', 'b']].values.astype(float)
+        columns = ['a', 'b']
+        np.testing.assert_allclose(statistics.get_statistic(OnlineStatistics.MINIMUM, columns),
+                                   values.min(axis=0))
+        np.testing.assert_allclose(statistics.get_statistic(OnlineStatistics.MAXIMUM, columns),
+                                   values.max(axis=0))
+        np.testing.assert_allclose(statistics.get_statistic(OnlineStatistics.MEAN, columns),
+                                   values.mean(axis=0))
+        np.testing.assert_allclose(statistics.get_statistic(OnlineStatistics.STD, columns),
+                                   values.std(axis=0))
+        self.assertIsNone(statistics.get_statistic(OnlineStatistics.MEAN, ['a', 'c']),
+                          'Nominal columns should not have statistics')
+
+    def test_missing_values_are_skipped(self):
+        statistics = OnlineStatistics()
+        statistics.update(pd.DataFrame(dict(a=[np.nan, 1.])))
+        statistics.update(pd.DataFrame(dict(a=[np.nan, 3.])))
+        self.assertEqual(statistics.get_statistic(OnlineStatistics.MAXIMUM, ['a'])[0], 3.)
+        self.assertEqual(statistics.get_statistic(OnlineStatistics.MEAN, ['a'])[0], 2.)
+        self.assertEqual(statistics.get_statistic(OnlineStatistics.STD, ['a'])[0], 1.)
+        self.assertEqual(statistics.get_rows('a'), 4)
+        statistics.update(pd.DataFrame(dict(b=[np.nan])))
+        self.assertTrue(np.isnan(statistics.get_statistic(OnlineStatistics.MINIMUM, ['b'])[0]),
+                        'Columns without values should give NaN')
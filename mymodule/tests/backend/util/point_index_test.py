@@ -0,0 +1,24 @@
+import unittest
+import numpy as np
+from ....src.backend.util.point_index import PointIndex
+
+class PointIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.point_index = PointIndex(['a', 'b', 'c', 'd'])
+        self.point_index.update_coordinates(np.array([0., 1, 2, np.nan]),
+                                            np.array([0., 1, 4, 0]))
+
+    def test_get_row(self):
+        self.assertEqual(self.point_index.get_row('c'), 2)
+        self.assertIsNone(self.point_index.get_row('e'))
+        self.assertTrue(self.point_index.has_point('d'))
+
+    def test_get_nearest_row(self):
+        self.assertEqual(self.point_index.get_nearest_row(0.9, 1.2), 1)
+        self.assertEqual(self.point_index.get_nearest_row(-1, 0.1), 0)
+        self.assertIsNone(self.point_index.get_nearest_row(10, 10, max_distance=1))
+
+    def test_coordinates_are_updated(self):
+        self.assertEqual(self.point_index.get_nearest_row(2, 4), 2)
+        self.point_index.update_coordinates(np.array([2., 0, 0, 0]), np.array([4., 0, 0, 0]))
+        self.assertEqual(self.point_index.get_nearest_row(2, 4), 0)
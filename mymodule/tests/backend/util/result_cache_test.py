@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ....src.backend.util.result_cache import ResultCache
+
+class ResultCacheTest(unittest.TestCase):
+    def test_fingerprint_follows_content(self):
+        df = pd.DataFrame(dict(a=[1., 2.], b=[3., 4.]), index=['p1', 'p2'])
+        self.assertEqual(ResultCache.get_fingerprint(df), ResultCache.get_fingerprint(df.copy()))
+        self.assertNotEqual(ResultCache.get_fingerprint(df),
+                            ResultCache.get_fingerprint(df[['a']]))
+        self.assertNotEqual(ResultCache.get_fingerprint(df),
+                            ResultCache.get_fingerprint(df.rename(index={'p1': 'p3'})))
+        self.assertEqual(ResultCache.get_fingerprint(['x', 'y']),
+                         ResultCache.get_fingerprint(['x', 'y']))
+        self.assertNotEqual(ResultCache.get_fingerprint(pd.Series(['x', 'y'])),
+                            ResultCache.get_fingerprint(pd.Series(['y', 'x'])))
+        self.assertNotEqual(ResultCache.get_fingerprint(np.array(['x', 'x', 'y'], dtype=object)),
+                            ResultCache.get_fingerprint(np.array(['x', 'y', 'y'], dtype=object)))
+        self.assertNotEqual(ResultCache.get_fingerprint(np.array([1, '1'], dtype=object)),
+                            ResultCache.get_fingerprint(np.array(['1', 1], dtype=object)))
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache('test', memory_limit=2 * 800)
+        cache.put('first', np.zeros(100))
+        cache.put('second', np.zeros(100))
+        cache.get('first')
+        cache.put('third', np.zeros(100))
+        self.assertIn('first', cache)
+        self.assertNotIn('second', cache)
+        self.assertEqual(cache.get_memory_usage(), 2 * 800)
+        self.assertEqual(cache.get_or_compute('third', lambda: None).shape, (100,))
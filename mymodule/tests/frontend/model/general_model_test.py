@@ -0,0 +1,26 @@
+import unittest
+from ....src.frontend.model.general_model import GeneralModel
+
+class DocumentStub(object):
+    session_context = None
+
+class ViewStub(object):
+    def __init__(self):
+        self.palette = None
+
+    def update_palette(self, new):
+        self.palette = new
+
+class GeneralModelTest(unittest.TestCase):
+    def setUp(self):
+        self.model = GeneralModel(doc=DocumentStub())
+        self.model._active_view = ViewStub()
+
+    def test_actions_are_recorded(self):
+        self.assertIsNone(self.model.get_last_action())
+        self.model.new_palette_select_action('Blues')
+        self.assertEqual(self.model._active_view.palette, 'Blues')
+        self.assertEqual(self.model.get_last_action(), 'new_palette_select_action')
+        self.assertEqual(GeneralModel.new_palette_select_action.__name__,
+                         'new_palette_select_action')
+
@@ -0,0 +1,105 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.animation.mapping_animator import MappingAnimator
+from .....src.frontend.view.controllers.mapper_controller import MapperController
+
+class DocumentStub(object):
+    session_context = object()
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_periodic_callback(self, callback, period_milliseconds):
+        self.callbacks.append(callback)
+
+    def remove_periodic_callback(self, callback):
+        self.callbacks.remove(callback)
+
+class PointControllerStub(object):
+    def __init__(self):
+        self.coordinates = []
+
+    def update_coordinates(self, x, y):
+        self.coordinates.append((list(x), list(y)))
+
+class NormalizationControllerStub(object):
+    def __init__(self, values_df):
+        self.values_df = values_df
+
+    def get_last_normalized_values(self):
+        return self.values_df
+
+class VectorControllerStub(object):
+    def __init__(self, vectors_df):
+        self.vectors_df = vectors_df
+
+    def get_vectors(self):
+        return self.vectors_df
+
+class AnimatorStub(object):
+    def __init__(self):
+        self.animations = []
+
+    def get_animation_sequence(self, original_points, mapped_points):
+        self.animations.append((original_points, mapped_points))
+
+class MappingAnimatorTest(unittest.TestCase):
+    def setUp(self):
+        self.original_points = pd.DataFrame([[0, 0], [1, 1]], columns=['x', 'y'])
+        # The second point moves vertically
+        self.mapped_points = pd.DataFrame([[2, 4], [1, -1]], columns=['x', 'y'])
+
+    def test_get_frames(self):
+        frames = MappingAnimator.get_frames(self.original_points, self.mapped_points, 2)
+        self.assertEqual(frames.shape, (2, 2, 2), 'Incorrect frames shape')
+        self.assertEqual(list(frames[0, 0]), [1, 1], 'Incorrect x coordinates of first frame')
+        self.assertEqual(list(frames[0, 1]), [2, 0], 'Incorrect y coordinates of first frame')
+        self.assertEqual(list(frames[1, 0]), [2, 1], 'Last frame must match the mapped x')
+        self.assertEqual(list(frames[1, 1]), [4, -1], 'Last frame must match the mapped y')
+
+    def test_get_number_of_steps(self):
+        self.assertEqual(MappingAnimator.get_number_of_steps(10, max_steps=5), 5)
+        self.assertEqual(MappingAnimator.get_number_of_steps(MappingAnimator.MAX_BUFFER_SIZE), 1)
+
+    def test_scheduled_animation_is_retargeted(self):
+        doc = DocumentStub()
+        point_controller = PointControllerStub()
+        animator = MappingAnimator(point_controller, doc=doc)
+        animator.get_animation_sequence(self.original_points, self.mapped_points, max_time=1)
+        self.assertTrue(animator.is_animating())
+        # Halfway through the animation
+        animator._start_time -= 0.5
+        doc.callbacks[0]()
+        halfway = point_controller.coordinates[-1]
+        self.assertTrue(0 < halfway[0][0] < 2 and -1 < halfway[1][1] < 1)
+        new_points = pd.DataFrame([[0, 2], [3, 1]], columns=['x', 'y'])
+        animator.get_animation_sequence(self.mapped_points, new_points, max_time=1)
+        self.assertEqual(len(doc.callbacks), 1, 'Previous animation was not cancelled')
+        # Starts from the current position, not the given one
+        np.testing.assert_allclose(animator._frames[0], np.array(halfway)
+                                   + (new_points.values.T - halfway)
+                                   / len(animator._frames))
+        animator._start_time -= 1
+        doc.callbacks[0]()
+        self.assertEqual(point_controller.coordinates[-1], ([0, 3], [2, 1]))
+        self.assertFalse(animator.is_animating())
+        self.assertEqual(doc.callbacks, [])
+
+    def test_final_position_is_pushed_once(self):
+        values_df = pd.DataFrame([[1., 0], [0, 1]], columns=['a', 'b'])
+        vector_controller = VectorControllerStub(
+            pd.DataFrame([[1., 0], [0, 1]], index=['a', 'b'], columns=['x', 'y']))
+        for animator in [None, AnimatorStub()]:
+            point_controller = PointControllerStub()
+            mapper_controller = MapperController(None, point_controller, vector_controller,
+                                                 NormalizationControllerStub(values_df),
+                                                 animator=animator)
+            mapper_controller.execute_mapping()
+            mapper_controller.execute_mapping()
+            if animator is None:
+                self.assertEqual(len(point_controller.coordinates), 2)
+            else:
+                # Only the first mapping is pushed, the animator pushes the rest
+                self.assertEqual(len(point_controller.coordinates), 1)
+                self.assertEqual(len(animator.animations), 1)
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+import pandas as pd
+from concurrent.futures import Future, wait
+from .....src.frontend.view.controllers.cluster_controller import ClusterController
+
+class NormalizationControllerStub(object):
+    def __init__(self, values_df):
+        self.values_df = values_df
+
+    def get_last_normalized_values(self):
+        return self.values_df
+
+class ClusterControllerTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.normalization_controller = NormalizationControllerStub(
+            pd.DataFrame(np.random.rand(200, 3)))
+        self.controller = ClusterController(self.normalization_controller)
+
+    def test_precomputed_clusterings_are_reused(self):
+        self.controller.precompute_clusterings(n_clusters_range=(3, 5))
+        wait(list(self.controller._future_dic.values()))
+        algorithm_id = self.controller.get_active_algorithm_id()
+        precomputed = ClusterController.CACHE.get(self.controller._get_cache_key(algorithm_id, 4))
+        self.assertIsNotNone(precomputed, 'Clustering was not precomputed')
+        self.controller.update_number_of_clusters(4)
+        self.controller.execute_clustering()
+        self.assertIs(ClusterController.CACHE.get(self.controller._get_cache_key(algorithm_id, 4)),
+                      precomputed)
+
+    def test_clusterings_follow_values(self):
+        original_values_df = self.normalization_controller.values_df
+        self.controller.execute_clustering()
+        original_categories = self.controller.get_categories()
+        self.assertEqual(len(original_categories), 200)
+        self.normalization_controller.values_df = pd.DataFrame(np.random.rand(50, 3))
+        self.controller.execute_clustering()
+        self.assertEqual(len(self.controller.get_categories()), 50)
+        # Equal values reuse the clustering
+        self.normalization_controller.values_df = original_values_df.copy()
+        self.controller.execute_clustering()
+        np.testing.assert_array_equal(self.controller.get_categories(), original_categories)
+
+    def test_categories_are_computed_on_miss(self):
+        self.controller.execute_clustering()
+        # New values, e.g. after changing the normalization
+        self.normalization_controller.values_df = pd.DataFrame(np.random.rand(50, 3))
+        self.assertEqual(len(self.controller.get_categories()), 50)
+        ClusterController.CACHE.clear()
+        self.assertEqual(len(self.controller.get_categories()), 50)
+
+    def test_queued_clustering_is_computed_inline(self):
+        self.controller.execute_clustering()
+        queued_future = Future()
+        pair_key = (self.controller.get_active_algorithm_id(), 4)
+        self.controller._future_dic[pair_key] = queued_future
+        self.controller.update_number_of_clusters(4)
+        self.assertEqual(len(self.controller.execute_clustering()), 200)
+        self.assertTrue(queued_future.cancelled(), 'Queued clustering was not cancelled')
+        self.assertNotIn(pair_key, self.controller._future_dic)
@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.color_controller import ColorController
+
+class InputDataControllerStub(object):
+    def __init__(self, values=(0., 1, 2, 3)):
+        self.values = list(values)
+
+    def get_dimensional_values(self, filtered=True):
+        return pd.DataFrame({'a': self.values})
+
+    def get_dimensional_labels(self):
+        return ['a']
+
+    def get_statistics(self):
+        return None
+
+    def get_number_of_values(self):
+        return 4
+
+class PointControllerStub(object):
+    def __init__(self):
+        self.colors = None
+
+    def get_source(self):
+        return None
+
+    def get_number_of_points(self):
+        return 4
+
+    def update_categories(self, categories):
+        pass
+
+    def update_colors(self, colors):
+        self.colors = list(colors)
+
+class ColorControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.point_controller = PointControllerStub()
+        self.color_controller = ColorController(InputDataControllerStub(), None, None,
+                                                self.point_controller)
+
+    def test_categories_are_distributed_over_the_palette(self):
+        palette_indexes = ColorController._get_palette_index_list(['b', 'a', 'b', 'c'],
+                                                                  ColorController.CATEGORY_PALETTE)
+        self.assertEqual(list(palette_indexes), [0, 3, 0, 6])
+
+    def test_axis_values_are_binned(self):
+        self.color_controller.update_method(ColorController.AXIS_METHOD_ID)
+        self.color_controller.update_selected_axis('a')
+        self.color_controller.update_colors()
+        self.assertEqual(self.point_controller.colors, [0, 85, 170, 255])
+
+    def test_missing_axis_values_get_the_nan_color(self):
+        color_controller = ColorController(InputDataControllerStub([0., np.nan, 2, 3]),
+                                           None, None, self.point_controller)
+        color_controller.update_method(ColorController.AXIS_METHOD_ID)
+        color_controller.update_selected_axis('a')
+        color_controller.update_colors()
+        self.assertEqual(self.point_controller.colors[0], 0)
+        self.assertTrue(np.isnan(self.point_controller.colors[1]))
+        self.assertEqual(self.point_controller.colors[3], 255)
+
+    def test_palette_switch_only_changes_the_mapper(self):
+        self.color_controller.update_method(ColorController.AXIS_METHOD_ID)
+        self.color_controller.update_selected_axis('a')
+        self.color_controller.update_colors()
+        self.point_controller.colors = None
+        self.color_controller.update_palette(ColorController.GREY_PALETTE_ID)
+        self.assertIsNone(self.point_controller.colors)
+        self.assertEqual(self.color_controller.get_color_mapper().palette,
+                         ColorController.GREY_PALETTE)
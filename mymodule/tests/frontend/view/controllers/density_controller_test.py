@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+from bokeh.models import DataRange1d, GlyphRenderer
+from .....src.frontend.view.controllers.point_controller import PointController
+from .....src.frontend.view.controllers.density_controller import DensityController
+
+class InputDataControllerStub(object):
+    def get_element_names(self):
+        return [str(i) for i in range(100)]
+
+class ClassificationControllerStub(object):
+    def get_categories(self):
+        return ['1'] * 100
+
+class FigureStub(object):
+    def __init__(self):
+        self.x_range = DataRange1d()
+        self.y_range = DataRange1d()
+        self.tools = []
+
+    def image_rgba(self, **kwargs):
+        pass
+
+    def circle(self, *args, **kwargs):
+        return GlyphRenderer()
+
+    def add_tools(self, *tools):
+        self.tools.extend(tools)
+
+class DocumentStub(object):
+    def __init__(self):
+        self.session_context = object()
+        self.callbacks = []
+
+    def add_next_tick_callback(self, callback):
+        self.callbacks.append(callback)
+
+class DensityControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.point_controller = PointController(InputDataControllerStub(),
+                                                ClassificationControllerStub())
+        self.activities = []
+        self.density_controller = DensityController(self.point_controller, 40, 40,
+                                                    point_threshold=10,
+                                                    activity_callback=self.activities.append)
+        self.figure = FigureStub()
+        self.density_controller.set_figure(self.figure)
+        values = np.arange(100, dtype=float)
+        self.point_controller.update_coordinates(values, values)
+
+    def test_many_points_are_aggregated(self):
+        self.assertTrue(self.density_controller.is_aggregated())
+        self.assertEqual(len(self.point_controller.get_source().data['x']), 0)
+        image = self.density_controller.get_image_source().data['image'][0]
+        self.assertEqual(image.shape, (10, 10))
+        # Only the diagonal has points
+        self.assertEqual(np.count_nonzero(image), 10)
+
+    def test_zoomed_points_are_drawn(self):
+        self.figure.x_range.start, self.figure.x_range.end = 20, 25
+        self.assertFalse(self.density_controller.is_aggregated())
+        self.assertIn('range_change', self.activities, 'Zoom was not recorded as activity')
+        source_data = self.point_controller.get_source().data
+        self.assertEqual(list(source_data['name']), ['20', '21', '22', '23', '24', '25'])
+        self.assertEqual(list(source_data['x']), [20, 21, 22, 23, 24, 25])
+
+    def test_selected_point_is_drawn(self):
+        self.density_controller.select_point('42')
+        self.assertTrue(self.density_controller.is_aggregated())
+        self.assertEqual(list(self.point_controller.get_source().data['name']), ['42'])
+        self.assertEqual(self.point_controller.get_number_of_points(), 100)
+
+    def test_few_points_are_not_aggregated(self):
+        point_controller = PointController(InputDataControllerStub(),
+                                           ClassificationControllerStub())
+        density_controller = DensityController(point_controller, 40, 40)
+        point_controller.update_coordinates(np.zeros(100), np.zeros(100))
+        self.assertFalse(density_controller.is_aggregated())
+        self.assertEqual(len(point_controller.get_source().data['x']), 100)
+
+    def test_nearest_point_to_cursor_is_drawn(self):
+        self.density_controller._cursor_source.data = dict(x=[42.3], y=[41.8])
+        self.assertTrue(self.density_controller.is_aggregated())
+        self.assertEqual(list(self.point_controller.get_source().data['name']), ['42'])
+        self.assertIn('hover', self.activities)
+        # Too far from any point
+        self.density_controller._cursor_source.data = dict(x=[500.], y=[500.])
+        self.assertEqual(len(self.point_controller.get_source().data['name']), 0)
+
+    def test_hover_does_not_redraw_the_image(self):
+        image_data = self.density_controller.get_image_source().data
+        self.density_controller._cursor_source.data = dict(x=[42.3], y=[41.8])
+        self.density_controller._cursor_source.data = dict(x=[10.2], y=[9.9])
+        self.assertIs(self.density_controller.get_image_source().data, image_data)
+        self.assertEqual(list(self.point_controller.get_source().data['name']), ['10'])
+        # New coordinates draw the image again
+        values = np.arange(100, dtype=float)[::-1]
+        self.point_controller.update_coordinates(values, values)
+        self.assertIsNot(self.density_controller.get_image_source().data, image_data)
+
+    def test_range_changes_select_rows_once_per_tick(self):
+        doc = DocumentStub()
+        self.density_controller._doc = doc
+        self.figure.x_range.start, self.figure.x_range.end = 20, 25
+        self.figure.y_range.start, self.figure.y_range.end = 20, 25
+        self.assertEqual(len(doc.callbacks), 1, 'Row selection was not debounced')
+        self.assertTrue(self.density_controller.is_aggregated())
+        doc.callbacks.pop()()
+        self.assertFalse(self.density_controller.is_aggregated())
+        self.assertEqual(len(self.point_controller.get_source().data['x']), 6)
@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers import error_controller
+from .....src.frontend.view.controllers.error_controller import ErrorController
+from .....src.backend.algorithms.error.square_sum_error import SQUARE_SUM_ID
+from .....src.backend.algorithms.normalization.feature_scaling_normalization import \
+    feature_scaling
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates
+
+class NormalizationControllerStub(object):
+    def __init__(self, values_df):
+        self.values_df = values_df
+
+    def get_last_normalized_values(self):
+        return self.values_df
+
+    def normalize_feature_scaling(self, df, df_level=False):
+        return feature_scaling(df, df_level=df_level)
+
+class VectorControllerStub(object):
+    def __init__(self, vectors_df):
+        self.vectors_df = vectors_df
+
+    def get_vectors(self):
+        return self.vectors_df
+
+class MapperControllerStub(object):
+    def __init__(self, normalization_controller, vector_controller):
+        self._normalization_controller = normalization_controller
+        self._vector_controller = vector_controller
+        self.mapped_points_df = None
+
+    def map(self):
+        self.mapped_points_df = star_coordinates(self._normalization_controller.values_df,
+                                                 self._vector_controller.vectors_df)
+
+    def get_mapped_points(self):
+        return self.mapped_points_df
+
+class PointControllerStub(object):
+    def update_errors(self, errors):
+        pass
+
+class ErrorUtilsStub(object):
+    def __init__(self, error_utils):
+        self._error_utils = error_utils
+        self.calls = 0
+
+    def get_general_error_df(self, *args):
+        self.calls += 1
+        return self._error_utils.get_general_error_df(*args)
+
+class ErrorControllerTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        axes = ['a', 'b', 'c']
+        self.normalization_controller = NormalizationControllerStub(
+            pd.DataFrame(np.random.rand(20, 3), columns=axes))
+        self.vector_controller = VectorControllerStub(
+            pd.DataFrame(np.random.rand(3, 2), index=axes, columns=['x', 'y']))
+        self.mapper_controller = MapperControllerStub(self.normalization_controller,
+                                                      self.vector_controller)
+        self.mapper_controller.map()
+        self.error_controller = ErrorController(self.normalization_controller,
+                                                self.vector_controller,
+                                                self.mapper_controller,
+                                                PointControllerStub(), [])
+        self.error_utils = error_controller.ErrorUtils
+        error_controller.ErrorUtils = ErrorUtilsStub(self.error_utils)
+        self.error_controller.calculate_error()
+
+    def tearDown(self):
+        error_controller.ErrorUtils = self.error_utils
+
+    def test_contributions_are_reused_for_new_algorithm(self):
+        self.error_controller.update_algorithm(SQUARE_SUM_ID)
+        self.error_controller.calculate_error()
+        self.assertEqual(error_controller.ErrorUtils.calls, 1)
+
+    def test_contributions_follow_vectors(self):
+        vectors_df = self.vector_controller.vectors_df.copy()
+        vectors_df.loc['a'] += 0.5
+        self.vector_controller.vectors_df = vectors_df
+        self.mapper_controller.map()
+        self.error_controller.calculate_error()
+        self.assertEqual(error_controller.ErrorUtils.calls, 2)
+        expected_df = self.error_utils.get_general_error_df(
+            self.normalization_controller.values_df, vectors_df,
+            self.mapper_controller.mapped_points_df)
+        self.assertTrue(self.error_controller._last_general_error_df.equals(expected_df))
@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.input_data_controller import InputDataController
+
+class InputDataControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.raw_input_df = pd.DataFrame(dict(a=[np.nan, 1.5, 2.],
+                                              b=[1, 2, 3],
+                                              kind=['x', np.nan, 'x']),
+                                         index=['p1', 'p2', 'p3'],
+                                         columns=['a', 'b', 'kind'])
+
+    def test_split_by_column_dtype(self):
+        controller = InputDataController(self.raw_input_df)
+        self.assertEqual(controller.get_dimensional_labels(), ['a', 'b'],
+                         'Missing first value should not make a column nominal')
+        self.assertEqual(controller.get_nominal_labels(), ['kind'])
+
+    def test_downcast(self):
+        dimensional_values_df, nominal_values_df = InputDataController\
+            ._split_dimensional_nominal_values(self.raw_input_df, downcast=True)
+        self.assertTrue((dimensional_values_df.dtypes == np.float32).all())
+        self.assertEqual(nominal_values_df['kind'].dtype.name, 'category')
+
+    def test_category_labels_match_strings(self):
+        controller = InputDataController(self.raw_input_df)
+        for label in ['a', 'b', 'kind']:
+            self.assertEqual(controller.get_category_labels(label).tolist(),
+                             self.raw_input_df[label].astype(str).tolist())
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.mapper_controller import MapperController
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates
+
+class NormalizationControllerStub(object):
+    def __init__(self, values_df):
+        self.values_df = values_df
+
+    def get_last_normalized_values(self):
+        return self.values_df
+
+class VectorControllerStub(object):
+    def __init__(self, vectors_df):
+        self.vectors_df = vectors_df
+
+    def get_vectors(self):
+        return self.vectors_df
+
+class PointControllerStub(object):
+    def update_coordinates(self, x, y):
+        pass
+
+class MapperControllerTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        axes = ['a', 'b', 'c']
+        self.normalization_controller = NormalizationControllerStub(
+            pd.DataFrame(np.random.rand(20, 3), columns=axes))
+        self.vector_controller = VectorControllerStub(
+            pd.DataFrame(np.random.rand(3, 2), index=axes, columns=['x', 'y']))
+        self.mapper_controller = MapperController(None, PointControllerStub(),
+                                                  self.vector_controller,
+                                                  self.normalization_controller)
+        self.full_mappings = 0
+        execute_active_algorithm = self.mapper_controller.execute_active_algorithm
+        def count_full_mapping(*args, **kwargs):
+            self.full_mappings += 1
+            return execute_active_algorithm(*args, **kwargs)
+        self.mapper_controller.execute_active_algorithm = count_full_mapping
+        self.mapper_controller.execute_mapping()
+
+    def move_axis(self, axis):
+        vectors_df = self.vector_controller.vectors_df.copy()
+        vectors_df.loc[axis] += 0.25
+        self.vector_controller.vectors_df = vectors_df
+
+    def assert_full_mapping(self, full_mapping):
+        full_mappings = self.full_mappings
+        mapped_points_df = self.mapper_controller.execute_mapping()
+        self.assertEqual(self.full_mappings, full_mappings + full_mapping)
+        expected_df = star_coordinates(self.normalization_controller.values_df,
+                                       self.vector_controller.vectors_df)
+        np.testing.assert_allclose(mapped_points_df.values, expected_df.values)
+
+    def test_single_axis_change_is_incremental(self):
+        self.move_axis('b')
+        self.assert_full_mapping(0)
+
+    def test_new_values_are_fully_mapped(self):
+        self.normalization_controller.values_df = self.normalization_controller.values_df.copy()
+        self.move_axis('b')
+        self.assert_full_mapping(1)
+
+    def test_new_axes_are_fully_mapped(self):
+        self.normalization_controller.values_df = self.normalization_controller.values_df[['a', 'b']]
+        self.vector_controller.vectors_df = self.vector_controller.vectors_df.loc[['a', 'b']]
+        self.assert_full_mapping(1)
+
+    def test_all_axes_changes_are_fully_mapped(self):
+        for axis in ['a', 'b', 'c']:
+            self.move_axis(axis)
+        self.assert_full_mapping(1)
+
+    def test_resync_is_fully_mapped(self):
+        for _ in range(MapperController.RESYNC_PERIOD):
+            self.move_axis('a')
+            self.assert_full_mapping(0)
+        self.move_axis('a')
+        self.assert_full_mapping(1)
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.input_data_controller import InputDataController
+from .....src.frontend.view.controllers.normalization_controller import NormalizationController
+from .....src.backend.algorithms.normalization.normalization_register import NormalizationRegister
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates
+
+class NormalizationControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.raw_input_df = pd.DataFrame(dict(a=[np.nan, 1., 2., 4.],
+                                              b=[1., 2., 3., 4.]),
+                                         index=['p1', 'p2', 'p3', 'p4'],
+                                         columns=['a', 'b'])
+
+    def test_missing_first_value_is_mapped(self):
+        input_data_controller = InputDataController(self.raw_input_df)
+        normalization_controller = NormalizationController(input_data_controller)
+        vectors_df = pd.DataFrame([[1., 0.], [0., 1.]], index=['a', 'b'], columns=['x', 'y'])
+        for algorithm_id in NormalizationRegister.get_algorithm_dict():
+            normalization_controller.update_algorithm(algorithm_id)
+            normalized_df = normalization_controller.execute_normalization()
+            mapped_points_df = star_coordinates(normalized_df, vectors_df)
+            self.assertTrue(np.isfinite(mapped_points_df.values).all(),
+                            '{} left points without position'.format(algorithm_id))
+            # The other values are normalized as if the missing one was not there
+            expected_df = normalization_controller.execute_active_algorithm(
+                self.raw_input_df[['a']].iloc[1:], df_level=False)
+            np.testing.assert_allclose(normalized_df['a'].values[1:], expected_df['a'].values)
+
+    def test_submitted_normalization_is_reused(self):
+        input_data_controller = InputDataController(self.raw_input_df)
+        normalization_controller = NormalizationController(input_data_controller)
+        NormalizationController.CACHE.clear()
+        normalization_controller.submit_normalization('session').result(timeout=60)
+        execute_active_algorithm = normalization_controller.execute_active_algorithm
+        normalization_controller.execute_active_algorithm = None
+        try:
+            normalized_df = normalization_controller.execute_normalization()
+        finally:
+            normalization_controller.execute_active_algorithm = execute_active_algorithm
+        self.assertTrue(np.isfinite(normalized_df.values).all())
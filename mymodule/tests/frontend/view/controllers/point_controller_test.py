@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+from bokeh.document import Document
+from .....src.frontend.view.controllers.point_controller import PointController
+
+class InputDataControllerStub(object):
+    def get_element_names(self):
+        return ['a', 'b', 'a', 'c']
+
+class ClassificationControllerStub(object):
+    def get_categories(self):
+        return ['1', '1', '2', '2']
+
+class SessionContextStub(object):
+    id = 'session'
+
+class PointControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.doc = Document()
+        self.point_controller = PointController(InputDataControllerStub(),
+                                                ClassificationControllerStub(),
+                                                doc=self.doc)
+        self.doc.add_root(self.point_controller.get_source())
+        self.events = []
+        # Only the changes of the models are sent to the browser
+        self.doc.on_change(lambda event: hasattr(event, 'model') and self.events.append(event))
+
+    def test_unique_names(self):
+        self.assertEqual(self.point_controller.get_point_names(), ['a', 'b', 'a_2', 'c'])
+
+    def test_updates_outside_server_are_sent_at_once(self):
+        self.point_controller.update_coordinates([0.1234567891, 1, 2, 3], [4, 5, 6, 7])
+        data = self.point_controller.get_source().data
+        self.assertEqual(list(data['x']), [0.123457, 1, 2, 3])
+        self.assertEqual(len(self.events), 1)
+
+    def test_updates_in_server_are_batched(self):
+        self.doc._session_context = SessionContextStub()
+        self.point_controller.update_coordinates([0., 1, 2, 3], [4., 5, 6, 7])
+        self.point_controller.update_errors([1., 1, 1, 1])
+        self.assertEqual(list(self.point_controller.get_source().data['x']), [])
+        self.point_controller.flush()
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(list(self.point_controller.get_source().data['error']), [1, 1, 1, 1])
+
+    def test_few_changes_are_patched(self):
+        self.point_controller.update_errors(np.ones(20))
+        self.point_controller.update_errors(np.r_[2., np.ones(19)])
+        self.assertEqual(self.events[-1].hint.patches, {'error': [(0, 2.)]})
+
+    def test_missing_values_are_patched(self):
+        self.point_controller.update_colors(np.arange(20, dtype=np.float32))
+        self.point_controller.update_colors(np.r_[np.nan, np.arange(1, 20, dtype=np.float32)])
+        self.assertEqual(self.events[-1].hint.patches, {'color': [(0, 'NaN')]})
+
+    def test_points_are_found_by_position(self):
+        self.point_controller.update_coordinates([0., 1, 2, 3], [0., 1, 2, 3])
+        self.assertEqual(self.point_controller.get_nearest_point(1.8, 2.1), 'a_2')
+        self.assertIsNone(self.point_controller.get_nearest_point(10, 10, max_distance=1))
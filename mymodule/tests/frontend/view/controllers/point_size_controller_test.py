@@ -0,0 +1,27 @@
+import unittest
+import pandas as pd
+from .....src.frontend.view.controllers.point_size_controller import PointSizeController
+
+class ErrorControllerStub(object):
+    def get_last_point_error(self, normalized=False):
+        return pd.Series([2., 5, 3])
+
+class PointControllerStub(object):
+    def get_source(self):
+        return None
+
+class PointSizeControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.point_size_controller = PointSizeController(ErrorControllerStub(),
+                                                         PointControllerStub())
+        self.size_transform = self.point_size_controller.get_size_transform()
+
+    def test_sizes_are_scaled_between_error_bounds(self):
+        self.point_size_controller.update_sizes()
+        self.assertEqual((self.size_transform.low, self.size_transform.high), (2, 5))
+
+    def test_sizes_are_changed_in_transform(self):
+        self.point_size_controller.set_initial_size(0)
+        self.point_size_controller.set_final_size(20)
+        self.assertEqual(self.size_transform.initial_size, PointSizeController.MIN_SIZE)
+        self.assertEqual(self.size_transform.final_size, 20)
@@ -0,0 +1,119 @@
+import itertools
+import json
+import re
+import unittest
+from tornado.testing import AsyncHTTPTestCase
+from tornado.web import Application as TornadoApplication
+from ...src.server import application
+from ...src.server.session_manager import SessionManager
+
+class ModelStub(object):
+    def __init__(self, idle_time):
+        self.idle_time = idle_time
+
+    def get_number_of_values(self):
+        return 10
+
+    def get_memory_usage(self):
+        return 1024
+
+    def get_idle_time(self):
+        return self.idle_time
+
+    def get_last_action(self):
+        return None
+
+    def close(self):
+        pass
+
+class SessionContextStub(object):
+    def __init__(self, session_id):
+        self.id = session_id
+
+class DocumentStub(object):
+    def __init__(self, session_id):
+        self.session_context = SessionContextStub(session_id)
+        self.roots = []
+
+    def add_root(self, root):
+        self.roots.append(root)
+
+class GeneralModelStub(object):
+    """Counts the models built"""
+    built = 0
+
+    @staticmethod
+    def star_coordinates_init(alias, file, doc=None):
+        GeneralModelStub.built += 1
+        return ModelStub(0.)
+
+class ApplicationTest(unittest.TestCase):
+    def setUp(self):
+        self.module_dic = dict((name, getattr(application, name))
+                               for name in ['BOKEH_WORKERS', 'bokeh_port_cycle', 'get_files',
+                                            'get_file_infos', 'get_file_rows',
+                                            'GeneralModel'])
+
+    def tearDown(self):
+        for name, value in self.module_dic.items():
+            setattr(application, name, value)
+
+    def test_bokeh_ports(self):
+        port = int(application.BOKEH_PORT)
+        self.assertEqual(application.get_bokeh_ports(workers=0), [port])
+        self.assertEqual(application.get_bokeh_ports(workers=3), [port, port + 1, port + 2])
+
+    def test_pages_are_assigned_round_robin(self):
+        application.BOKEH_WORKERS = 2
+        application.bokeh_port_cycle = itertools.cycle(application.get_bokeh_ports(workers=2))
+        application.get_files = lambda: ['sample.csv']
+        application.get_file_infos = lambda: []
+        client = application.app.test_client()
+        pattern = re.compile(r'{}:(\d+){}'.format(re.escape(application.bokeh_access_address),
+                                                   application.BOKEH_APP_PATH))
+        ports = [int(pattern.search(client.get('/').get_data(as_text=True)).group(1))
+                 for _ in range(3)]
+        port = int(application.BOKEH_PORT)
+        self.assertEqual(ports, [port, port + 1, port])
+
+    def test_busy_server_rejects_session_before_loading(self):
+        max_heavy_sessions = SessionManager.MAX_HEAVY_SESSIONS
+        SessionManager.MAX_HEAVY_SESSIONS = 0
+        application.get_files = lambda: ['sample.csv']
+        application.get_file_rows = lambda filename: SessionManager.HEAVY_ROW_THRESHOLD
+        application.GeneralModel = GeneralModelStub
+        GeneralModelStub.built = 0
+        doc = DocumentStub('rejected')
+        try:
+            application.modify_doc(doc)
+        finally:
+            SessionManager.MAX_HEAVY_SESSIONS = max_heavy_sessions
+        self.assertEqual(GeneralModelStub.built, 0)
+        self.assertEqual(len(doc.roots), 1)
+        self.assertIsNone(SessionManager.get_model('rejected'))
+
+class WorkerSessionTableHandlerTest(AsyncHTTPTestCase):
+    def get_app(self):
+        worker_url = 'http://127.0.0.1:{}/worker'
+        return TornadoApplication([
+            ('/worker', application.SessionTableHandler),
+            ('/sessions', application.WorkerSessionTableHandler,
+             dict(urls=[worker_url.format(self.get_http_port()),
+                        # Worker that does not answer
+                        'http://127.0.0.1:1/sessions']))
+            ])
+
+    def setUp(self):
+        super(WorkerSessionTableHandlerTest, self).setUp()
+        SessionManager.register('session', ModelStub(5.))
+
+    def tearDown(self):
+        SessionManager.unregister('session')
+        super(WorkerSessionTableHandlerTest, self).tearDown()
+
+    def test_tables_are_gathered(self):
+        response = self.fetch('/sessions')
+        self.assertEqual(response.code, 200)
+        records = json.loads(response.body)
+        self.assertEqual([record[SessionManager.SESSION_ID] for record in records], ['session'])
+        self.assertEqual(records[0]['port'], self.get_http_port())
@@ -0,0 +1,91 @@
+import unittest
+from ...src.server.session_manager import SessionManager
+
+class FakeDocument(object):
+    def __init__(self):
+        self.callbacks = []
+
+    def add_next_tick_callback(self, callback):
+        self.callbacks.append(callback)
+
+class FakeModel(object):
+    def __init__(self, rows, idle_time=0):
+        self.rows = rows
+        self.idle_time = idle_time
+        self.closed = False
+        self.document = FakeDocument()
+
+    def get_number_of_values(self):
+        return self.rows
+
+    def get_memory_usage(self):
+        return self.rows * 8
+
+    def get_idle_time(self):
+        return self.idle_time
+
+    def get_last_action(self):
+        return None
+
+    def get_document(self):
+        return self.document
+
+    def close(self):
+        self.closed = True
+
+class SessionManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.max_heavy_sessions = SessionManager.MAX_HEAVY_SESSIONS
+        SessionManager.MAX_HEAVY_SESSIONS = 1
+
+    def tearDown(self):
+        for session_id in list(SessionManager._SESSION_MODEL_DIC):
+            SessionManager.unregister(session_id)
+        SessionManager.MAX_HEAVY_SESSIONS = self.max_heavy_sessions
+
+    def test_unregister_closes_model(self):
+        model = FakeModel(10)
+        SessionManager.register('a', model)
+        SessionManager.unregister('a')
+        self.assertTrue(model.closed)
+        self.assertIsNone(SessionManager.get_model('a'))
+
+    def test_busy_heavy_session_rejects_new_one(self):
+        heavy_rows = SessionManager.HEAVY_ROW_THRESHOLD
+        busy_model, new_model = FakeModel(heavy_rows), FakeModel(heavy_rows)
+        self.assertTrue(SessionManager.register('busy', busy_model))
+        self.assertFalse(SessionManager.register('new', new_model))
+        self.assertTrue(new_model.closed)
+        self.assertFalse(busy_model.closed)
+        self.assertEqual(len(new_model.document.callbacks), 1)
+
+    def test_idle_heavy_session_is_evicted_for_new_one(self):
+        heavy_rows = SessionManager.HEAVY_ROW_THRESHOLD
+        idle_model = FakeModel(heavy_rows, idle_time=SessionManager.HEAVY_IDLE_TIMEOUT)
+        new_model = FakeModel(heavy_rows)
+        SessionManager.register('idle', idle_model)
+        self.assertTrue(SessionManager.register('new', new_model))
+        self.assertTrue(idle_model.closed)
+        self.assertEqual(SessionManager.get_session_table()['session_id'].tolist(), ['new'])
+
+    def test_check_sessions_evicts_idle_sessions(self):
+        idle_model = FakeModel(10, idle_time=SessionManager.IDLE_TIMEOUT + 1)
+        SessionManager.register('idle', idle_model)
+        SessionManager.register('active', FakeModel(10))
+        SessionManager.check_sessions()
+        self.assertTrue(idle_model.closed)
+        self.assertIsNotNone(SessionManager.get_model('active'))
+
+    def test_reserved_sessions_count_as_heavy(self):
+        heavy_rows = SessionManager.HEAVY_ROW_THRESHOLD
+        self.assertTrue(SessionManager.reserve('first', heavy_rows))
+        self.assertFalse(SessionManager.reserve('second', heavy_rows))
+        self.assertTrue(SessionManager.reserve('light', heavy_rows - 1))
+        self.assertTrue(SessionManager.register('first', FakeModel(heavy_rows)))
+        self.assertFalse(SessionManager.reserve('second', heavy_rows))
+
+    def test_unregister_frees_reservation(self):
+        heavy_rows = SessionManager.HEAVY_ROW_THRESHOLD
+        SessionManager.reserve('failed', heavy_rows)
+        SessionManager.unregister('failed')
+        self.assertTrue(SessionManager.reserve('new', heavy_rows))
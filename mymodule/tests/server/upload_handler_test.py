@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import time
+from tornado.testing import AsyncHTTPTestCase
+from tornado.web import Application
+from ...src.server.upload_handler import UploadHandler
+from ...src.frontend.view.controllers.file_controller import FileController
+
+class UploadHandlerTest(AsyncHTTPTestCase):
+    BOUNDARY = 'xYzBoundary'
+
+    def setUp(self):
+        self.upload_folder = tempfile.mkdtemp()
+        super(UploadHandlerTest, self).setUp()
+
+    def tearDown(self):
+        super(UploadHandlerTest, self).tearDown()
+        shutil.rmtree(self.upload_folder)
+
+    def get_app(self):
+        return Application([('/uploader', UploadHandler,
+                             dict(upload_folder=self.upload_folder))])
+
+    def _get_body(self, filename, content):
+        return ('--{0}\r\nContent-Disposition: form-data; name="file"; filename="{1}"\r\n'
+                'Content-Type: text/csv\r\n\r\n{2}\r\n--{0}--\r\n')\
+               .format(UploadHandlerTest.BOUNDARY, filename, content)
+
+    def _upload(self, filename, content):
+        return self.fetch('/uploader', method='POST', follow_redirects=False,
+                          body=self._get_body(filename, content),
+                          headers={'Content-Type': 'multipart/form-data; boundary={}'
+                                                   .format(UploadHandlerTest.BOUNDARY)})
+
+    def test_upload_is_listed_once_converted(self):
+        content = 'name;a;b\r\nx;1;2\r\ny;3;4\r\n'
+        response = self._upload('values.csv', content)
+        self.assertEqual(response.code, 302)
+        file_path = os.path.join(self.upload_folder, 'values.csv')
+        for _ in range(100):
+            if not os.path.exists(FileController.get_pending_marker(file_path)):
+                break
+            time.sleep(.05)
+        self.assertEqual(FileController.list_files(self.upload_folder), ['values.csv'])
+        with open(file_path, 'rb') as uploaded_file:
+            self.assertEqual(uploaded_file.read(), content)
+        self.assertEqual(UploadHandler.get_progress()['values.csv']['status'],
+                         UploadHandler.READY)
+
+    def test_invalid_extension_is_rejected(self):
+        self.assertEqual(self._upload('values.txt', 'a').code, 400)
+        self.assertEqual(os.listdir(self.upload_folder), [])
+
+    def test_invalid_headers_are_rejected(self):
+        self.assertEqual(self._upload('values\xff.csv', 'a').code, 400)
+        self.assertEqual(os.listdir(self.upload_folder), [])
+
+    def test_truncated_upload_is_removed(self):
+        body = self._get_body('values.csv', 'name;a\r\nx;1\r\n')
+        response = self.fetch('/uploader', method='POST', follow_redirects=False,
+                              body=body[:-len(UploadHandlerTest.BOUNDARY) - 10],
+                              headers={'Content-Type': 'multipart/form-data; boundary={}'
+                                                       .format(UploadHandlerTest.BOUNDARY)})
+        self.assertEqual(response.code, 400)
+        self.assertEqual(os.listdir(self.upload_folder), [])
+
+    def test_too_big_upload_is_rejected(self):
+        max_size = UploadHandler.MAX_SIZE
+        UploadHandler.MAX_SIZE = 10
+        try:
+            self.assertEqual(self._upload('values.csv', 'name;a\r\nx;1\r\n').code, 413)
+        finally:
+            UploadHandler.MAX_SIZE = max_size